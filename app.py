@@ -1,6 +1,8 @@
 import os
 import logging
 import atexit
+import threading
+import multiprocessing
 from datetime import datetime
 from flask import Flask, session, request, redirect, url_for
 from models import db, User, Role, SubscriptionPlan
@@ -53,7 +55,25 @@ def utility_processor():
 register_blueprints(app)
 
 with app.app_context():
-    db.create_all()
+    # New columns must exist before start_services queries them (upgraded databases)
+    from init_db import migrate_schema
+    migrate_schema()
+
+# Delay before retrying a scheduler start that failed (schema not migrated, database down)
+START_RETRY_SECONDS = int(os.environ.get('SCHEDULER_START_RETRY_SECONDS', 60))
+
+def start_scheduler():
+    """Start the scheduler for automatic article collection and summary generation, retrying until it starts."""
+    from services.scheduler_service import SchedulerService
+    
+    try:
+        SchedulerService.init(fetch_hour=2, summary_hour=8)
+        logger.info("Scheduler service started")
+    except Exception as e:
+        logger.error(f"Scheduler NOT started, no stage will run: {e}. Retrying in {START_RETRY_SECONDS}s")
+        timer = threading.Timer(START_RETRY_SECONDS, start_scheduler)
+        timer.daemon = True
+        timer.start()
 
 def start_services():
     """Initialize background services (scheduler and Telegram bots)."""
@@ -61,9 +81,7 @@ def start_services():
         from services.scheduler_service import SchedulerService
         from services.telegram_service import TelegramService
         
-        # Start the scheduler for automatic article collection and summary generation
-        SchedulerService.init(fetch_hour=2, summary_hour=8)
-        logger.info("Scheduler service started")
+        start_scheduler()
         
         # Start Telegram bots for all active journalists
         TelegramService.start_all_bots()
@@ -76,8 +94,16 @@ def start_services():
     except Exception as e:
         logger.error(f"Error starting services: {e}")
 
+def in_worker_process():
+    """
+    True in parse pool workers: forkserver and spawn children re-import the main
+    script (app.py or main.py, as __mp_main__) and must not start a second
+    scheduler and set of bots.
+    """
+    return multiprocessing.current_process().name != 'MainProcess'
+
 # Start services when not in reloader child process
-if os.environ.get('WERKZEUG_RUN_MAIN') == 'true' or not app.debug:
+if not in_worker_process() and (os.environ.get('WERKZEUG_RUN_MAIN') == 'true' or not app.debug):
     start_services()
 
 if __name__ == '__main__':
@@ -0,0 +1,89 @@
+"""
+Parse throughput of ParsePool at increasing pool sizes.
+
+Builds synthetic RSS feeds and HTML pages of realistic size and parses them
+through ParsePool with 0 (inline), 1, 2, 4... processes, as the fetch engine
+does: many fetch threads submitting at once.
+
+Usage:
+    python benchmarks/parse_benchmark.py [--documents 400] [--max-workers 8]
+"""
+import os
+import sys
+import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.parse_pool import ParsePool  # noqa: E402
+
+PARAGRAPH = ("Le gouvernement a présenté mardi un projet de loi sur la transition énergétique, "
+             "qui prévoit une hausse des investissements dans le réseau ferroviaire et les énergies renouvelables. ")
+
+def make_rss(index, items=20):
+    entries = ''.join(
+        f"<item><title>Article {index}-{i}</title><link>https://example.com/{index}/{i}</link>"
+        f"<description><![CDATA[<p>{PARAGRAPH * 8}</p>]]></description>"
+        f"<pubDate>Tue, 14 Oct 2025 08:{i:02d}:00 GMT</pubDate></item>"
+        for i in range(items)
+    )
+    return (f'<?xml version="1.0"?><rss version="2.0"><channel><title>Feed {index}</title>'
+            f'{entries}</channel></rss>').encode('utf-8')
+
+def make_html(index, items=20):
+    blocks = ''.join(
+        f'<article class="post"><h2><a href="/{index}/{i}">Titre {index}-{i}</a></h2>'
+        f'<time datetime="2025-10-14T08:{i:02d}:00">14 octobre 2025</time>'
+        f'<p>{PARAGRAPH * 6}</p></article>'
+        for i in range(items)
+    )
+    nav = '<nav>' + ''.join(f'<a href="/section/{n}">Section {n}</a>' for n in range(200)) + '</nav>'
+    return f'<html><head><title>Site {index}</title></head><body>{nav}{blocks}</body></html>'.encode('utf-8')
+
+def run(documents, size, fetch_threads):
+    ParsePool.shutdown()
+    ParsePool.SIZE = size
+    if size:
+        # Start the workers before timing
+        list(ParsePool.get_executor().map(abs, range(size)))
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=fetch_threads) as executor:
+        counts = list(executor.map(lambda doc: len(ParsePool.parse(*doc)), documents))
+    elapsed = time.perf_counter() - started
+    ParsePool.shutdown()
+    return elapsed, sum(counts)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--documents', type=int, default=400)
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--fetch-threads', type=int, default=32)
+    args = parser.parse_args()
+
+    documents = []
+    for i in range(args.documents):
+        if i % 2:
+            documents.append(('rss', make_rss(i), f'https://example.com/feed/{i}'))
+        else:
+            documents.append(('website', make_html(i), f'https://example.com/site/{i}'))
+
+    sizes = [0]
+    size = 1
+    while size <= args.max_workers:
+        sizes.append(size)
+        size *= 2
+
+    print(f"{args.documents} documents, {os.cpu_count()} CPUs, {args.fetch_threads} fetch threads")
+    print(f"{'processes':>10} {'seconds':>9} {'docs/s':>9} {'speedup':>8}")
+    baseline = None
+    for size in sizes:
+        elapsed, articles = run(documents, size, args.fetch_threads)
+        rate = args.documents / elapsed
+        baseline = baseline or rate
+        label = 'inline' if size == 0 else str(size)
+        print(f"{label:>10} {elapsed:>9.2f} {rate:>9.1f} {rate / baseline:>7.2f}x")
+
+if __name__ == '__main__':
+    main()
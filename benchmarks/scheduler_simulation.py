@@ -0,0 +1,257 @@
+"""
+Simulated-clock run of the per-journalist scheduler across every timezone.
+
+Drives the real SchedulerService on a throwaway SQLite database: synthetic
+journalists over all TIMEZONES of models/journalist.py get their cron jobs from
+SchedulerService.schedule_journalist, and whole days are replayed minute by
+minute on a simulated clock (SchedulerService.clock). Due jobs fire as the
+BackgroundScheduler fires them (Job run times, coalesce and misfire grace of
+the scheduled jobs) and call the real run_stage, which claims the slot in
+stage_runs; SchedulerService.catch_up runs every SCHEDULER_CATCH_UP_MINUTES.
+PipelineService.open_gate is replaced by a recorder, so no pipeline work runs.
+
+The default dates are DST transition days (Europe and North America). The run
+fails if any stage of any journalist-day did not run exactly once, and reports
+the scheduler CPU time per simulated minute.
+tests/test_scheduler_simulation.py runs the same check on a few journalists.
+
+Usage:
+    python benchmarks/scheduler_simulation.py [--per-timezone 10] [--dates 2026-03-29 2026-10-25]
+                                              [--downtime 01:00-03:30]
+"""
+import os
+import sys
+import time
+import heapq
+import atexit
+import shutil
+import random
+import logging
+import argparse
+import tempfile
+import threading
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Debug mode keeps app.py from starting the real scheduler and bots on import
+DATABASE_DIR = tempfile.mkdtemp(prefix='scheduler-simulation-')
+atexit.register(shutil.rmtree, DATABASE_DIR, ignore_errors=True)
+DATABASE_FILE = os.path.join(DATABASE_DIR, 'simulation.db')
+os.environ['DATABASE_URL'] = f"sqlite:///{DATABASE_FILE}"
+os.environ['FLASK_DEBUG'] = '1'
+os.environ.pop('WERKZEUG_RUN_MAIN', None)
+
+from app import app  # noqa: E402
+from models import db, Journalist, StageRun  # noqa: E402
+from models.journalist import TIMEZONES  # noqa: E402
+from services.pipeline_service import PipelineService  # noqa: E402
+from services.scheduler_service import SchedulerService, scheduler  # noqa: E402
+from utils.schedule import get_timezone, slot_on  # noqa: E402
+
+logging.disable(logging.WARNING)
+
+STAGES = SchedulerService.STAGES
+CATCH_UP_MINUTES = SchedulerService.CATCH_UP_MINUTES
+# Nonexistent (spring forward) and repeated (fall back) local times in Europe and America
+DST_TIMES = ('02:00', '02:30', '01:30')
+
+class SimulatedClock:
+    """Naive UTC clock advanced by hand; replaces SchedulerService.clock."""
+
+    def __init__(self, start):
+        self.current = start
+
+    def now(self):
+        return self.current
+
+    def advance(self, minutes=1):
+        self.current += timedelta(minutes=minutes)
+
+class GateRecorder:
+    """Stands in for PipelineService.open_gate: records the slots run per (journalist id, stage)."""
+
+    def __init__(self):
+        self.executions = {}
+        self._lock = threading.Lock()
+
+    def open_gate(self, journalist_id, stage, slot):
+        with self._lock:
+            self.executions.setdefault((journalist_id, stage), []).append(slot)
+
+def random_time(rng):
+    if rng.random() < 0.15:
+        return rng.choice(DST_TIMES)
+    return f"{rng.randrange(24):02d}:{rng.choice((0, 0, 15, 30, 45, rng.randrange(60))):02d}"
+
+def make_journalists(per_timezone, seed):
+    """per_timezone active journalists in each TIMEZONES entry; summary_time often equals send_time."""
+    rng = random.Random(seed)
+    journalists = []
+    for tz_name, _label in TIMEZONES:
+        for _ in range(per_timezone):
+            send_time = random_time(rng)
+            journalists.append(Journalist(
+                name=f"Simulated {len(journalists) + 1}",
+                timezone=tz_name,
+                fetch_time=random_time(rng),
+                summary_time=send_time if rng.random() < 0.4 else random_time(rng),
+                send_time=send_time,
+                is_active=True
+            ))
+    db.session.add_all(journalists)
+    db.session.commit()
+    return journalists
+
+def parse_downtime(value, day):
+    if not value:
+        return None
+    start, end = value.split('-')
+    start_hour, start_minute = map(int, start.split(':'))
+    end_hour, end_minute = map(int, end.split(':'))
+    return (day.replace(hour=start_hour, minute=start_minute), day.replace(hour=end_hour, minute=end_minute))
+
+def simulate(start, days, downtime=None):
+    """
+    Replay [start, start + days) plus the catch-up delay, minute by minute, from an
+    empty stage_runs table (the first catch-up sets the baselines, as after a deploy).
+
+    Returns:
+        (executions, stats, cpu, catch_up_cpu): slots run per (journalist id, stage),
+        counters, and CPU seconds per simulated minute and per catch-up
+    """
+    with app.app_context():
+        StageRun.query.delete()
+        db.session.commit()
+
+    clock = SimulatedClock(start)
+    recorder = GateRecorder()
+    SchedulerService.clock = clock.now
+    PipelineService.open_gate = recorder.open_gate
+
+    end = start + timedelta(days=days)
+    stop = end + timedelta(seconds=SchedulerService.CATCH_UP_DELAY, minutes=CATCH_UP_MINUTES + 1)
+
+    # Jobs added by schedule_journalist, ordered by next run time as in the job store
+    aware_start = start.replace(tzinfo=timezone.utc)
+    store = []
+    for sequence, job in enumerate(scheduler.get_jobs()):
+        first = job.trigger.get_next_fire_time(None, aware_start)
+        if first is not None:
+            heapq.heappush(store, (first, sequence, job))
+
+    stats = {'fired': 0, 'claimed': 0, 'rejected': 0, 'misfired': 0, 'caught_up': 0, 'minutes': 0}
+    cpu = []
+    catch_up_cpu = []
+
+    while clock.now() < stop:
+        now = clock.now()
+        if downtime and downtime[0] <= now < downtime[1]:
+            clock.advance()
+            continue
+
+        started = time.process_time()
+        aware_now = now.replace(tzinfo=timezone.utc)
+        while store and store[0][0] <= aware_now:
+            next_run_time, sequence, job = heapq.heappop(store)
+            # BaseScheduler._process_jobs: missed run times, coalesced into the latest
+            run_times = []
+            while next_run_time is not None and next_run_time <= aware_now:
+                run_times.append(next_run_time)
+                next_run_time = job.trigger.get_next_fire_time(next_run_time, aware_now)
+            if job.coalesce:
+                stats['misfired'] += len(run_times) - 1
+                run_times = run_times[-1:]
+            for run_time in run_times:
+                # executors.base.run_job: runs later than the grace time are skipped
+                if job.misfire_grace_time is not None and (aware_now - run_time).total_seconds() > job.misfire_grace_time:
+                    stats['misfired'] += 1
+                    continue
+                stats['fired'] += 1
+                if job.func(*job.args, **job.kwargs):
+                    stats['claimed'] += 1
+                else:
+                    stats['rejected'] += 1
+            if next_run_time is not None:
+                heapq.heappush(store, (next_run_time, sequence, job))
+
+        if stats['minutes'] % CATCH_UP_MINUTES == 0:
+            catch_up_started = time.process_time()
+            executed = sum(len(slots) for slots in recorder.executions.values())
+            SchedulerService.catch_up()
+            stats['caught_up'] += sum(len(slots) for slots in recorder.executions.values()) - executed
+            catch_up_cpu.append(time.process_time() - catch_up_started)
+
+        cpu.append(time.process_time() - started)
+        stats['minutes'] += 1
+        clock.advance()
+
+    return recorder.executions, stats, cpu, catch_up_cpu
+
+def check(journalists, executions, start, days):
+    """Every slot strictly inside the window ran exactly once, and nothing else ran."""
+    end = start + timedelta(days=days)
+    errors = []
+    for journalist in journalists:
+        tz = get_timezone(journalist.timezone)
+        first_day = start.replace(tzinfo=timezone.utc).astimezone(tz).date() - timedelta(days=1)
+        local_days = [first_day + timedelta(days=i) for i in range(days + 3)]
+        for stage in STAGES:
+            expected = sorted({slot for slot in (slot_on(journalist, stage, day) for day in local_days)
+                               if start < slot < end})
+            ran = sorted(slot for slot in executions.get((journalist.id, stage), []) if start < slot < end)
+            if ran != expected:
+                errors.append(f"journalist {journalist.id} ({journalist.timezone}) {stage} "
+                              f"{getattr(journalist, stage + '_time')}: expected {[f'{s:%m-%d %H:%M}' for s in expected]}, "
+                              f"ran {[f'{s:%m-%d %H:%M}' for s in ran]}")
+    return errors
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q / 100 * len(ordered)))]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--per-timezone', type=int, default=10, help='journalists per TIMEZONES entry')
+    parser.add_argument('--dates', nargs='+', default=['2026-03-08', '2026-03-29', '2026-10-25', '2026-11-01'],
+                        help='UTC days to simulate (default: DST transitions)')
+    parser.add_argument('--days', type=int, default=1, help='days simulated from each date')
+    parser.add_argument('--downtime', help='HH:MM-HH:MM UTC during which the scheduler is down, on each date')
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    with app.app_context():
+        journalists = make_journalists(args.per_timezone, args.seed)
+        for journalist in journalists:
+            SchedulerService.schedule_journalist(journalist, replan=False)
+        # Detached copies for check(), outside the app context
+        db.session.expunge_all()
+
+    print(f"{len(journalists)} journalists over {len(TIMEZONES)} timezones, {len(scheduler.get_jobs())} cron jobs, "
+          f"catch-up every {CATCH_UP_MINUTES} min{f', down {args.downtime} UTC' if args.downtime else ''}")
+    print(f"{'date':>10} {'wall s':>7} {'fired':>7} {'rejected':>8} {'misfired':>8} {'caught up':>9} "
+          f"{'cpu ms/min':>10} {'p99':>7} {'max':>7} {'catch-up ms':>11} {'errors':>6}")
+
+    failures = 0
+    for date in args.dates:
+        start = datetime.strptime(date, '%Y-%m-%d')
+        downtime = parse_downtime(args.downtime, start)
+        wall = time.perf_counter()
+        executions, stats, cpu, catch_up_cpu = simulate(start, args.days, downtime)
+        wall = time.perf_counter() - wall
+        errors = check(journalists, executions, start, args.days)
+        failures += len(errors)
+
+        print(f"{date:>10} {wall:>7.1f} {stats['fired']:>7} {stats['rejected']:>8} {stats['misfired']:>8} "
+              f"{stats['caught_up']:>9} {sum(cpu) / len(cpu) * 1000:>10.3f} {percentile(cpu, 99) * 1000:>7.2f} "
+              f"{max(cpu) * 1000:>7.2f} {sum(catch_up_cpu) / len(catch_up_cpu) * 1000:>11.2f} {len(errors):>6}")
+        for error in errors[:10]:
+            print(f"    {error}")
+
+    if failures:
+        print(f"FAILED: {failures} journalist stages did not run exactly once per day")
+        sys.exit(1)
+    print("OK: every stage ran exactly once per journalist-day")
+
+if __name__ == '__main__':
+    main()
@@ -20,6 +20,30 @@ REQUIRED_ENV_VARS = [
     ('ELEVEN_LABS_API_KEY', False, 'Eleven Labs API key for audio generation'),
 ]
 
+# Columns added after the first release: (table, column, SQL type and default)
+COLUMN_MIGRATIONS = [
+    ('users', 'is_superadmin', 'BOOLEAN DEFAULT FALSE'),
+    ('sources', 'etag', 'VARCHAR(255)'),
+    ('sources', 'last_modified', 'VARCHAR(100)'),
+    ('sources', 'content_hash', 'VARCHAR(64)'),
+    ('articles', 'url_hash', 'VARCHAR(64)'),
+    ('journalists', 'keyword_mode', "VARCHAR(20) DEFAULT 'local'"),
+    # Articles stored before deferred enrichment already carry their keywords
+    ('articles', 'enrichment_status', "VARCHAR(20) DEFAULT 'done'"),
+    ('articles', 'enrichment_attempts', 'INTEGER DEFAULT 0'),
+    ('articles', 'enrichment_error', 'TEXT'),
+    ('articles', 'enriched_at', 'TIMESTAMP'),
+    ('articles', 'simhash', 'VARCHAR(16)'),
+    ('articles', 'duplicate_of', 'INTEGER REFERENCES articles(id) ON DELETE SET NULL'),
+    ('stage_runs', 'claimed_by', 'VARCHAR(200)'),
+    ('stage_runs', 'claimed_until', 'TIMESTAMP'),
+    ('journalists', 'planned_fetch_time', 'VARCHAR(5)'),
+    ('journalists', 'planned_summary_time', 'VARCHAR(5)'),
+    ('pipeline_runs', 'predicted_delivery_at', 'TIMESTAMP'),
+    ('articles', 'index_length', 'INTEGER'),
+    ('articles', 'language', 'VARCHAR(10)'),
+]
+
 def check_environment():
     """Check that required environment variables are set."""
     logger.info("Checking environment variables...")
@@ -48,32 +72,138 @@ def check_environment():
     
     return True
 
-def init_database():
-    """Initialize database tables."""
-    from app import app, db
-    import models
+def migrate_schema():
+    """
+    Create missing tables, add COLUMN_MIGRATIONS columns, backfill and full-text setup.
+    Idempotent; must run inside an app context. app.py runs it before starting the
+    scheduler and bots, which query the new columns.
+    """
+    from models import db
     
-    with app.app_context():
-        logger.info("Creating database tables...")
-        # create_all() is idempotent, it only creates tables that don't exist
-        db.create_all()
-        
-        # Simple migration: check for specific columns if needed
-        # Example: check if 'is_superadmin' exists in 'user' table
+    logger.info("Creating database tables...")
+    # create_all() is idempotent, it only creates tables that don't exist
+    db.create_all()
+    
+    # Simple migration: add columns that create_all() cannot add to existing tables
+    from sqlalchemy import inspect
+    inspector = inspect(db.engine)
+    for table, column, ddl in COLUMN_MIGRATIONS:
         try:
-            from sqlalchemy import inspect
-            inspector = inspect(db.engine)
-            columns = [c['name'] for c in inspector.get_columns('user')]
-            if 'is_superadmin' not in columns:
-                logger.info("Adding 'is_superadmin' column to 'user' table...")
-                db.session.execute(db.text('ALTER TABLE "user" ADD COLUMN is_superadmin BOOLEAN DEFAULT FALSE'))
+            if not inspector.has_table(table):
+                continue
+            columns = [c['name'] for c in inspector.get_columns(table)]
+            if column not in columns:
+                logger.info(f"Adding '{column}' column to '{table}' table...")
+                db.session.execute(db.text(f'ALTER TABLE "{table}" ADD COLUMN {column} {ddl}'))
                 db.session.commit()
         except Exception as e:
-            logger.warning(f"Manual migration check failed (this is usually okay if it's the first run): {e}")
+            logger.warning(f"Migration of {table}.{column} failed: {e}")
             db.session.rollback()
 
+    fix_duplicate_of_foreign_key()
+    backfill_article_url_hashes()
+    init_full_text_search()
+
+def missing_columns() -> list:
+    """COLUMN_MIGRATIONS columns absent from existing tables, as 'table.column'. Needs an app context."""
+    from sqlalchemy import inspect
+    from models import db
+    
+    inspector = inspect(db.engine)
+    missing = []
+    columns = {}
+    for table, column, _ddl in COLUMN_MIGRATIONS:
+        if table not in columns:
+            columns[table] = ({c['name'] for c in inspector.get_columns(table)}
+                              if inspector.has_table(table) else None)
+        if columns[table] is not None and column not in columns[table]:
+            missing.append(f"{table}.{column}")
+    return missing
+
+def init_database():
+    """Initialize database tables."""
+    # Importing app already migrates the schema; run again for the standalone script output
+    from app import app
+    
+    with app.app_context():
+        migrate_schema()
         logger.info("Database tables verified/created successfully")
 
+def fix_duplicate_of_foreign_key():
+    """Recreate articles.duplicate_of's foreign key with ON DELETE SET NULL where it was added without (Postgres)."""
+    from sqlalchemy import inspect
+    from models import db
+
+    if db.engine.dialect.name != 'postgresql':
+        return
+    try:
+        for foreign_key in inspect(db.engine).get_foreign_keys('articles'):
+            if foreign_key['constrained_columns'] != ['duplicate_of']:
+                continue
+            if (foreign_key.get('options') or {}).get('ondelete', '').upper() == 'SET NULL':
+                return
+            logger.info("Adding ON DELETE SET NULL to articles.duplicate_of...")
+            db.session.execute(db.text(f'ALTER TABLE articles DROP CONSTRAINT "{foreign_key["name"]}"'))
+            db.session.execute(db.text(
+                f'ALTER TABLE articles ADD CONSTRAINT "{foreign_key["name"]}" '
+                'FOREIGN KEY (duplicate_of) REFERENCES articles(id) ON DELETE SET NULL'
+            ))
+            db.session.commit()
+    except Exception as e:
+        logger.warning(f"duplicate_of foreign key update failed: {e}")
+        db.session.rollback()
+
+def backfill_article_url_hashes():
+    """Compute url_hash for articles stored before it existed, then add the unique index."""
+    from models import db, Article
+    from utils.urls import url_hash
+
+    try:
+        rows = db.session.query(Article.id, Article.journalist_id, Article.url).filter(
+            Article.url_hash.is_(None),
+            Article.url.isnot(None),
+            Article.url != ''
+        ).order_by(Article.id).all()
+
+        if rows:
+            logger.info(f"Backfilling url_hash for {len(rows)} articles...")
+            seen = set(db.session.query(Article.journalist_id, Article.url_hash).filter(
+                Article.url_hash.isnot(None)
+            ).all())
+
+            updates = []
+            for article_id, journalist_id, url in rows:
+                key = (journalist_id, url_hash(url))
+                # Older duplicates of the same canonical URL keep a NULL hash
+                if key in seen:
+                    continue
+                seen.add(key)
+                updates.append({'id': article_id, 'url_hash': key[1]})
+
+            if updates:
+                db.session.execute(db.update(Article), updates)
+            db.session.commit()
+
+        db.session.execute(db.text(
+            'CREATE UNIQUE INDEX IF NOT EXISTS uq_articles_journalist_url_hash '
+            'ON articles (journalist_id, url_hash)'
+        ))
+        db.session.commit()
+    except Exception as e:
+        logger.warning(f"url_hash backfill failed: {e}")
+        db.session.rollback()
+
+def init_full_text_search():
+    """Full-text column and GIN index (Postgres) or FTS5 table (SQLite) of articles."""
+    from models import db
+    from services.article_search import ArticleSearch
+
+    try:
+        ArticleSearch.ensure_schema()
+    except Exception as e:
+        logger.warning(f"Full-text search setup failed: {e}")
+        db.session.rollback()
+
 def init_roles():
     """Initialize default user roles."""
     from app import app
@@ -14,3 +14,9 @@ from models.activity_log import ActivityLog
 from models.settings import Settings
 from models.token_usage import TokenUsage
 from models.fetch_statistics import FetchStatistics
+from models.stage_run import StageRun
+from models.scheduler_lease import SchedulerLease
+from models.pipeline_run import PipelineRun
+from models.task import Task
+from models.article_term import ArticleTerm
+from models.llm_cache_entry import LLMCacheEntry
@@ -3,6 +3,9 @@ from datetime import datetime
 
 class Article(db.Model):
     __tablename__ = 'articles'
+    __table_args__ = (
+        db.UniqueConstraint('journalist_id', 'url_hash', name='uq_articles_journalist_url_hash'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     journalist_id = db.Column(db.Integer, db.ForeignKey('journalists.id'), nullable=False)
@@ -10,10 +13,42 @@ class Article(db.Model):
     title = db.Column(db.String(500))
     content = db.Column(db.Text)
     url = db.Column(db.String(500))
+    url_hash = db.Column(db.String(64))  # SHA-256 of the canonical URL, see utils.urls
     author = db.Column(db.String(200))
     published_at = db.Column(db.DateTime)
     fetched_at = db.Column(db.DateTime, default=datetime.utcnow)
     keywords = db.Column(db.Text)
     summary = db.Column(db.Text)
+    # Keywords and summary are filled after insert by EnrichmentService
+    enrichment_status = db.Column(db.String(20), default='pending', index=True)  # pending, done, failed
+    enrichment_attempts = db.Column(db.Integer, default=0)
+    enrichment_error = db.Column(db.Text)
+    enriched_at = db.Column(db.DateTime)
+    # Near-duplicate clustering, see services.dedup_service
+    simhash = db.Column(db.String(16))
+    # SET NULL: cascade deletes of a journalist's articles may remove a representative before its duplicates
+    duplicate_of = db.Column(db.Integer, db.ForeignKey('articles.id', ondelete='SET NULL'), index=True)
+    # Number of indexed terms, NULL until indexed by services.search_index
+    index_length = db.Column(db.Integer)
+    # Journalist language at ingestion, selects the full-text configuration (services.article_search)
+    language = db.Column(db.String(10))
     
     source = db.relationship('Source', backref='articles')
+    terms = db.relationship('ArticleTerm', lazy=True, cascade='all, delete-orphan', passive_deletes=True)
+    
+    @staticmethod
+    def existing_url_hashes(journalist_id, hashes):
+        """Return which of the given URL hashes are already stored for a journalist (one query)."""
+        hashes = {h for h in hashes if h}
+        if not hashes:
+            return set()
+        rows = db.session.query(Article.url_hash).filter(
+            Article.journalist_id == journalist_id,
+            Article.url_hash.in_(hashes)
+        ).all()
+        return {row[0] for row in rows}
+    
+    @staticmethod
+    def representatives():
+        """Filter keeping one article per near-duplicate cluster."""
+        return Article.duplicate_of.is_(None)
@@ -0,0 +1,18 @@
+from models import db
+
+class ArticleTerm(db.Model):
+    """
+    Posting of the per-journalist search index: a term's frequency in one article.
+    Maintained at ingestion by SearchIndex; the document length is repeated so
+    BM25 scoring needs no join.
+    """
+    __tablename__ = 'article_terms'
+    __table_args__ = (
+        db.Index('ix_article_terms_journalist_term', 'journalist_id', 'term'),
+    )
+    
+    article_id = db.Column(db.Integer, db.ForeignKey('articles.id', ondelete='CASCADE'), primary_key=True)
+    term = db.Column(db.String(64), primary_key=True)
+    journalist_id = db.Column(db.Integer, nullable=False)
+    tf = db.Column(db.Integer, nullable=False)
+    doc_length = db.Column(db.Integer, nullable=False)
@@ -115,9 +115,13 @@ class Journalist(db.Model):
     enable_eleven_labs = db.Column(db.Boolean, default=False)
     ai_provider = db.Column(db.String(20), default="gemini")  # gemini, perplexity, openai, openrouter
     ai_model = db.Column(db.String(100), default="auto")  # Specific model name for the provider
+    keyword_mode = db.Column(db.String(20), default="local")  # local (in-process) or ai (provider call per article)
     fetch_time = db.Column(db.String(5), default="02:00")
     summary_time = db.Column(db.String(5), default="08:00")
     send_time = db.Column(db.String(5), default="08:00")
+    # Earlier times planned back from send_time by DeliveryPlanner; None keeps the configured time
+    planned_fetch_time = db.Column(db.String(5))
+    planned_summary_time = db.Column(db.String(5))
     is_active = db.Column(db.Boolean, default=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     last_summary_at = db.Column(db.DateTime)
@@ -127,3 +131,5 @@ class Journalist(db.Model):
     subscribers = db.relationship('Subscriber', backref='journalist', lazy=True, cascade='all, delete-orphan')
     summaries = db.relationship('DailySummary', backref='journalist', lazy=True, cascade='all, delete-orphan')
     delivery_channels = db.relationship('DeliveryChannel', backref='journalist', lazy=True, cascade='all, delete-orphan')
+    stage_runs = db.relationship('StageRun', backref='journalist', lazy=True, cascade='all, delete-orphan')
+    pipeline_runs = db.relationship('PipelineRun', backref='journalist', lazy=True, cascade='all, delete-orphan')
@@ -0,0 +1,18 @@
+from models import db
+from datetime import datetime
+
+class LLMCacheEntry(db.Model):
+    """
+    Shared tier of LLMCache (LLM_CACHE_DB): a provider response keyed by the hash
+    of provider, model, request variant and normalized prompt.
+    """
+    __tablename__ = 'llm_cache_entries'
+    
+    key = db.Column(db.String(64), primary_key=True)
+    provider = db.Column(db.String(50))
+    model = db.Column(db.String(100))
+    usage_type = db.Column(db.String(20), index=True)
+    response = db.Column(db.Text, nullable=False)
+    hits = db.Column(db.Integer, default=0)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    expires_at = db.Column(db.DateTime, nullable=False, index=True)
@@ -0,0 +1,73 @@
+from models import db
+from datetime import datetime
+
+PIPELINE_STAGES = ('fetch', 'summary', 'audio', 'send')
+
+class PipelineRun(db.Model):
+    """
+    One journalist's daily pipeline: fetch -> summary -> audio -> send.
+    Stage status: pending, running, done, failed or skipped.
+    """
+    __tablename__ = 'pipeline_runs'
+    __table_args__ = (
+        db.UniqueConstraint('journalist_id', 'run_date', name='uq_pipeline_runs_journalist_date'),
+    )
+    
+    id = db.Column(db.Integer, primary_key=True)
+    journalist_id = db.Column(db.Integer, db.ForeignKey('journalists.id'), nullable=False)
+    run_date = db.Column(db.Date, nullable=False, index=True)  # Journalist's local send date
+    status = db.Column(db.String(20), default='pending')  # pending, running, done, failed, skipped
+    deadline_at = db.Column(db.DateTime)  # send_time of run_date, UTC
+    predicted_delivery_at = db.Column(db.DateTime)  # Predicted when the first stage started, UTC
+    
+    fetch_status = db.Column(db.String(20), default='pending')
+    fetch_gate_at = db.Column(db.DateTime)
+    fetch_started_at = db.Column(db.DateTime)
+    fetch_finished_at = db.Column(db.DateTime)
+    
+    summary_status = db.Column(db.String(20), default='pending')
+    summary_gate_at = db.Column(db.DateTime)
+    summary_started_at = db.Column(db.DateTime)
+    summary_finished_at = db.Column(db.DateTime)
+    
+    audio_status = db.Column(db.String(20), default='pending')
+    audio_started_at = db.Column(db.DateTime)
+    audio_finished_at = db.Column(db.DateTime)
+    
+    send_status = db.Column(db.String(20), default='pending')
+    send_gate_at = db.Column(db.DateTime)
+    send_started_at = db.Column(db.DateTime)
+    send_finished_at = db.Column(db.DateTime)
+    
+    # Stage outputs
+    articles_count = db.Column(db.Integer)
+    daily_summary_id = db.Column(db.Integer, db.ForeignKey('daily_summaries.id'))
+    error = db.Column(db.Text)
+    
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    daily_summary = db.relationship('DailySummary')
+    
+    def stage_status(self, stage):
+        return getattr(self, f"{stage}_status")
+    
+    def stage_duration(self, stage):
+        """Seconds between a stage's start and finish, or None."""
+        started = getattr(self, f"{stage}_started_at")
+        finished = getattr(self, f"{stage}_finished_at")
+        if not started or not finished:
+            return None
+        return (finished - started).total_seconds()
+    
+    def delivery_latency(self):
+        """Seconds between the deadline and the actual delivery (negative if early), or None."""
+        if self.send_status != 'done' or not self.send_finished_at or not self.deadline_at:
+            return None
+        return (self.send_finished_at - self.deadline_at).total_seconds()
+    
+    def predicted_latency(self):
+        """Seconds between the deadline and the predicted delivery, or None."""
+        if not self.predicted_delivery_at or not self.deadline_at:
+            return None
+        return (self.predicted_delivery_at - self.deadline_at).total_seconds()
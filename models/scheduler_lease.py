@@ -0,0 +1,12 @@
+from models import db
+from datetime import datetime
+
+class SchedulerLease(db.Model):
+    """Time-limited ownership of a singleton job, renewed by heartbeats."""
+    __tablename__ = 'scheduler_leases'
+    
+    name = db.Column(db.String(100), primary_key=True)
+    holder = db.Column(db.String(200), nullable=False)
+    acquired_at = db.Column(db.DateTime, default=datetime.utcnow)
+    heartbeat_at = db.Column(db.DateTime, default=datetime.utcnow)
+    expires_at = db.Column(db.DateTime, nullable=False, index=True)
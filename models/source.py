@@ -14,4 +14,8 @@ class Source(db.Model):
     fetch_count = db.Column(db.Integer, default=0)
     error_count = db.Column(db.Integer, default=0)
     last_error = db.Column(db.Text)
+    # HTTP validators from the last successful fetch (conditional GET)
+    etag = db.Column(db.String(255))
+    last_modified = db.Column(db.String(100))
+    content_hash = db.Column(db.String(64))
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
@@ -0,0 +1,26 @@
+from models import db
+from datetime import datetime
+
+class StageRun(db.Model):
+    """Last run of a scheduled stage (fetch, summary, send) for a journalist."""
+    __tablename__ = 'stage_runs'
+    __table_args__ = (
+        db.UniqueConstraint('journalist_id', 'stage', name='uq_stage_runs_journalist_stage'),
+    )
+    
+    id = db.Column(db.Integer, primary_key=True)
+    journalist_id = db.Column(db.Integer, db.ForeignKey('journalists.id'), nullable=False)
+    stage = db.Column(db.String(20), nullable=False)
+    # UTC time of the schedule slot the last completed run was for
+    last_scheduled_for = db.Column(db.DateTime)
+    last_started_at = db.Column(db.DateTime)
+    last_completed_at = db.Column(db.DateTime)
+    # Seconds between the slot and the actual start of the last run
+    last_lateness = db.Column(db.Float)
+    max_lateness = db.Column(db.Float, default=0)
+    run_count = db.Column(db.Integer, default=0)
+    catch_up_count = db.Column(db.Integer, default=0)
+    # Node currently running the stage, see SchedulerService.claim_stage
+    claimed_by = db.Column(db.String(200))
+    claimed_until = db.Column(db.DateTime)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
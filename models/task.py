@@ -0,0 +1,29 @@
+from models import db
+from datetime import datetime
+
+class Task(db.Model):
+    """
+    Background work item run by TaskQueue workers.
+    Status: queued, running, done or failed.
+    """
+    __tablename__ = 'tasks'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    task_type = db.Column(db.String(50), nullable=False, index=True)
+    payload = db.Column(db.Text)  # JSON keyword arguments of the handler
+    priority = db.Column(db.Integer, default=0, index=True)  # Higher runs first
+    status = db.Column(db.String(20), default='queued', index=True)
+    idempotency_key = db.Column(db.String(200), index=True)
+    # Same as idempotency_key while queued or running, NULL once finished: at most one live task per key
+    active_key = db.Column(db.String(200), unique=True)
+    attempts = db.Column(db.Integer, default=0)
+    max_attempts = db.Column(db.Integer, default=3)
+    run_after = db.Column(db.DateTime, default=datetime.utcnow)
+    # Worker running the task, see TaskQueue.claim
+    claimed_by = db.Column(db.String(200))
+    claimed_until = db.Column(db.DateTime)
+    result = db.Column(db.Text)
+    error = db.Column(db.Text)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    started_at = db.Column(db.DateTime)
+    finished_at = db.Column(db.DateTime)
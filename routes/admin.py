@@ -3,6 +3,8 @@ from security.auth import admin_required
 from models import Journalist, Subscriber, Article, DailySummary, User, ActivityLog, TokenUsage
 from datetime import datetime, timedelta
 from sqlalchemy import func
+from services.llm_cache import LLMCache
+from services.answer_cache import AnswerCache
 
 admin_bp = Blueprint('admin', __name__)
 
@@ -157,4 +159,6 @@ def statistics():
                          },
                          journalist_stats=journalist_stats,
                          subscriber_stats=subscriber_stats,
-                         total_cost_by_provider=total_cost_by_provider)
+                         total_cost_by_provider=total_cost_by_provider,
+                         llm_cache=LLMCache.stats(),
+                         answer_cache=AnswerCache.report())
@@ -53,33 +53,77 @@ def chart_data():
 @api_bp.route('/services/fetch', methods=['POST'])
 @admin_required
 def trigger_fetch():
-    """Manually trigger article fetching for all sources."""
+    """Queue article fetching for all sources; repeated clicks join the queued task."""
     try:
-        from services.scheduler_service import SchedulerService
-        import threading
+        from services.task_queue import TaskQueue, PRIORITY_MANUAL
         
-        thread = threading.Thread(target=SchedulerService.fetch_all_sources, daemon=True)
-        thread.start()
+        task = TaskQueue.enqueue('fetch_sources', key='fetch_sources', priority=PRIORITY_MANUAL)
         
-        return jsonify({'success': True, 'message': 'Collecte des articles lancee'})
+        return jsonify({'success': True, 'message': 'Collecte des articles lancee', 'task': TaskQueue.describe(task)}), 202
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
 @api_bp.route('/services/summary', methods=['POST'])
 @admin_required
 def trigger_summary():
-    """Manually trigger summary generation and sending."""
+    """Queue summary generation; repeated clicks join the queued task."""
     try:
-        from services.scheduler_service import SchedulerService
-        import threading
+        from services.task_queue import TaskQueue, PRIORITY_MANUAL
         
-        thread = threading.Thread(target=SchedulerService.generate_summaries, daemon=True)
-        thread.start()
+        task = TaskQueue.enqueue('generate_summaries', key='generate_summaries', priority=PRIORITY_MANUAL)
         
-        return jsonify({'success': True, 'message': 'Generation des resumes lancee'})
+        return jsonify({'success': True, 'message': 'Generation des resumes lancee', 'task': TaskQueue.describe(task)}), 202
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
+@api_bp.route('/tasks')
+@admin_required
+def list_tasks():
+    """Recent background tasks, optionally filtered by status and type."""
+    from services.task_queue import TaskQueue
+    
+    return jsonify(TaskQueue.recent(
+        status=request.args.get('status'),
+        task_type=request.args.get('type'),
+        limit=min(request.args.get('limit', 50, type=int), 500)
+    ))
+
+@api_bp.route('/tasks/<int:task_id>')
+@admin_required
+def task_status(task_id):
+    """Status of a background task, for polling after a trigger."""
+    from models import Task
+    from services.task_queue import TaskQueue
+    
+    return jsonify(TaskQueue.describe(Task.query.get_or_404(task_id)))
+
+@api_bp.route('/journalists/<int:journalist_id>/articles/search')
+@admin_required
+def search_articles(journalist_id):
+    """Ranked full-text search of a journalist's articles, optionally between two dates (YYYY-MM-DD, inclusive)."""
+    from services.article_search import ArticleSearch
+    
+    journalist = Journalist.query.get_or_404(journalist_id)
+    try:
+        start = datetime.strptime(request.args['from'], '%Y-%m-%d') if request.args.get('from') else None
+        end = datetime.strptime(request.args['to'], '%Y-%m-%d') + timedelta(days=1) if request.args.get('to') else None
+    except ValueError:
+        return jsonify({'error': 'Dates must be YYYY-MM-DD'}), 400
+    
+    query = request.args.get('q', '')
+    results = ArticleSearch.search(
+        journalist,
+        query,
+        start,
+        end,
+        limit=request.args.get('limit', 20, type=int),
+        offset=request.args.get('offset', 0, type=int)
+    )
+    return jsonify({
+        'total': ArticleSearch.count(journalist, query, start, end),
+        'results': [ArticleSearch.describe(article, rank) for article, rank in results]
+    })
+
 @api_bp.route('/services/bot/<int:journalist_id>/start', methods=['POST'])
 @admin_required
 def start_bot(journalist_id):
@@ -114,13 +158,48 @@ def services_status():
     """Get status of all services."""
     from services.telegram_service import TelegramService
     from services.scheduler_service import scheduler
+    from services.lease_service import LeaseService, NODE_ID
     
     return jsonify({
         'scheduler_running': scheduler.running,
+        'node': NODE_ID,
+        'leases': LeaseService.holders(),
         'active_bots': list(TelegramService.active_bots.keys()),
         'telegram_running': TelegramService.running
     })
 
+@api_bp.route('/scheduler/lateness')
+@admin_required
+def scheduler_lateness():
+    """Last completed slot and start lateness of each journalist stage."""
+    from services.scheduler_service import SchedulerService
+    
+    return jsonify(SchedulerService.stage_lateness())
+
+@api_bp.route('/scheduler/delivery')
+@admin_required
+def scheduler_delivery():
+    """Planned times, learnt stage durations and predicted vs actual delivery latency."""
+    from services.delivery_planner import DeliveryPlanner
+    
+    return jsonify(DeliveryPlanner.report())
+
+@api_bp.route('/http/metrics')
+@admin_required
+def http_metrics():
+    """Per-host latency of outbound HTTP calls since startup."""
+    from services.http_client import HttpClient
+    
+    return jsonify(HttpClient.metrics())
+
+@api_bp.route('/answer-cache')
+@admin_required
+def answer_cache_stats():
+    """Hit rate and answer latency saved by the subscriber answer cache, per journalist."""
+    from services.answer_cache import AnswerCache
+    
+    return jsonify(AnswerCache.report())
+
 @api_bp.route('/ai/test-model', methods=['POST'])
 @admin_required
 def test_ai_model():
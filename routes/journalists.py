@@ -7,6 +7,7 @@ from services.scraper_service import ScraperService
 from services.ai_service import AIService
 from services.audio_service import AudioService
 from services.telegram_service import TelegramService
+from services.scheduler_service import SchedulerService
 from datetime import datetime, timedelta
 from werkzeug.utils import secure_filename
 import asyncio
@@ -61,6 +62,7 @@ def create():
             enable_eleven_labs='enable_eleven_labs' in request.form,
             ai_provider=request.form.get('ai_provider', 'gemini'),
             ai_model=request.form.get('ai_model', 'auto'),
+            keyword_mode=request.form.get('keyword_mode', 'local'),
             fetch_time=request.form.get('fetch_time', '02:00'),
             summary_time=request.form.get('summary_time', '08:00'),
             send_time=request.form.get('send_time', '08:00')
@@ -106,6 +108,7 @@ def create():
             db.session.add(whatsapp_channel)
         
         db.session.commit()
+        SchedulerService.schedule_journalist(journalist)
         
         log_activity('create_journalist', 'journalist', journalist.id, f'Created: {name}')
         flash('Journaliste créé avec canaux de livraison', 'success')
@@ -116,29 +119,28 @@ def create():
 @journalists_bp.route('/<int:id>')
 @admin_required
 def view(id):
-    from zoneinfo import ZoneInfo
     from sqlalchemy import func
     from models import DeliveryChannel
+    from utils.schedule import get_timezone, scheduled_time
+    from services.enrichment_service import EnrichmentService
+    from services.pipeline_service import PipelineService
     
     journalist = Journalist.query.get_or_404(id)
     sources = Source.query.filter_by(journalist_id=id).all()
     recent_articles = Article.query.filter_by(journalist_id=id).order_by(Article.fetched_at.desc()).limit(20).all()
     recent_summaries = DailySummary.query.filter_by(journalist_id=id).order_by(DailySummary.created_at.desc()).limit(5).all()
     delivery_channels = DeliveryChannel.query.filter_by(journalist_id=id).all()
+    enrichment = EnrichmentService.status_counts(id)
+    pipeline_runs = PipelineService.recent_runs(id)
     
     # Get current time in journalist's timezone
-    try:
-        tz = ZoneInfo(journalist.timezone or 'Europe/Paris')
-    except:
-        tz = ZoneInfo('Europe/Paris')
-    
-    now_local = datetime.now(tz)
+    now_local = datetime.now(get_timezone(journalist.timezone))
     now_utc = datetime.utcnow()
     
-    # Parse scheduled times
-    fetch_hour, fetch_minute = map(int, journalist.fetch_time.split(':'))
-    summary_hour, summary_minute = map(int, journalist.summary_time.split(':'))
-    send_hour, send_minute = map(int, journalist.send_time.split(':'))
+    # Parse scheduled times (fetch and summary may be planned earlier than configured)
+    fetch_hour, fetch_minute = scheduled_time(journalist, 'fetch')
+    summary_hour, summary_minute = scheduled_time(journalist, 'summary')
+    send_hour, send_minute = scheduled_time(journalist, 'send')
     
     # Calculate next scheduled times
     def get_next_time(hour, minute, reference_time):
@@ -236,6 +238,8 @@ def view(id):
                          recent_articles=recent_articles,
                          recent_summaries=recent_summaries,
                          delivery_channels=delivery_channels,
+                         enrichment=enrichment,
+                         pipeline_runs=pipeline_runs,
                          stats=stats_data)
 
 @journalists_bp.route('/<int:id>/edit', methods=['GET', 'POST'])
@@ -259,6 +263,7 @@ def edit(id):
         journalist.enable_eleven_labs = 'enable_eleven_labs' in request.form
         journalist.ai_provider = request.form.get('ai_provider', journalist.ai_provider)
         journalist.ai_model = request.form.get('ai_model', journalist.ai_model)
+        journalist.keyword_mode = request.form.get('keyword_mode', journalist.keyword_mode)
         journalist.fetch_time = request.form.get('fetch_time', journalist.fetch_time)
         journalist.summary_time = request.form.get('summary_time', journalist.summary_time)
         journalist.send_time = request.form.get('send_time', journalist.send_time)
@@ -321,6 +326,8 @@ def edit(id):
             db.session.delete(wa_channel)
         
         db.session.commit()
+        # Times, timezone or activation may have changed
+        SchedulerService.schedule_journalist(journalist)
         
         log_activity('update_journalist', 'journalist', id, f'Updated: {journalist.name}')
         flash('Journaliste mis à jour', 'success')
@@ -336,6 +343,7 @@ def delete(id):
     
     # Stop Telegram bot if it's running
     TelegramService.stop_bot(id)
+    SchedulerService.unschedule_journalist(id)
     
     db.session.delete(journalist)
     db.session.commit()
@@ -374,64 +382,50 @@ def delete_source(source_id):
 @journalists_bp.route('/<int:id>/fetch', methods=['POST'])
 @admin_required
 def fetch_sources(id):
-    journalist = Journalist.query.get_or_404(id)
-    fetched = 0
+    """Queue a fetch of the journalist's sources; repeated clicks join the queued task."""
+    from services.task_queue import TaskQueue, PRIORITY_MANUAL
     
-    for source in journalist.sources:
-        if not source.is_active:
-            continue
-        
-        articles_data = ScraperService.fetch_source(source.source_type, source.url)
-        
-        for data in articles_data:
-            if data['url'] and Article.query.filter_by(journalist_id=id, url=data['url']).first():
-                continue
-            
-            keywords = AIService.extract_keywords(
-                f"{data['title']} {data['content']}", 
-                provider=journalist.ai_provider if hasattr(journalist, 'ai_provider') else 'gemini',
-                model=journalist.ai_model if hasattr(journalist, 'ai_model') else 'auto'
-            )
-            
-            article = Article(
-                journalist_id=id,
-                source_id=source.id,
-                title=data['title'],
-                content=data['content'],
-                url=data['url'],
-                author=data['author'],
-                published_at=data['published_at'],
-                keywords=','.join(keywords)
-            )
-            db.session.add(article)
-            fetched += 1
-        
-        source.last_fetched_at = datetime.utcnow()
-        source.fetch_count += 1
+    Journalist.query.get_or_404(id)
+    task = TaskQueue.enqueue('fetch_sources', payload={'journalist_ids': [id]},
+                             key=f'fetch_sources:{id}', priority=PRIORITY_MANUAL)
     
-    db.session.commit()
-    log_activity('fetch_sources', 'journalist', id, f'Fetched {fetched} articles')
-    return jsonify({'message': f'{fetched} articles récupérés'})
+    log_activity('fetch_sources', 'journalist', id, f'Queued task {task.id}')
+    return jsonify({'message': 'Récupération des articles lancée', 'task': TaskQueue.describe(task)}), 202
+
+@journalists_bp.route('/<int:id>/enrichment/retry', methods=['POST'])
+@admin_required
+def retry_enrichment(id):
+    from services.enrichment_service import EnrichmentService
+    from services.task_queue import TaskQueue, PRIORITY_MANUAL
+    
+    Journalist.query.get_or_404(id)
+    reset = EnrichmentService.retry_failed(id)
+    if reset:
+        TaskQueue.enqueue('enrich_articles', key='enrich_articles', priority=PRIORITY_MANUAL)
+    
+    log_activity('retry_enrichment', 'journalist', id, f'Requeued {reset} articles')
+    flash(f'{reset} articles remis en file d\'enrichissement', 'success')
+    return redirect(url_for('journalists.view', id=id))
 
 @journalists_bp.route('/<int:id>/summary/text', methods=['POST'])
 @admin_required
 def generate_summary_text(id):
     """Generate text summary only (no audio)."""
+    from services.enrichment_service import EnrichmentService
+    
     journalist = Journalist.query.get_or_404(id)
     
     yesterday = datetime.utcnow() - timedelta(days=1)
     articles = Article.query.filter(
         Article.journalist_id == id,
-        Article.fetched_at >= yesterday
+        Article.fetched_at >= yesterday,
+        Article.representatives()
     ).all()
     
     if not articles:
         return jsonify({'message': 'Aucun article récent'})
     
-    articles_data = [
-        {'title': a.title, 'content': a.content, 'source': a.source.name if a.source else 'Unknown'}
-        for a in articles
-    ]
+    articles_data = EnrichmentService.prompt_articles(articles)
     
     summary_text = AIService.generate_summary(
         articles=articles_data,
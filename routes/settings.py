@@ -205,9 +205,10 @@ def test_perplexity():
         return jsonify({'success': False, 'message': 'Clé API Perplexity non configurée'})
     
     try:
-        import requests
+        from requests.exceptions import Timeout
+        from services.http_client import HttpClient
         api_key = os.environ.get('PERPLEXITY_API_KEY')
-        response = requests.post(
+        response = HttpClient.post(
             "https://api.perplexity.ai/v1/chat/completions",
             headers={
                 "Authorization": f"Bearer {api_key}",
@@ -218,7 +219,8 @@ def test_perplexity():
                 "messages": [{"role": "user", "content": "Hello"}],
                 "max_tokens": 50
             },
-            timeout=15
+            timeout=15,
+            retry=False
         )
         if response.status_code == 200:
             try:
@@ -232,7 +234,7 @@ def test_perplexity():
             return jsonify({'success': False, 'message': 'Clé API Perplexity invalide'})
         else:
             return jsonify({'success': False, 'message': f'Erreur Perplexity: {response.status_code}'})
-    except requests.exceptions.Timeout:
+    except Timeout:
         return jsonify({'success': False, 'message': 'Timeout - Perplexity ne répond pas'})
     except Exception as e:
         return jsonify({'success': False, 'message': f'Erreur: {str(e)}'})
@@ -246,9 +248,9 @@ def test_openai():
         return jsonify({'success': False, 'message': 'Clé API OpenAI non configurée'})
     
     try:
-        import requests
+        from services.http_client import HttpClient
         api_key = os.environ.get('OPENAI_API_KEY')
-        response = requests.post(
+        response = HttpClient.post(
             "https://api.openai.com/v1/chat/completions",
             headers={"Authorization": f"Bearer {api_key}"},
             json={
@@ -256,7 +258,8 @@ def test_openai():
                 "messages": [{"role": "user", "content": "Bonjour"}],
                 "max_tokens": 50
             },
-            timeout=10
+            timeout=10,
+            retry=False
         )
         if response.status_code == 200:
             return jsonify({'success': True, 'message': 'Connexion OpenAI réussie'})
@@ -272,9 +275,9 @@ def test_openrouter():
         return jsonify({'success': False, 'message': 'Clé API OpenRouter non configurée'})
     
     try:
-        import requests
+        from services.http_client import HttpClient
         api_key = os.environ.get('OPENROUTER_API_KEY')
-        response = requests.post(
+        response = HttpClient.post(
             "https://openrouter.ai/api/v1/chat/completions",
             headers={"Authorization": f"Bearer {api_key}"},
             json={
@@ -282,7 +285,8 @@ def test_openrouter():
                 "messages": [{"role": "user", "content": "Bonjour"}],
                 "max_tokens": 50
             },
-            timeout=10
+            timeout=10,
+            retry=False
         )
         if response.status_code == 200:
             return jsonify({'success': True, 'message': 'Connexion OpenRouter réussie'})
@@ -300,12 +304,13 @@ def test_elevenlabs():
         return jsonify({'success': False, 'message': 'Clé API Eleven Labs non configurée'})
     
     try:
-        import requests
+        from services.http_client import HttpClient
         api_key = os.environ.get('ELEVEN_LABS_API_KEY')
-        response = requests.get(
+        response = HttpClient.get(
             "https://api.elevenlabs.io/v1/voices",
             headers={"xi-api-key": api_key},
-            timeout=10
+            timeout=10,
+            retry=False
         )
         if response.status_code == 200:
             voices = response.json().get('voices', [])
@@ -322,7 +327,7 @@ def test_elevenlabs():
 def test_telegram():
     """Test Telegram Bot API with all active journalists."""
     from models import Journalist
-    import requests
+    from services.http_client import HttpClient
     
     journalists = Journalist.query.filter_by(is_active=True).all()
     
@@ -332,9 +337,10 @@ def test_telegram():
     results = []
     for journalist in journalists:
         try:
-            response = requests.get(
+            response = HttpClient.get(
                 f"https://api.telegram.org/bot{journalist.telegram_token}/getMe",
-                timeout=10
+                timeout=10,
+                retry=False
             )
             if response.status_code == 200:
                 data = response.json()
@@ -90,13 +90,13 @@ def webhook(journalist_id):
                 if message_text.lower().startswith('/latest'):
                     response = WhatsAppService.get_latest_summary(journalist_id)
                 elif message_text.lower().startswith('/articles'):
-                    # Extract date if provided
+                    # Extract date and optional keywords
                     parts = message_text.split()
                     if len(parts) > 1:
                         date_str = parts[1]
-                        response = WhatsAppService.search_articles_by_date(journalist_id, date_str)
+                        response = WhatsAppService.search_articles_by_date(journalist_id, date_str, ' '.join(parts[2:]))
                     else:
-                        response = "📅 Format: /articles DD/MM/YYYY ou /articles YYYY-MM-DD"
+                        response = "📅 Format: /articles DD/MM/YYYY [mots-cles] ou /articles YYYY-MM-DD [mots-cles]"
                 else:
                     # Natural language query
                     response = WhatsAppService.handle_message(journalist, subscriber, message_text)
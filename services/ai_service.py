@@ -1,6 +1,8 @@
 import os
 import logging
 from google import genai
+from services.llm_cache import LLMCache
+from services.provider_limits import ProviderLimits
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +37,7 @@ def clean_html(text: str) -> str:
     return '\n'.join(lines)
 
 class AIService:
+    GEMINI_MODEL = "gemini-2.5-flash"
     _client = None
     
     @classmethod
@@ -46,6 +49,21 @@ class AIService:
             cls._client = genai.Client(api_key=api_key)
         return cls._client
     
+    @classmethod
+    def _generate(cls, client, prompt: str, usage: str, config: dict = None) -> str:
+        """One Gemini request; identical prompts are answered from the cache, see services.llm_cache."""
+        def call():
+            # Per request, so parallel map calls of a summary stay under the provider cap
+            with ProviderLimits.slot("gemini"):
+                response = client.models.generate_content(
+                    model=cls.GEMINI_MODEL,
+                    contents=prompt,
+                    config=config
+                )
+            return response.text
+        
+        return LLMCache.cached("gemini", cls.GEMINI_MODEL, usage, prompt, call, variant=str(sorted((config or {}).items())))
+    
     @classmethod
     def is_available(cls, provider: str = "gemini"):
         """Check if API is available for the given provider."""
@@ -84,6 +102,8 @@ class AIService:
             else:
                 return service.generate_summary(articles, personality, writing_style, tone, language)
         
+        from utils import summary_map_reduce
+        
         # Gemini implementation
         client = cls.get_client()
         if client is None:
@@ -91,10 +111,11 @@ class AIService:
             titles = [a.get('title', 'Article') for a in articles[:10]]
             return "Résumé des actualités:\n\n" + "\n".join([f"• {t}" for t in titles])
         
-        articles_text = "\n\n".join([
-            f"Source: {a.get('source', 'Unknown')}\nTitre: {a.get('title', 'Sans titre')}\nContenu: {a.get('content', '')[:1000]}"
-            for a in articles
-        ])
+        def call(prompt, max_tokens):
+            return cls._generate(client, prompt, "summary")
+        
+        # Large article sets are condensed chunk by chunk first (map), this prompt is the reduce
+        articles_text = summary_map_reduce.condense(articles, call, language, "gemini")
         
         prompt = f"""Tu es un journaliste IA avec les caractéristiques suivantes:
 - Personnalité: {personality}
@@ -118,34 +139,34 @@ Articles à résumer:
 Résumé:"""
 
         try:
-            response = client.models.generate_content(
-                model="gemini-2.5-flash",
-                contents=prompt
-            )
-            summary_text = response.text or "Erreur lors de la génération du résumé."
+            summary_text = cls._generate(client, prompt, "summary") or "Erreur lors de la génération du résumé."
             return clean_html(summary_text)
         except Exception as e:
             logger.error(f"Error generating summary: {e}")
             return f"Erreur lors de la génération du résumé: {str(e)}"
     
     @classmethod
-    def answer_question(cls, question: str, articles: list, personality: str, writing_style: str, tone: str, language: str = "fr", provider: str = "gemini", model: str = "auto") -> str:
+    def answer_question(cls, question: str, articles: list, personality: str, writing_style: str, tone: str, language: str = "fr", provider: str = "gemini", model: str = "auto", fallback: bool = True) -> str:
+        """
+        Answer a subscriber question from articles. On failure, returns the
+        fallback_answer text, or None with fallback=False (nothing to cache).
+        """
         # Use the appropriate provider service
         service = cls.get_provider_service(provider)
         
         # If not Gemini, delegate to the provider service
         if provider != "gemini":
             if provider == "openai":
-                return service.answer_question(question, articles, personality, writing_style, tone, language, model or "gpt-4o-mini")
+                return service.answer_question(question, articles, personality, writing_style, tone, language, model or "gpt-4o-mini", fallback=fallback)
             elif provider == "openrouter":
-                return service.answer_question(question, articles, personality, writing_style, tone, language, model or "openrouter/auto")
+                return service.answer_question(question, articles, personality, writing_style, tone, language, model or "openrouter/auto", fallback=fallback)
             else:
-                return service.answer_question(question, articles, personality, writing_style, tone, language)
+                return service.answer_question(question, articles, personality, writing_style, tone, language, fallback=fallback)
         
         # Gemini implementation
         client = cls.get_client()
         if client is None:
-            return "Le service IA n'est pas configuré. Contactez l'administrateur."
+            return cls.fallback_answer(provider) if fallback else None
         
         articles_context = "\n\n".join([
             f"[{a.get('source', 'Unknown')}] {a.get('title', '')}: {a.get('content', '')[:500]}"
@@ -169,14 +190,17 @@ Question de l'utilisateur: {question}
 Réponse:"""
 
         try:
-            response = client.models.generate_content(
-                model="gemini-2.5-flash",
-                contents=prompt
-            )
-            return response.text or "Je n'ai pas pu trouver d'information pertinente."
+            return cls._generate(client, prompt, "question") or (cls.fallback_answer(provider) if fallback else None)
         except Exception as e:
             logger.error(f"Error answering question: {e}")
-            return f"Erreur: {str(e)}"
+            return f"Erreur: {str(e)}" if fallback else None
+    
+    @classmethod
+    def fallback_answer(cls, provider: str = "gemini") -> str:
+        """Reply sent when answer_question(..., fallback=False) returned None."""
+        if provider == "gemini" and cls.get_client() is None:
+            return "Le service IA n'est pas configuré. Contactez l'administrateur."
+        return "Je n'ai pas pu trouver d'information pertinente."
     
     @classmethod
     def extract_keywords(cls, text: str, provider: str = "gemini", model: str = "auto") -> list:
@@ -205,12 +229,44 @@ Texte: {text[:2000]}
 Mots-clés:"""
 
         try:
-            response = client.models.generate_content(
-                model="gemini-2.5-flash",
-                contents=prompt
-            )
-            keywords = response.text.strip() if response.text else ""
+            text = cls._generate(client, prompt, "extraction")
+            keywords = text.strip() if text else ""
             return [kw.strip() for kw in keywords.split(",") if kw.strip()]
         except Exception as e:
             logger.error(f"Error extracting keywords: {e}")
             return []
+    
+    @classmethod
+    def extract_keywords_batch(cls, items: list, provider: str = "gemini", model: str = "auto") -> dict:
+        """
+        Extract keywords for several articles with few requests.
+        
+        Args:
+            items: list of (id, text) pairs
+        
+        Returns:
+            dict: id -> keyword list (empty list on failure)
+        """
+        from utils import keyword_batch
+        
+        service = cls.get_provider_service(provider)
+        
+        if provider != "gemini":
+            if provider == "openai":
+                return service.extract_keywords_batch(items, model or "gpt-4o-mini")
+            elif provider == "openrouter":
+                return service.extract_keywords_batch(items, model or "openrouter/auto")
+            else:
+                return service.extract_keywords_batch(items)
+        
+        client = cls.get_client()
+        if client is None:
+            return {item_id: [] for item_id, _ in items}
+        
+        def call(prompt, max_tokens):
+            # No output cap here: gemini-2.5 counts its thinking tokens against it
+            return cls._generate(client, prompt, "extraction", {"response_mime_type": "application/json"})
+        
+        return keyword_batch.extract_batch(
+            items, call, lambda text: cls.extract_keywords(text, provider, model)
+        )
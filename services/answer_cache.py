@@ -0,0 +1,194 @@
+"""
+Per-journalist semantic cache of answers to subscriber questions.
+
+After a summary goes out, subscribers ask the same thing in slightly different
+words within minutes. An incoming question is compared with the recent
+questions of the same journalist: by cosine similarity of their embeddings
+(services.embedding_index backend) or, when embeddings are disabled or fail, by
+MinHash similarity of their terms (utils.minhash). The cached answer is reused
+when the question is similar enough and still valid:
+
+- the articles retrieved for the new question are mostly those the cached
+  answer was written from (guards "news about X" against "news about Y");
+- none of them was ingested after the cached answer;
+- the journalist's persona, language, provider and model are unchanged.
+
+Entries live in this process for ANSWER_CACHE_TTL seconds. Hits, misses, stale
+matches and the answer latency saved are counted per journalist.
+"""
+import os
+import time
+import logging
+import threading
+from collections import deque
+from datetime import datetime, timedelta
+from utils import minhash
+
+logger = logging.getLogger(__name__)
+
+class AnswerCache:
+    TTL = int(os.environ.get('ANSWER_CACHE_TTL', 3600))
+    MAX_ENTRIES = int(os.environ.get('ANSWER_CACHE_SIZE', 200))
+    # Minimum cosine similarity of question embeddings
+    MIN_SIMILARITY = float(os.environ.get('ANSWER_CACHE_MIN_SIMILARITY', 0.9))
+    # Minimum estimated Jaccard similarity of question terms, without embeddings
+    MIN_JACCARD = float(os.environ.get('ANSWER_CACHE_MIN_JACCARD', 0.7))
+    # Share of the cached answer's articles that must be retrieved again
+    MIN_OVERLAP = 0.8
+
+    _entries = {}  # journalist id -> deque of entries, oldest first
+    _stats = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def settings(journalist) -> tuple:
+        return (journalist.personality, journalist.writing_style, journalist.tone,
+                journalist.language, journalist.ai_provider, journalist.ai_model)
+
+    @staticmethod
+    def question_key(question: str, language: str = None, query_vector=None):
+        """
+        ('embedding:<backend>', unit vector) from the question's EmbeddingIndex.embed_query
+        vector, else ('minhash', signature) when embeddings are disabled or failed.
+        """
+        from services.embedding_index import EmbeddingIndex
+
+        if query_vector is not None:
+            return ('embedding:' + EmbeddingIndex.backend().name, query_vector)
+        return ('minhash', minhash.signature(question, language))
+
+    @classmethod
+    def similarity(cls, kind, a, b) -> float:
+        if kind == 'minhash':
+            return minhash.similarity(a, b)
+        if a.shape != b.shape:
+            return 0.0
+        return float(a @ b)
+
+    @classmethod
+    def _count(cls, journalist_id, **increments):
+        with cls._lock:
+            counters = cls._stats.setdefault(journalist_id, {
+                'lookups': 0, 'hits': 0, 'misses': 0, 'stale': 0,
+                'saved_seconds': 0.0, 'answer_seconds': 0.0
+            })
+            for name, value in increments.items():
+                counters[name] += value
+
+    @classmethod
+    def _match(cls, journalist, kind, key, article_ids, now):
+        """
+        Most similar valid entry for a question.
+
+        Returns:
+            (entry, stale): the entry to reuse or None; stale when a similar
+            question was found but new relevant articles came in since
+        """
+        threshold = cls.MIN_JACCARD if kind == 'minhash' else cls.MIN_SIMILARITY
+        settings = cls.settings(journalist)
+        retrieved = set(article_ids)
+
+        with cls._lock:
+            entries = [entry for entry in cls._entries.get(journalist.id, ())
+                       if entry['expires_at'] > now and entry['kind'] == kind and entry['settings'] == settings]
+
+        best, best_score, stale = None, threshold, False
+        for entry in entries:
+            score = cls.similarity(kind, key, entry['key'])
+            if score < best_score:
+                continue
+            overlap = len(retrieved & entry['article_ids']) / max(1, len(entry['article_ids']))
+            if overlap < cls.MIN_OVERLAP:
+                continue
+            if any(article_id > entry['latest_article_id'] for article_id in retrieved):
+                stale = True
+                continue
+            best, best_score = entry, score
+        return best, stale and best is None
+
+    @classmethod
+    def answer(cls, journalist, question: str, articles: list, generate, query_vector=None):
+        """
+        Answer to a subscriber question, from the cache when possible.
+
+        Args:
+            journalist: Journalist asked
+            question: the subscriber's message
+            articles: Article list retrieved for the question (SearchIndex.top_articles)
+            generate: function() -> str, the provider call on a miss; returns None on
+                failure, which is passed through and not cached
+            query_vector: the question's EmbeddingIndex.embed_query vector, shared with retrieval
+
+        Returns:
+            str, or None when generate failed (the caller sends its fallback text)
+        """
+        from sqlalchemy import func
+        from models import db, Article
+
+        started = time.perf_counter()
+        now = datetime.utcnow()
+        article_ids = [article.id for article in articles]
+        kind, key = cls.question_key(question, journalist.language, query_vector)
+
+        entry, stale = (None, False) if key is None else cls._match(journalist, kind, key, article_ids, now)
+        if entry is not None:
+            saved = max(0.0, entry['latency'] - (time.perf_counter() - started))
+            cls._count(journalist.id, lookups=1, hits=1, saved_seconds=saved)
+            logger.info(f"Answer cache hit for journalist {journalist.id} ({saved:.1f}s saved)")
+            return entry['answer']
+
+        response = generate()
+        latency = time.perf_counter() - started
+        cls._count(journalist.id, lookups=1, misses=1, stale=int(stale), answer_seconds=latency)
+
+        if key is not None and response:
+            latest_article_id = db.session.query(func.max(Article.id)).filter(
+                Article.journalist_id == journalist.id
+            ).scalar() or 0
+            with cls._lock:
+                entries = cls._entries.setdefault(journalist.id, deque(maxlen=cls.MAX_ENTRIES))
+                entries.append({
+                    'kind': kind,
+                    'key': key,
+                    'answer': response,
+                    'article_ids': set(article_ids),
+                    'latest_article_id': max([latest_article_id] + article_ids),
+                    'settings': cls.settings(journalist),
+                    'latency': latency,
+                    'expires_at': now + timedelta(seconds=cls.TTL)
+                })
+        return response
+
+    @classmethod
+    def report(cls) -> dict:
+        """Hit rate and latency saved per journalist and overall, for this process."""
+        from models import Journalist
+
+        with cls._lock:
+            stats = {journalist_id: dict(counters) for journalist_id, counters in cls._stats.items()}
+        names = dict(Journalist.query.with_entities(Journalist.id, Journalist.name).filter(
+            Journalist.id.in_(list(stats))
+        ).all()) if stats else {}
+
+        def summarize(counters):
+            lookups, misses = counters['lookups'], counters['misses']
+            return dict(
+                counters,
+                saved_seconds=round(counters['saved_seconds'], 1),
+                answer_seconds=round(counters['answer_seconds'], 1),
+                hit_rate=round(counters['hits'] / lookups, 3) if lookups else None,
+                average_answer_seconds=round(counters['answer_seconds'] / misses, 2) if misses else None
+            )
+
+        total = {'lookups': 0, 'hits': 0, 'misses': 0, 'stale': 0, 'saved_seconds': 0.0, 'answer_seconds': 0.0}
+        for counters in stats.values():
+            for name in total:
+                total[name] += counters[name]
+
+        return {
+            'journalists': [
+                dict(summarize(counters), journalist_id=journalist_id, name=names.get(journalist_id))
+                for journalist_id, counters in sorted(stats.items())
+            ],
+            'total': summarize(total)
+        }
@@ -0,0 +1,185 @@
+"""
+Ranked, date-filtered article search in SQL.
+
+Postgres: articles.search_vector is a generated tsvector column (title weighted
+above content) built with the text search configuration of the article's
+language (articles.language, copied from Journalist.language at ingestion),
+with a GIN index; queries use websearch_to_tsquery and ts_rank_cd.
+
+SQLite: articles_fts is an FTS5 external-content table over title and content
+(accents removed), kept in sync by triggers; queries rank with bm25.
+
+The schema is created by ensure_schema (run by init_db). Other databases fall
+back to a LIKE filter ordered by date.
+"""
+import re
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Journalist.language -> Postgres text search configuration
+TEXT_SEARCH_CONFIGS = {
+    'fr': 'french',
+    'en': 'english',
+    'es': 'spanish',
+    'de': 'german',
+    'it': 'italian',
+    'pt': 'portuguese',
+}
+DEFAULT_CONFIG = 'simple'
+# Characters of content indexed, tsvector values are limited to 1 MB
+MAX_CONTENT_LENGTH = 100000
+
+def _config_case(column):
+    """SQL CASE mapping a language column to a regconfig; constants keep the expression immutable."""
+    branches = ' '.join(f"WHEN '{language}' THEN '{config}'::regconfig"
+                        for language, config in TEXT_SEARCH_CONFIGS.items())
+    return f"CASE {column} {branches} ELSE '{DEFAULT_CONFIG}'::regconfig END"
+
+POSTGRES_SCHEMA = [
+    f"""ALTER TABLE articles ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector({_config_case('language')}, coalesce(title, '')), 'A') ||
+        setweight(to_tsvector({_config_case('language')}, left(coalesce(content, ''), {MAX_CONTENT_LENGTH})), 'B')
+    ) STORED""",
+    "CREATE INDEX IF NOT EXISTS ix_articles_search_vector ON articles USING GIN (search_vector)",
+]
+
+SQLITE_SCHEMA = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+        title, content, content='articles', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS articles_fts_insert AFTER INSERT ON articles BEGIN
+        INSERT INTO articles_fts(rowid, title, content) VALUES (new.id, new.title, new.content);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS articles_fts_delete AFTER DELETE ON articles BEGIN
+        INSERT INTO articles_fts(articles_fts, rowid, title, content) VALUES ('delete', old.id, old.title, old.content);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS articles_fts_update AFTER UPDATE OF title, content ON articles BEGIN
+        INSERT INTO articles_fts(articles_fts, rowid, title, content) VALUES ('delete', old.id, old.title, old.content);
+        INSERT INTO articles_fts(rowid, title, content) VALUES (new.id, new.title, new.content);
+    END""",
+]
+
+def fts5_query(text):
+    """
+    Free text as an FTS5 query: every word quoted (no operator injection) and required;
+    words of 4 letters or more also match as prefixes, for plurals and inflections.
+    """
+    words = re.findall(r'\w+', text or '')
+    return ' '.join(f'"{word}"*' if len(word) >= 4 else f'"{word}"' for word in words)
+
+class ArticleSearch:
+    MAX_LIMIT = 100
+
+    @staticmethod
+    def dialect() -> str:
+        from models import db
+        return db.engine.dialect.name
+
+    @classmethod
+    def ensure_schema(cls):
+        """Create the full-text column or table and its index; fills articles.language first."""
+        from models import db
+
+        db.session.execute(db.text(
+            "UPDATE articles SET language = (SELECT language FROM journalists WHERE journalists.id = articles.journalist_id) "
+            "WHERE language IS NULL"
+        ))
+        db.session.commit()
+
+        dialect = cls.dialect()
+        if dialect == 'postgresql':
+            for statement in POSTGRES_SCHEMA:
+                db.session.execute(db.text(statement))
+            db.session.commit()
+        elif dialect == 'sqlite':
+            created = not db.session.execute(db.text(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'articles_fts'"
+            )).first()
+            for statement in SQLITE_SCHEMA:
+                db.session.execute(db.text(statement))
+            if created:
+                # Articles stored before the table existed
+                db.session.execute(db.text("INSERT INTO articles_fts(articles_fts) VALUES ('rebuild')"))
+            db.session.commit()
+        else:
+            logger.warning(f"No full-text search support for {dialect}, article search uses LIKE")
+
+    @classmethod
+    def _filters(cls, journalist, query, start, end):
+        """FROM and WHERE clauses, rank expression and parameters of a search."""
+        dialect = cls.dialect()
+        params = {'journalist_id': journalist.id}
+        where = ["a.journalist_id = :journalist_id", "a.duplicate_of IS NULL"]
+        source = "articles a"
+        rank = "NULL"
+
+        if start is not None:
+            where.append("a.fetched_at >= :start")
+            params['start'] = start
+        if end is not None:
+            where.append("a.fetched_at < :end")
+            params['end'] = end
+
+        query = (query or '').strip()
+        if query and dialect == 'postgresql':
+            source = "articles a, websearch_to_tsquery(CAST(:config AS regconfig), :query) q"
+            where.append("a.search_vector @@ q")
+            rank = "ts_rank_cd(a.search_vector, q)"
+            params.update(config=TEXT_SEARCH_CONFIGS.get(journalist.language, DEFAULT_CONFIG), query=query)
+        elif query and dialect == 'sqlite':
+            match = fts5_query(query)
+            if match:
+                source = "articles_fts JOIN articles a ON a.id = articles_fts.rowid"
+                where.append("articles_fts MATCH :query")
+                # bm25 is lower for better matches; title weighted twice
+                rank = "-bm25(articles_fts, 2.0, 1.0)"
+                params['query'] = match
+        elif query:
+            where.append("(a.title LIKE :pattern OR a.content LIKE :pattern)")
+            params['pattern'] = f"%{query}%"
+
+        return source, ' AND '.join(where), rank, params
+
+    @classmethod
+    def search(cls, journalist, query: str = None, start=None, end=None, limit: int = 20, offset: int = 0) -> list:
+        """
+        Representative articles of a journalist matching a query, fetched in [start, end).
+        Best matches first, the latest first without a query.
+
+        Returns:
+            list: (Article, rank) pairs; rank is None without a query
+        """
+        from models import db, Article
+
+        source, where, rank, params = cls._filters(journalist, query, start, end)
+        order = "rank DESC, a.fetched_at DESC" if rank != "NULL" else "a.fetched_at DESC"
+        params.update(limit=max(1, min(limit, cls.MAX_LIMIT)), offset=max(0, offset))
+        rows = db.session.execute(db.text(
+            f"SELECT a.id, {rank} AS rank FROM {source} WHERE {where} ORDER BY {order} LIMIT :limit OFFSET :offset"
+        ), params).all()
+
+        by_id = {article.id: article for article in Article.query.filter(
+            Article.id.in_([row.id for row in rows])
+        ).all()}
+        return [(by_id[row.id], row.rank) for row in rows if row.id in by_id]
+
+    @classmethod
+    def count(cls, journalist, query: str = None, start=None, end=None) -> int:
+        from models import db
+
+        source, where, _, params = cls._filters(journalist, query, start, end)
+        return db.session.execute(db.text(f"SELECT count(*) FROM {source} WHERE {where}"), params).scalar()
+
+    @staticmethod
+    def describe(article, rank=None) -> dict:
+        return {
+            'id': article.id,
+            'title': article.title,
+            'url': article.url,
+            'source': article.source.name if article.source else None,
+            'summary': article.summary,
+            'published_at': article.published_at.isoformat() if article.published_at else None,
+            'fetched_at': article.fetched_at.isoformat() if article.fetched_at else None,
+            'rank': rank
+        }
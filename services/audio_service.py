@@ -1,5 +1,6 @@
 import os
 import requests
+from services.http_client import HttpClient
 import logging
 
 logger = logging.getLogger(__name__)
@@ -50,7 +51,7 @@ class AudioService:
         }
         
         try:
-            response = requests.post(url, json=data, headers=headers, timeout=60)
+            response = HttpClient.post(url, json=data, headers=headers, timeout=60)
             response.raise_for_status()
             logger.info(f"Audio generated successfully ({len(response.content)} bytes)")
             return response.content, None
@@ -0,0 +1,60 @@
+"""
+Near-duplicate clustering of articles.
+Each article gets a SimHash of its title and content at ingestion. Within a
+journalist's rolling window, an article close to an earlier one is linked to it
+through duplicate_of, so summaries and Q&A only see one article per story.
+"""
+import os
+import logging
+from datetime import datetime, timedelta
+from utils.simhash import simhash, to_hex, from_hex, SimHashIndex
+
+logger = logging.getLogger(__name__)
+
+class DedupService:
+    WINDOW_HOURS = int(os.environ.get('DEDUP_WINDOW_HOURS', 72))
+    MAX_DISTANCE = int(os.environ.get('DEDUP_MAX_DISTANCE', 3))
+
+    @staticmethod
+    def fingerprint(title: str, content: str):
+        """Integer SimHash of an article, or None when it has no usable text."""
+        return simhash(f"{title or ''} {content or ''}")
+
+    @classmethod
+    def load_index(cls, journalist_id: int) -> SimHashIndex:
+        """Index of the cluster representatives in a journalist's rolling window."""
+        from models import db, Article
+
+        since = datetime.utcnow() - timedelta(hours=cls.WINDOW_HOURS)
+        rows = db.session.query(Article.id, Article.simhash).filter(
+            Article.journalist_id == journalist_id,
+            Article.fetched_at >= since,
+            Article.simhash.isnot(None),
+            Article.duplicate_of.is_(None)
+        ).all()
+
+        index = SimHashIndex(cls.MAX_DISTANCE)
+        for article_id, value in rows:
+            index.add(article_id, from_hex(value))
+        return index
+
+    @staticmethod
+    def assign(article, fingerprint, index: SimHashIndex) -> bool:
+        """
+        Store the fingerprint on a flushed article and link it to its cluster.
+        New representatives are added to the index.
+
+        Returns:
+            bool: True if the article is a near-duplicate
+        """
+        article.simhash = to_hex(fingerprint)
+        if fingerprint is None:
+            return False
+
+        representative = index.find(fingerprint)
+        if representative is not None:
+            article.duplicate_of = representative
+            return True
+
+        index.add(article.id, fingerprint)
+        return False
@@ -0,0 +1,191 @@
+"""
+Deadline-aware planning of the daily pipeline.
+
+Journalists often set summary_time to send_time ("08:00" for both): the summary
+then starts when it should already be delivered. The planner learns the p95
+duration of each stage from the journalist's recent PipelineRuns and, when the
+configured times leave too little room, plans fetch and summary back from
+send_time (Journalist.planned_fetch_time / planned_summary_time, read by
+utils.schedule.scheduled_time). Configured times are never moved later.
+"""
+import os
+import math
+import logging
+from datetime import datetime, timedelta
+from utils.schedule import stage_time
+
+logger = logging.getLogger(__name__)
+
+MINUTES_PER_DAY = 24 * 60
+
+def percentile(values, q):
+    """Nearest-rank percentile of a list of numbers, or None if empty."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+def minutes_before_send(journalist, stage):
+    """Minutes between a stage's configured time and the send_time it feeds (0-1439)."""
+    hour, minute = stage_time(journalist, stage)
+    send_hour, send_minute = stage_time(journalist, 'send')
+    return ((send_hour * 60 + send_minute) - (hour * 60 + minute)) % MINUTES_PER_DAY
+
+def time_before_send(journalist, lead):
+    """"HH:MM" local time lead minutes before the journalist's send_time."""
+    send_hour, send_minute = stage_time(journalist, 'send')
+    minutes = (send_hour * 60 + send_minute - lead) % MINUTES_PER_DAY
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+class DeliveryPlanner:
+    # Recent runs the durations are learnt from, and how many are needed to trust them
+    HISTORY_RUNS = int(os.environ.get('PLANNER_HISTORY_RUNS', 14))
+    MIN_SAMPLES = 3
+    PERCENTILE = 95
+    # Added after each planned stage, in minutes
+    MARGIN_MINUTES = int(os.environ.get('PLANNER_MARGIN_MINUTES', 5))
+    # A stage is never planned further back than this before send_time
+    MAX_LEAD_MINUTES = 12 * 60
+    # Seconds, used until a journalist has MIN_SAMPLES runs of a stage
+    DEFAULT_DURATIONS = {
+        'fetch': 600,
+        'summary': 300,
+        'audio': 120,
+        'send': 30,
+    }
+
+    @classmethod
+    def durations(cls, journalist_id):
+        """p95 duration in seconds of each stage over the journalist's recent runs."""
+        from models import PipelineRun
+        from models.pipeline_run import PIPELINE_STAGES
+
+        runs = PipelineRun.query.filter_by(journalist_id=journalist_id).order_by(
+            PipelineRun.run_date.desc()
+        ).limit(cls.HISTORY_RUNS).all()
+
+        durations = {}
+        for stage in PIPELINE_STAGES:
+            samples = [
+                run.stage_duration(stage) for run in runs
+                if run.stage_status(stage) == 'done' and run.stage_duration(stage) is not None
+            ]
+            if len(samples) >= cls.MIN_SAMPLES:
+                durations[stage] = percentile(samples, cls.PERCENTILE)
+            else:
+                durations[stage] = cls.DEFAULT_DURATIONS[stage]
+        return durations
+
+    @classmethod
+    def plan_times(cls, journalist, durations):
+        """
+        Planned fetch and summary times ("HH:MM", or None to keep the configured time).
+
+        The summary must leave room for the summary and audio p95 before send_time,
+        the fetch for its own p95 before the (possibly planned) summary.
+        """
+        summary_needed = math.ceil((durations['summary'] + durations['audio']) / 60) + cls.MARGIN_MINUTES
+        summary_needed = min(summary_needed, cls.MAX_LEAD_MINUTES)
+        summary_lead = minutes_before_send(journalist, 'summary')
+        planned_summary = None
+        if summary_lead < summary_needed:
+            summary_lead = summary_needed
+            planned_summary = time_before_send(journalist, summary_lead)
+
+        fetch_needed = summary_lead + math.ceil(durations['fetch'] / 60) + cls.MARGIN_MINUTES
+        fetch_needed = min(fetch_needed, cls.MAX_LEAD_MINUTES)
+        planned_fetch = None
+        if minutes_before_send(journalist, 'fetch') < fetch_needed:
+            planned_fetch = time_before_send(journalist, fetch_needed)
+
+        return {'fetch': planned_fetch, 'summary': planned_summary}
+
+    @classmethod
+    def replan(cls, journalist):
+        """
+        Update the journalist's planned times from its history. Must run inside an app context.
+
+        Returns:
+            bool: True if a planned time changed (the cron triggers must be rescheduled)
+        """
+        from models import db
+
+        planned = cls.plan_times(journalist, cls.durations(journalist.id))
+        changed = False
+        for stage, value in planned.items():
+            if getattr(journalist, f"planned_{stage}_time") != value:
+                setattr(journalist, f"planned_{stage}_time", value)
+                changed = True
+        if changed:
+            db.session.commit()
+            logger.info(f"Planned {journalist.name} back from send {journalist.send_time}: "
+                        f"fetch {planned['fetch'] or journalist.fetch_time}, summary {planned['summary'] or journalist.summary_time}")
+        return changed
+
+    @classmethod
+    def predict_delivery(cls, run, stage, durations, now=None):
+        """
+        Delivery time (UTC) predicted when a stage starts: the remaining stages' p95
+        from now, not before the send gate, plus the send p95.
+        """
+        from models.pipeline_run import PIPELINE_STAGES
+
+        now = now or datetime.utcnow()
+        remaining = PIPELINE_STAGES[PIPELINE_STAGES.index(stage):PIPELINE_STAGES.index('send')]
+        ready_at = now + timedelta(seconds=sum(durations[s] for s in remaining))
+        if run.deadline_at and ready_at < run.deadline_at:
+            ready_at = run.deadline_at
+        return ready_at + timedelta(seconds=durations['send'])
+
+    @classmethod
+    def report(cls, journalist_ids=None):
+        """
+        Per active journalist: configured and planned times, learnt durations, and
+        predicted versus actual delivery latency (seconds after send_time) of recent runs.
+        """
+        from models import Journalist, PipelineRun
+
+        query = Journalist.query.filter_by(is_active=True)
+        if journalist_ids is not None:
+            query = query.filter(Journalist.id.in_(journalist_ids))
+
+        report = []
+        for journalist in query.order_by(Journalist.id).all():
+            runs = PipelineRun.query.filter_by(journalist_id=journalist.id).order_by(
+                PipelineRun.run_date.desc()
+            ).limit(cls.HISTORY_RUNS).all()
+            delivered = [run for run in runs if run.delivery_latency() is not None]
+            errors = [
+                abs(run.predicted_latency() - run.delivery_latency())
+                for run in delivered if run.predicted_latency() is not None
+            ]
+            report.append({
+                'journalist_id': journalist.id,
+                'name': journalist.name,
+                'timezone': journalist.timezone,
+                'configured': {
+                    'fetch': journalist.fetch_time,
+                    'summary': journalist.summary_time,
+                    'send': journalist.send_time
+                },
+                'planned': {
+                    'fetch': journalist.planned_fetch_time,
+                    'summary': journalist.planned_summary_time
+                },
+                'p95_seconds': cls.durations(journalist.id),
+                'on_time': sum(1 for run in delivered if run.delivery_latency() <= 0),
+                'late': sum(1 for run in delivered if run.delivery_latency() > 0),
+                'mean_prediction_error': sum(errors) / len(errors) if errors else None,
+                'runs': [
+                    {
+                        'run_date': run.run_date.isoformat(),
+                        'status': run.status,
+                        'deadline_at': run.deadline_at.isoformat() if run.deadline_at else None,
+                        'predicted_latency': run.predicted_latency(),
+                        'actual_latency': run.delivery_latency()
+                    }
+                    for run in runs
+                ]
+            })
+        return report
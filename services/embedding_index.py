@@ -0,0 +1,437 @@
+"""
+Per-journalist vector index of article embeddings, for semantic Q&A retrieval.
+
+Keyword ranking (SearchIndex) misses paraphrases and translations ("strikes"
+against articles about "greve"); embeddings do not. Each article representative
+is embedded once (title and digest) by the configured backend:
+
+    gemini   Gemini embedding endpoint (GEMINI_API_KEY)
+    openai   OpenAI embeddings endpoint (OPENAI_API_KEY)
+    local    sentence-transformers model on this machine, if installed
+    hashing  feature-hashing stub, no model nor network (development, tests)
+
+EMBEDDING_BACKEND=auto picks the first available model in that order, never
+the hashing stub, and leaves the index off when none is; off disables the
+index. Vectors are L2-normalized and appended as float16 rows to a
+memory-mapped file per journalist in EMBEDDINGS_DIR, next to the article ids of
+the rows, so a query reads the matrix from the page cache and scores it with
+chunked matrix products (cosine similarity) and a partial sort for the top k;
+hits below the backend's minimum similarity are dropped, so an off-topic
+question gets no semantic matches rather than the least distant articles.
+Changing the backend or model rebuilds the files.
+
+The files are local to each node: every node runs its own embed_pending job
+(one process at a time per node) and embeds every article itself, so remote
+backends are billed once per node. Nodes sharing EMBEDDINGS_DIR (network
+volume) share the work instead.
+"""
+import os
+import json
+import zlib
+import fcntl
+import logging
+import numpy as np
+from utils.text import search_terms
+
+logger = logging.getLogger(__name__)
+
+EMBEDDINGS_DIR = os.environ.get('EMBEDDINGS_DIR', 'data/embeddings')
+EMBEDDING_BACKEND = os.environ.get('EMBEDDING_BACKEND', 'auto').lower()
+# Overrides the backend's min_similarity
+EMBEDDING_MIN_SIMILARITY = os.environ.get('EMBEDDING_MIN_SIMILARITY')
+ARTICLE_TEXT_LENGTH = 1000
+
+class HashingEmbedder:
+    """Signed feature hashing of search terms and their trigrams; deterministic, no model."""
+    name = 'hashing'
+    model = 'terms-trigrams'
+    dim = 512
+    # Unrelated texts score up to ~0.15 through hash collisions
+    min_similarity = 0.2
+
+    @classmethod
+    def available(cls):
+        return True
+
+    @classmethod
+    def embed(cls, texts, query=False):
+        vectors = np.zeros((len(texts), cls.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for term in search_terms(text or ''):
+                padded = f"#{term}#"
+                features = [term] + [padded[i:i + 3] for i in range(len(padded) - 2)]
+                for feature in features:
+                    digest = zlib.crc32(feature.encode('utf-8'))
+                    vectors[row, digest % cls.dim] += 1.0 if digest & 0x80000000 else -1.0
+        return vectors
+
+class GeminiEmbedder:
+    name = 'gemini'
+    model = os.environ.get('GEMINI_EMBEDDING_MODEL', 'gemini-embedding-001')
+    dim = 768
+    min_similarity = 0.5
+    BATCH = 100
+
+    @classmethod
+    def available(cls):
+        return bool(os.environ.get('GEMINI_API_KEY'))
+
+    @classmethod
+    def embed(cls, texts, query=False):
+        from google.genai import types
+        from services.ai_service import AIService
+        from services.provider_limits import ProviderLimits
+
+        client = AIService.get_client()
+        config = types.EmbedContentConfig(
+            task_type='RETRIEVAL_QUERY' if query else 'RETRIEVAL_DOCUMENT',
+            output_dimensionality=cls.dim
+        )
+        vectors = []
+        for start in range(0, len(texts), cls.BATCH):
+            with ProviderLimits.slot('gemini'):
+                result = client.models.embed_content(
+                    model=cls.model, contents=texts[start:start + cls.BATCH], config=config
+                )
+            vectors.extend(embedding.values for embedding in result.embeddings)
+        return np.asarray(vectors, dtype=np.float32)
+
+class OpenAIEmbedder:
+    name = 'openai'
+    model = os.environ.get('OPENAI_EMBEDDING_MODEL', 'text-embedding-3-small')
+    dim = 512
+    min_similarity = 0.3
+    API_URL = "https://api.openai.com/v1/embeddings"
+    BATCH = 256
+
+    @classmethod
+    def available(cls):
+        return bool(os.environ.get('OPENAI_API_KEY'))
+
+    @classmethod
+    def embed(cls, texts, query=False):
+        from services.http_client import HttpClient
+        from services.provider_limits import ProviderLimits
+
+        headers = {
+            "Authorization": f"Bearer {os.environ.get('OPENAI_API_KEY')}",
+            "Content-Type": "application/json"
+        }
+        vectors = []
+        for start in range(0, len(texts), cls.BATCH):
+            data = {"model": cls.model, "input": texts[start:start + cls.BATCH], "dimensions": cls.dim}
+            with ProviderLimits.slot('openai'):
+                response = HttpClient.post(cls.API_URL, headers=headers, json=data, timeout=60)
+            response.raise_for_status()
+            items = sorted(response.json().get('data', []), key=lambda item: item['index'])
+            vectors.extend(item['embedding'] for item in items)
+        return np.asarray(vectors, dtype=np.float32)
+
+class LocalEmbedder:
+    """sentence-transformers model, multilingual by default; optional dependency."""
+    name = 'local'
+    model = os.environ.get('LOCAL_EMBEDDING_MODEL', 'paraphrase-multilingual-MiniLM-L12-v2')
+    dim = None
+    min_similarity = 0.3
+    _model = None
+
+    @classmethod
+    def available(cls):
+        try:
+            import sentence_transformers  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    @classmethod
+    def _load(cls):
+        if cls._model is None:
+            from sentence_transformers import SentenceTransformer
+            cls._model = SentenceTransformer(cls.model)
+            cls.dim = cls._model.get_sentence_embedding_dimension()
+        return cls._model
+
+    @classmethod
+    def embed(cls, texts, query=False):
+        return np.asarray(cls._load().encode(list(texts), batch_size=32), dtype=np.float32)
+
+BACKENDS = {
+    backend.name: backend for backend in (GeminiEmbedder, OpenAIEmbedder, LocalEmbedder, HashingEmbedder)
+}
+
+def normalize(vectors):
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+class EmbeddingIndex:
+    BATCH_SIZE = int(os.environ.get('EMBEDDING_BATCH_SIZE', 128))
+    # Runs a batch may fail before its articles are embedded one by one, failures skipped
+    MAX_BATCH_FAILURES = 3
+    # Rows scored per matrix product, bounds the float32 copy of the float16 rows
+    SEARCH_CHUNK = 65536
+
+    _backend = None
+    _resolved = False
+    # journalist id -> (first article id of the failing batch, consecutive failed runs)
+    _failures = {}
+
+    @classmethod
+    def backend(cls):
+        """Configured embedder class, or None when the index is disabled or no model is available."""
+        if not cls._resolved:
+            cls._resolved = True
+            if EMBEDDING_BACKEND == 'off':
+                return None
+            if EMBEDDING_BACKEND in BACKENDS:
+                cls._backend = BACKENDS[EMBEDDING_BACKEND]
+            else:
+                # The hashing stub only matches shared words: it must be asked for by name
+                cls._backend = next((backend for backend in BACKENDS.values()
+                                     if backend is not HashingEmbedder and backend.available()), None)
+                if cls._backend is None:
+                    logger.warning("Embedding index off: no embedding backend available "
+                                   "(GEMINI_API_KEY, OPENAI_API_KEY or sentence-transformers)")
+                    return None
+            logger.info(f"Embedding index: {cls._backend.name} backend ({cls._backend.model})")
+        return cls._backend
+
+    @classmethod
+    def enabled(cls) -> bool:
+        return cls.backend() is not None
+
+    @classmethod
+    def min_similarity(cls) -> float:
+        if EMBEDDING_MIN_SIMILARITY:
+            return float(EMBEDDING_MIN_SIMILARITY)
+        return cls.backend().min_similarity
+
+    # Storage
+
+    @staticmethod
+    def _paths(journalist_id):
+        base = os.path.join(EMBEDDINGS_DIR, f"journalist_{journalist_id}")
+        return {
+            'vectors': base + '.f16',
+            'ids': base + '.ids',
+            'meta': base + '.json',
+            'lock': base + '.lock'
+        }
+
+    @classmethod
+    def _signature(cls):
+        backend = cls.backend()
+        return {'backend': backend.name, 'model': backend.model}
+
+    @classmethod
+    def _read_meta(cls, paths):
+        try:
+            with open(paths['meta']) as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if {key: meta.get(key) for key in ('backend', 'model')} != cls._signature():
+            return None
+        return meta
+
+    @classmethod
+    def load(cls, journalist_id):
+        """
+        Memory-mapped vectors of a journalist and their article ids.
+
+        Returns:
+            (ids, vectors): int64 array and float16 (n, dim) memmap, or (None, None)
+        """
+        paths = cls._paths(journalist_id)
+        meta = cls._read_meta(paths)
+        if meta is None or not meta.get('count'):
+            return None, None
+        count, dim = meta['count'], meta['dim']
+        # Rows beyond count belong to an append in progress
+        ids = np.fromfile(paths['ids'], dtype=np.int64, count=count)
+        vectors = np.memmap(paths['vectors'], dtype=np.float16, mode='r', shape=(count, dim))
+        return ids, vectors
+
+    @classmethod
+    def append(cls, journalist_id, article_ids, vectors):
+        """Append normalized vectors; the meta file is written last so readers only see complete rows."""
+        os.makedirs(EMBEDDINGS_DIR, exist_ok=True)
+        paths = cls._paths(journalist_id)
+        with open(paths['lock'], 'w') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            meta = cls._read_meta(paths)
+            if meta is None or meta.get('dim') != vectors.shape[1]:
+                # New index, or built by another backend: start over
+                meta = dict(cls._signature(), dim=int(vectors.shape[1]), count=0, last_article_id=0)
+            mode = 'r+b' if meta['count'] else 'wb'
+            for key, data in (('vectors', vectors.astype(np.float16)),
+                              ('ids', np.asarray(article_ids, dtype=np.int64))):
+                with open(paths[key], mode) as f:
+                    f.seek(meta['count'] * data.itemsize * (data.shape[1] if data.ndim > 1 else 1))
+                    f.truncate()
+                    f.write(data.tobytes())
+            meta['count'] += len(article_ids)
+            meta['last_article_id'] = max(meta['last_article_id'], int(max(article_ids)))
+            with open(paths['meta'] + '.tmp', 'w') as f:
+                json.dump(meta, f)
+            os.replace(paths['meta'] + '.tmp', paths['meta'])
+
+    @classmethod
+    def last_article_id(cls, journalist_id) -> int:
+        meta = cls._read_meta(cls._paths(journalist_id))
+        return meta['last_article_id'] if meta else 0
+
+    # Indexing
+
+    @staticmethod
+    def article_text(article) -> str:
+        body = article.summary or (article.content or '')[:ARTICLE_TEXT_LENGTH]
+        return f"{article.title or ''}\n{body}".strip()
+
+    @classmethod
+    def _embed_batch(cls, backend, journalist_id, articles):
+        """Normalized vectors of a batch; after MAX_BATCH_FAILURES failed runs, see _embed_each."""
+        first_id, failures = cls._failures.get(journalist_id, (None, 0))
+        if first_id != articles[0].id:
+            failures = 0
+        try:
+            vectors = normalize(backend.embed([cls.article_text(article) for article in articles]))
+        except Exception as e:
+            failures += 1
+            cls._failures[journalist_id] = (articles[0].id, failures)
+            if failures < cls.MAX_BATCH_FAILURES:
+                raise
+            # Counted again from zero if the backend itself is down
+            cls._failures.pop(journalist_id)
+            vectors = cls._embed_each(backend, articles, e)
+        cls._failures.pop(journalist_id, None)
+        return vectors
+
+    @classmethod
+    def _embed_each(cls, backend, articles, batch_error):
+        """
+        Vectors of a batch that keeps failing, embedded one article at a time. Articles
+        that still fail get a zero row: never matched by a query, and not retried.
+        Raises the batch error when no article can be embedded (backend down).
+        """
+        rows = []
+        for article in articles:
+            try:
+                rows.append(normalize(backend.embed([cls.article_text(article)]))[0])
+            except Exception:
+                rows.append(None)
+        embedded = [row for row in rows if row is not None]
+        if not embedded:
+            raise batch_error
+        skipped = [article.id for article, row in zip(articles, rows) if row is None]
+        if skipped:
+            logger.warning(f"Embedding index: articles {skipped} skipped after errors ({batch_error})")
+        zero = np.zeros_like(embedded[0])
+        return np.stack([zero if row is None else row for row in rows])
+
+    @classmethod
+    def embed_pending(cls) -> int:
+        """Embed the article representatives added since the last run, per journalist. Returns the number embedded."""
+        from models import Article, Journalist
+
+        backend = cls.backend()
+        if backend is None:
+            return 0
+
+        total = 0
+        for journalist in Journalist.query.all():
+            last_id = cls.last_article_id(journalist.id)
+            while True:
+                articles = Article.query.filter(
+                    Article.journalist_id == journalist.id,
+                    Article.id > last_id,
+                    Article.representatives()
+                ).order_by(Article.id).limit(cls.BATCH_SIZE).all()
+                if not articles:
+                    break
+                try:
+                    vectors = cls._embed_batch(backend, journalist.id, articles)
+                except Exception as e:
+                    # Retried on the next run; the other journalists go on
+                    logger.error(f"Embedding failed for journalist {journalist.id}: {e}")
+                    break
+                cls.append(journalist.id, [article.id for article in articles], vectors)
+                last_id = articles[-1].id
+                total += len(articles)
+
+        if total:
+            logger.info(f"Embedding index: {total} articles embedded")
+        return total
+
+    @classmethod
+    def run_pending(cls):
+        """
+        Scheduler entry point, on every node: embed_pending inside the app context.
+        Skipped while another process of the node (or sharing EMBEDDINGS_DIR) runs it.
+        """
+        from app import app
+
+        if cls.backend() is None:
+            return 0
+        os.makedirs(EMBEDDINGS_DIR, exist_ok=True)
+        with open(os.path.join(EMBEDDINGS_DIR, 'embed_pending.lock'), 'w') as lock:
+            try:
+                fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return 0
+            with app.app_context():
+                try:
+                    return cls.embed_pending()
+                except Exception as e:
+                    logger.error(f"Error embedding articles: {e}")
+
+    # Retrieval
+
+    @classmethod
+    def top_k(cls, vectors, query_vector, k):
+        """Indices and cosine scores of the k rows closest to a normalized query vector, best first."""
+        scores = np.empty(len(vectors), dtype=np.float32)
+        for start in range(0, len(vectors), cls.SEARCH_CHUNK):
+            chunk = np.asarray(vectors[start:start + cls.SEARCH_CHUNK], dtype=np.float32)
+            scores[start:start + len(chunk)] = chunk @ query_vector
+        k = min(k, len(scores))
+        best = np.argpartition(-scores, k - 1)[:k]
+        best = best[np.argsort(-scores[best])]
+        return best, scores[best]
+
+    @classmethod
+    def embed_query(cls, query: str):
+        """Normalized query vector of a question, or None if disabled, empty or on error."""
+        backend = cls.backend()
+        if backend is None or not (query or '').strip():
+            return None
+        try:
+            return normalize(backend.embed([query], query=True))[0]
+        except Exception as e:
+            logger.error(f"Query embedding failed: {e}")
+            return None
+
+    @classmethod
+    def search(cls, journalist_id: int, query: str, limit: int = 10, query_vector=None) -> list:
+        """
+        Cosine ranking of a journalist's embedded articles for a free-text query,
+        without the articles scoring under min_similarity.
+        query_vector (embed_query) avoids embedding a question already embedded by the caller.
+
+        Returns:
+            list: (article_id, score) pairs, best first; empty if disabled or on error
+        """
+        if cls.backend() is None or not (query or '').strip():
+            return []
+        ids, vectors = cls.load(journalist_id)
+        if ids is None:
+            return []
+
+        if query_vector is None:
+            query_vector = cls.embed_query(query)
+        if query_vector is None or query_vector.shape[0] != vectors.shape[1]:
+            return []
+
+        rows, scores = cls.top_k(vectors, query_vector, limit)
+        threshold = cls.min_similarity()
+        return [(int(ids[row]), float(score)) for row, score in zip(rows, scores) if score >= threshold]
@@ -0,0 +1,222 @@
+"""
+Background enrichment of stored articles.
+Ingestion inserts articles as 'pending'; this worker picks them up in batches and
+fills keywords and a short per-article summary with bounded concurrency, so a
+stalled AI provider only delays enrichment and never an article insert.
+"""
+import os
+import logging
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+class EnrichmentService:
+    BATCH_SIZE = int(os.environ.get('ENRICHMENT_BATCH_SIZE', 50))
+    MAX_WORKERS = int(os.environ.get('ENRICHMENT_MAX_WORKERS', 4))
+    MAX_ATTEMPTS = int(os.environ.get('ENRICHMENT_MAX_ATTEMPTS', 3))
+
+    @staticmethod
+    def _job_text(job: dict) -> str:
+        return f"{job['title']} {job['content'] or ''}"
+
+    @staticmethod
+    def _enrich(job: dict) -> dict:
+        """
+        Compute local keywords and summary for one article.
+        Runs in a worker thread on plain data, without touching the DB session.
+        """
+        from services.keyword_service import KeywordService
+
+        result = {'id': job['id'], 'keywords': None, 'summary': None, 'error': None}
+        try:
+            result['summary'] = KeywordService.extract_summary(job['content'] or job['title'], job['language'])
+            result['keywords'] = KeywordService.extract_keywords(EnrichmentService._job_text(job), job['language'])
+        except Exception as e:
+            result['error'] = str(e)
+        return result
+
+    @staticmethod
+    def _enrich_ai_group(jobs: list) -> list:
+        """
+        Enrich articles of journalists sharing a provider and model.
+        Keywords come from one batched LLM extraction; summaries stay local.
+        """
+        from services.ai_service import AIService
+        from services.keyword_service import KeywordService
+
+        provider, model = jobs[0]['provider'], jobs[0]['model']
+        try:
+            # The provider request takes its ProviderLimits slot itself
+            keywords = AIService.extract_keywords_batch(
+                [(job['id'], EnrichmentService._job_text(job)) for job in jobs], provider, model
+            )
+            error = None
+        except Exception as e:
+            keywords, error = {}, str(e)
+
+        results = []
+        for job in jobs:
+            result = {'id': job['id'], 'keywords': keywords.get(job['id']), 'summary': None, 'error': error}
+            try:
+                result['summary'] = KeywordService.extract_summary(job['content'] or job['title'], job['language'])
+            except Exception as e:
+                result['error'] = str(e)
+            if not result['keywords'] and result['error'] is None:
+                result['error'] = f"{provider} returned no keywords"
+            results.append(result)
+        return results
+
+    @staticmethod
+    def _fallback_keywords(job: dict) -> list:
+        from services.keyword_service import KeywordService
+        return KeywordService.extract_keywords(EnrichmentService._job_text(job), job['language'])
+
+    @classmethod
+    def enrich_pending(cls, batch_size: int = None) -> dict:
+        """
+        Enrich one batch of pending articles.
+
+        Args:
+            batch_size: Maximum number of articles taken from the queue
+
+        Returns:
+            dict: Counts of articles marked done, retried and failed
+        """
+        from models import db, Article, Journalist
+
+        rows = db.session.query(Article, Journalist).join(
+            Journalist, Article.journalist_id == Journalist.id
+        ).filter(
+            Article.enrichment_status == 'pending'
+        ).order_by(Article.fetched_at).limit(batch_size or cls.BATCH_SIZE).all()
+
+        counts = {'done': 0, 'retried': 0, 'failed': 0}
+        if not rows:
+            return counts
+
+        jobs = {
+            article.id: {
+                'id': article.id,
+                'title': article.title,
+                'content': article.content,
+                'language': journalist.language,
+                'keyword_mode': journalist.keyword_mode or 'local',
+                'provider': journalist.ai_provider,
+                'model': journalist.ai_model
+            }
+            for article, journalist in rows
+        }
+        articles = {article.id: article for article, _ in rows}
+
+        # Release the connection while providers are called
+        db.session.commit()
+
+        # AI-mode articles are grouped per provider/model so each group costs a few batched requests
+        ai_groups = {}
+        local_jobs = []
+        for job in jobs.values():
+            if job['keyword_mode'] == 'ai':
+                ai_groups.setdefault((job['provider'], job['model']), []).append(job)
+            else:
+                local_jobs.append(job)
+
+        with ThreadPoolExecutor(max_workers=cls.MAX_WORKERS) as executor:
+            group_futures = [executor.submit(cls._enrich_ai_group, group) for group in ai_groups.values()]
+            results = list(executor.map(cls._enrich, local_jobs))
+            for future in group_futures:
+                results.extend(future.result())
+
+        for result in results:
+            article = articles[result['id']]
+            article.enrichment_attempts = (article.enrichment_attempts or 0) + 1
+            if result['summary'] is not None:
+                article.summary = result['summary']
+
+            if result['error'] is None:
+                article.keywords = ','.join(result['keywords'])
+                article.enrichment_status = 'done'
+                article.enrichment_error = None
+                article.enriched_at = datetime.utcnow()
+                counts['done'] += 1
+                continue
+
+            article.enrichment_error = result['error']
+            if article.enrichment_attempts >= cls.MAX_ATTEMPTS:
+                # Keep the article searchable with local keywords; the admin can retry later
+                article.keywords = ','.join(cls._fallback_keywords(jobs[result['id']]))
+                article.enrichment_status = 'failed'
+                article.enriched_at = datetime.utcnow()
+                counts['failed'] += 1
+            else:
+                counts['retried'] += 1
+
+        db.session.commit()
+        logger.info(f"Enrichment batch: {counts['done']} done, {counts['retried']} to retry, {counts['failed']} failed")
+        return counts
+
+    @classmethod
+    def run_pending(cls):
+        """Task entry point: enrich one batch inside the app context. Returns the batch counts."""
+        from app import app
+
+        with app.app_context():
+            try:
+                return cls.enrich_pending()
+            except Exception as e:
+                logger.error(f"Error enriching articles: {e}")
+
+    @staticmethod
+    def prompt_articles(articles: list, with_url: bool = False) -> list:
+        """
+        Articles as sent to LLM prompts: the stored digest (Article.summary) instead of
+        the raw content. Articles not enriched yet get a digest computed on the spot.
+        """
+        from services.keyword_service import KeywordService
+
+        data = []
+        for article in articles:
+            digest = article.summary
+            if not digest:
+                language = article.journalist.language if article.journalist else None
+                digest = KeywordService.extract_summary(article.content or article.title, language)
+            item = {
+                'title': article.title,
+                'content': digest or article.title,
+                'source': article.source.name if article.source else 'Unknown'
+            }
+            if with_url:
+                item['url'] = article.url
+            data.append(item)
+        return data
+
+    @staticmethod
+    def status_counts(journalist_id: int) -> dict:
+        """Number of articles per enrichment status for a journalist."""
+        from sqlalchemy import func
+        from models import db, Article
+
+        rows = db.session.query(Article.enrichment_status, func.count(Article.id)).filter(
+            Article.journalist_id == journalist_id
+        ).group_by(Article.enrichment_status).all()
+
+        counts = {'pending': 0, 'done': 0, 'failed': 0}
+        for status, count in rows:
+            # Rows written before the status column existed count as done
+            counts[status or 'done'] = counts.get(status or 'done', 0) + count
+        return counts
+
+    @staticmethod
+    def retry_failed(journalist_id: int) -> int:
+        """Put a journalist's failed articles back in the queue. Returns the number reset."""
+        from models import db, Article
+
+        reset = Article.query.filter_by(
+            journalist_id=journalist_id, enrichment_status='failed'
+        ).update({
+            'enrichment_status': 'pending',
+            'enrichment_attempts': 0,
+            'enrichment_error': None
+        }, synchronize_session=False)
+        db.session.commit()
+        return reset
@@ -0,0 +1,148 @@
+"""
+Shared HTTP client for every outbound call (scrapers, AI providers, Eleven Labs,
+settings checks). One requests Session keeps pooled keep-alive connections per
+host, retries 429/5xx with jittered exponential backoff, and records per-host
+latency so slow upstreams are visible from /api/http/metrics. POST requests
+(paid LLM and Eleven Labs calls) are only retried when the server cannot have
+processed them: connection failures, 429 and 503.
+"""
+import os
+import time
+import logging
+import threading
+from collections import deque
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+try:
+    import brotli  # noqa: F401 - lets urllib3 decode 'br' responses
+    ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    ACCEPT_ENCODING = 'gzip, deflate'
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+RETRY_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS'})
+# Statuses meaning a non-idempotent request was rejected before being processed
+POST_RETRY_STATUSES = (429, 503)
+LATENCY_SAMPLES = 200
+
+class HttpClient:
+    POOL_CONNECTIONS = int(os.environ.get('HTTP_POOL_CONNECTIONS', 32))
+    POOL_MAXSIZE = int(os.environ.get('HTTP_POOL_MAXSIZE', 16))
+    RETRIES = int(os.environ.get('HTTP_RETRIES', 3))
+    BACKOFF_FACTOR = float(os.environ.get('HTTP_BACKOFF_FACTOR', 0.5))
+    BACKOFF_JITTER = float(os.environ.get('HTTP_BACKOFF_JITTER', 0.5))
+
+    _sessions = {}
+    _metrics = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def _build_retry(cls, retries: int, idempotent: bool = True) -> Retry:
+        options = dict(
+            total=retries,
+            backoff_factor=cls.BACKOFF_FACTOR,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=RETRY_METHODS,
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        if not idempotent:
+            # A read error or a 5xx may come after the request was processed (and billed)
+            options.update(read=0, other=0, status_forcelist=POST_RETRY_STATUSES,
+                           allowed_methods=RETRY_METHODS | {'POST'})
+        try:
+            return Retry(backoff_jitter=cls.BACKOFF_JITTER, **options)
+        except TypeError:
+            # urllib3 < 2 has no jitter option
+            return Retry(**options)
+
+    @classmethod
+    def get_session(cls, retry: bool = True, idempotent: bool = True) -> requests.Session:
+        """
+        Pooled session; retry=False gives one without automatic retries,
+        idempotent=False one that only retries requests that were not processed.
+        """
+        key = (retry, idempotent or not retry)
+        with cls._lock:
+            session = cls._sessions.get(key)
+            if session is None:
+                adapter = HTTPAdapter(
+                    pool_connections=cls.POOL_CONNECTIONS,
+                    pool_maxsize=cls.POOL_MAXSIZE,
+                    max_retries=cls._build_retry(cls.RETRIES if retry else 0, key[1])
+                )
+                session = requests.Session()
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                session.headers['Accept-Encoding'] = ACCEPT_ENCODING
+                cls._sessions[key] = session
+            return session
+
+    @classmethod
+    def _record(cls, host: str, duration_ms: float, error: bool):
+        with cls._lock:
+            stats = cls._metrics.get(host)
+            if stats is None:
+                stats = cls._metrics[host] = {
+                    'requests': 0,
+                    'errors': 0,
+                    'total_ms': 0.0,
+                    'max_ms': 0.0,
+                    'samples': deque(maxlen=LATENCY_SAMPLES)
+                }
+            stats['requests'] += 1
+            stats['errors'] += int(error)
+            stats['total_ms'] += duration_ms
+            stats['max_ms'] = max(stats['max_ms'], duration_ms)
+            stats['samples'].append(duration_ms)
+
+    @classmethod
+    def request(cls, method: str, url: str, retry: bool = True, **kwargs) -> requests.Response:
+        """
+        Send a request through the shared pool.
+        Arguments are those of requests.request; the timeout defaults to 30s.
+        Durations include retries, so they reflect what callers actually wait.
+        Only GET, HEAD and OPTIONS get the full retry policy (see _build_retry).
+        """
+        kwargs.setdefault('timeout', 30)
+        host = urlsplit(url).netloc.lower()
+        start = time.perf_counter()
+        error = True
+        try:
+            response = cls.get_session(retry, method.upper() in RETRY_METHODS).request(method, url, **kwargs)
+            error = response.status_code >= 500 or response.status_code == 429
+            return response
+        finally:
+            cls._record(host, (time.perf_counter() - start) * 1000, error)
+
+    @classmethod
+    def get(cls, url: str, **kwargs) -> requests.Response:
+        return cls.request('GET', url, **kwargs)
+
+    @classmethod
+    def post(cls, url: str, **kwargs) -> requests.Response:
+        return cls.request('POST', url, **kwargs)
+
+    @classmethod
+    def metrics(cls) -> dict:
+        """Per-host request count, error count and latency percentiles in milliseconds."""
+        with cls._lock:
+            snapshot = {host: dict(stats, samples=sorted(stats['samples'])) for host, stats in cls._metrics.items()}
+
+        result = {}
+        for host, stats in snapshot.items():
+            samples = stats['samples']
+            result[host] = {
+                'requests': stats['requests'],
+                'errors': stats['errors'],
+                'avg_ms': round(stats['total_ms'] / stats['requests'], 1),
+                'p50_ms': round(samples[len(samples) // 2], 1),
+                'p95_ms': round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 1),
+                'max_ms': round(stats['max_ms'], 1)
+            }
+        return result
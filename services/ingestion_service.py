@@ -0,0 +1,149 @@
+"""
+Ingestion of fetched source content into articles.
+Sources are grouped by normalized URL so a feed followed by several journalists
+is downloaded and parsed once per cycle, then fanned out to each of them.
+Articles are stored immediately as 'pending'; keywords and summaries are added
+later by EnrichmentService so a slow AI provider never holds a fetch open.
+Near-duplicates of a story already stored are linked to it by DedupService.
+"""
+import logging
+from datetime import datetime
+from utils.urls import normalize_url, url_hash
+
+logger = logging.getLogger(__name__)
+
+VALIDATOR_FIELDS = ('etag', 'last_modified', 'content_hash')
+
+class IngestionService:
+
+    @staticmethod
+    def group_sources(sources: list) -> dict:
+        """Group Source rows by (source_type, normalized URL)."""
+        groups = {}
+        for source in sources:
+            key = (source.source_type, normalize_url(source.url))
+            groups.setdefault(key, []).append(source)
+        return groups
+
+    @staticmethod
+    def _shared_validators(group: list) -> dict:
+        """
+        Return HTTP validators only if every source in the group agrees on them.
+        A source added later has no validators yet and must get a full response.
+        """
+        values = {tuple(getattr(source, field) for field in VALIDATOR_FIELDS) for source in group}
+        if len(values) != 1:
+            return {}
+        return dict(zip(VALIDATOR_FIELDS, values.pop()))
+
+    @staticmethod
+    def ingest_sources(sources: list) -> dict:
+        """
+        Fetch the given sources and store new articles for their journalists.
+
+        Args:
+            sources: Active Source rows, possibly from several journalists
+
+        Returns:
+            dict: journalist_id -> number of new articles
+        """
+        from models import db, Article
+        from services.fetch_engine import FetchEngine
+        from services.dedup_service import DedupService
+        from services.search_index import SearchIndex
+
+        groups = IngestionService.group_sources(sources)
+        if not groups:
+            return {}
+
+        results = FetchEngine.fetch_all([
+            {
+                'key': key,
+                'source_type': group[0].source_type,
+                'url': group[0].url,
+                'validators': IngestionService._shared_validators(group)
+            }
+            for key, group in groups.items()
+        ])
+
+        logger.info(f"Ingesting {len(sources)} sources from {len(groups)} unique URLs")
+
+        added = {}
+        duplicates = 0
+        # Near-duplicate indexes, loaded once per journalist per cycle
+        indexes = {}
+
+        for key, group in groups.items():
+            result = results[key]
+            hashes = [url_hash(data['url']) for data in result['articles']]
+            fingerprints = [DedupService.fingerprint(data['title'], data['content']) for data in result['articles']]
+
+            for source in group:
+                journalist = source.journalist
+                added.setdefault(journalist.id, 0)
+
+                new_articles = []
+                indexed = []
+                if journalist.id not in indexes:
+                    indexes[journalist.id] = DedupService.load_index(journalist.id)
+                index = indexes[journalist.id]
+                try:
+                    if result['error']:
+                        raise RuntimeError(result['error'])
+
+                    # One set-based lookup for the whole batch; also skips repeats within the batch
+                    seen = Article.existing_url_hashes(journalist.id, hashes)
+
+                    for data, data_hash, fingerprint in zip(result['articles'], hashes, fingerprints):
+                        if data_hash:
+                            if data_hash in seen:
+                                continue
+                            seen.add(data_hash)
+
+                        article = Article(
+                            journalist_id=journalist.id,
+                            source_id=source.id,
+                            title=data['title'],
+                            content=data['content'],
+                            url=data['url'],
+                            url_hash=data_hash,
+                            author=data['author'],
+                            published_at=data['published_at'],
+                            language=journalist.language,
+                            enrichment_status='pending'
+                        )
+                        db.session.add(article)
+                        new_articles.append((article, fingerprint))
+
+                    # Ids are needed to link duplicates; one flush for the whole batch
+                    db.session.flush()
+                    for article, fingerprint in new_articles:
+                        if DedupService.assign(article, fingerprint, index):
+                            duplicates += 1
+                        else:
+                            indexed.append(article.id)
+                    # Postings of the search index, in the same transaction as the articles
+                    SearchIndex.add_articles(
+                        [article for article, _ in new_articles if article.duplicate_of is None],
+                        journalist.language
+                    )
+
+                    for field in VALIDATOR_FIELDS:
+                        setattr(source, field, result['validators'][field])
+                    source.last_fetched_at = datetime.utcnow()
+                    source.fetch_count += 1
+                    db.session.commit()
+                    added[journalist.id] += len(new_articles)
+
+                except Exception as e:
+                    db.session.rollback()
+                    for article_id in indexed:
+                        index.remove(article_id)
+                    source.error_count += 1
+                    source.last_error = str(e)
+                    db.session.commit()
+                    logger.error(f"Error fetching {source.url}: {e}")
+
+        if duplicates:
+            logger.info(f"Linked {duplicates} near-duplicate articles to existing stories")
+        return added
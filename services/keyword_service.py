@@ -0,0 +1,123 @@
+"""
+Local keyword extraction (RAKE-style) used during ingestion.
+Runs in-process with French and English stopwords, so extracting keywords for
+an article costs microseconds instead of an LLM round-trip.
+"""
+import re
+from collections import Counter
+from utils.text import WORD_RE, ELISION_RE, get_stopwords, strip_html, split_sentences
+
+# Punctuation that always ends a candidate phrase
+PHRASE_BREAK_RE = re.compile(r'[.,;:!?()\[\]{}"«»“”|/\\\n\r\t–—…]+')
+
+class KeywordService:
+    MAX_KEYWORDS = 10
+    MAX_PHRASE_WORDS = 3
+    MAX_TEXT_LENGTH = 5000
+    SUMMARY_MAX_SENTENCES = 2
+    SUMMARY_MAX_LENGTH = 400
+
+    @staticmethod
+    def _candidate_phrases(text: str, stopwords: set) -> list:
+        """Split text into runs of content words, broken by stopwords and punctuation."""
+        phrases = []
+        for fragment in PHRASE_BREAK_RE.split(text):
+            current = []
+            for match in WORD_RE.finditer(fragment):
+                word = ELISION_RE.sub('', match.group(0))
+                if len(word) < 2 or word.lower() in stopwords:
+                    if current:
+                        phrases.append(current)
+                        current = []
+                    continue
+                current.append(word)
+                if len(current) == KeywordService.MAX_PHRASE_WORDS:
+                    phrases.append(current)
+                    current = []
+            if current:
+                phrases.append(current)
+        return phrases
+
+    @staticmethod
+    def _word_scores(phrases: list) -> dict:
+        """RAKE word score: degree / frequency favours words that appear inside phrases."""
+        frequency = Counter()
+        degree = Counter()
+        for phrase in phrases:
+            for word in phrase:
+                key = word.lower()
+                frequency[key] += 1
+                degree[key] += len(phrase)
+        return {word: degree[word] / frequency[word] for word in frequency}
+
+    @staticmethod
+    def extract_keywords(text: str, language: str = None, max_keywords: int = None) -> list:
+        """
+        Extract the main keywords and key phrases of a text.
+
+        Args:
+            text: Article title and content (HTML is stripped)
+            language: Journalist language ('fr', 'en'); other values use both stopword lists
+            max_keywords: Maximum number of keywords returned
+
+        Returns:
+            list: Keywords ordered by score, best first
+        """
+        max_keywords = max_keywords or KeywordService.MAX_KEYWORDS
+        text = strip_html(text)[:KeywordService.MAX_TEXT_LENGTH]
+        if not text.strip():
+            return []
+
+        phrases = KeywordService._candidate_phrases(text, get_stopwords(language))
+
+        word_scores = KeywordService._word_scores(phrases)
+
+        scores = {}
+        display = {}
+        for phrase in phrases:
+            key = ' '.join(word.lower() for word in phrase)
+            if key in scores:
+                # Repeated phrases get a small boost rather than a full re-count
+                scores[key] *= 1.1
+                continue
+            scores[key] = sum(word_scores[word.lower()] for word in phrase)
+            display[key] = ' '.join(phrase)
+
+        ranked = sorted(scores, key=lambda key: scores[key], reverse=True)
+        return [display[key] for key in ranked[:max_keywords]]
+
+    @staticmethod
+    def extract_summary(text: str, language: str = None, max_sentences: int = None) -> str:
+        """
+        Build a short extractive digest: the highest-scoring sentences, in original order.
+
+        Args:
+            text: Article content (HTML is stripped)
+            language: Journalist language ('fr', 'en')
+            max_sentences: Maximum number of sentences kept
+
+        Returns:
+            str: Digest of at most SUMMARY_MAX_LENGTH characters
+        """
+        max_sentences = max_sentences or KeywordService.SUMMARY_MAX_SENTENCES
+        sentences = split_sentences(strip_html(text)[:KeywordService.MAX_TEXT_LENGTH])
+        if not sentences:
+            return ''
+
+        stopwords = get_stopwords(language)
+        word_scores = KeywordService._word_scores(
+            KeywordService._candidate_phrases(' '.join(sentences), stopwords)
+        )
+
+        def sentence_score(index):
+            words = [ELISION_RE.sub('', m.group(0)).lower() for m in WORD_RE.finditer(sentences[index])]
+            score = sum(word_scores.get(word, 0) for word in words) / (len(words) ** 0.5 or 1)
+            # Lead sentences of news articles carry the most information
+            return score * (1.5 if index == 0 else 1.0)
+
+        best = sorted(range(len(sentences)), key=sentence_score, reverse=True)[:max_sentences]
+        digest = ' '.join(sentences[i] for i in sorted(best))
+
+        if len(digest) > KeywordService.SUMMARY_MAX_LENGTH:
+            digest = digest[:KeywordService.SUMMARY_MAX_LENGTH].rsplit(' ', 1)[0] + '…'
+        return digest
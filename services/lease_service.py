@@ -0,0 +1,121 @@
+"""
+DB-backed leases for jobs that must run on a single node.
+Every gunicorn worker (and every node) starts a scheduler; a job wrapped with
+run_exclusive only runs in the process holding its lease. Leases expire unless
+renewed by heartbeat, so a crashed holder is replaced after LEASE_TTL seconds.
+"""
+import os
+import socket
+import logging
+from datetime import datetime, timedelta
+
+logger = logging.getLogger(__name__)
+
+NODE_ID = f"{socket.gethostname()}:{os.getpid()}"
+
+class LeaseService:
+    LEASE_TTL = int(os.environ.get('SCHEDULER_LEASE_TTL', 60))
+
+    _held = set()
+
+    @classmethod
+    def acquire(cls, name: str) -> bool:
+        """
+        Take or renew a lease. Succeeds if nobody holds it, this node holds it,
+        or the holder's lease expired. Must run inside an app context.
+        """
+        from sqlalchemy import or_
+        from sqlalchemy.exc import IntegrityError
+        from models import db, SchedulerLease
+
+        now = datetime.utcnow()
+        expires_at = now + timedelta(seconds=cls.LEASE_TTL)
+
+        # Conditional UPDATE: atomic on every backend, the row lock decides between nodes
+        updated = SchedulerLease.query.filter(
+            SchedulerLease.name == name,
+            or_(SchedulerLease.holder == NODE_ID, SchedulerLease.expires_at < now)
+        ).update({
+            'holder': NODE_ID,
+            'heartbeat_at': now,
+            'expires_at': expires_at
+        }, synchronize_session=False)
+        db.session.commit()
+
+        if not updated:
+            try:
+                db.session.add(SchedulerLease(name=name, holder=NODE_ID, acquired_at=now, heartbeat_at=now, expires_at=expires_at))
+                db.session.commit()
+                updated = 1
+            except IntegrityError:
+                # Another node holds a live lease
+                db.session.rollback()
+
+        if updated and name not in cls._held:
+            logger.info(f"Lease '{name}' acquired by {NODE_ID}")
+        if updated:
+            cls._held.add(name)
+        else:
+            cls._held.discard(name)
+        return bool(updated)
+
+    @classmethod
+    def release(cls, name: str):
+        from models import db, SchedulerLease
+
+        SchedulerLease.query.filter_by(name=name, holder=NODE_ID).delete(synchronize_session=False)
+        db.session.commit()
+        cls._held.discard(name)
+
+    @classmethod
+    def heartbeat(cls):
+        """Renew every lease this node holds, so it keeps them between job runs."""
+        from app import app
+
+        with app.app_context():
+            for name in list(cls._held):
+                try:
+                    if not cls.acquire(name):
+                        logger.warning(f"Lease '{name}' lost by {NODE_ID}")
+                except Exception as e:
+                    logger.error(f"Heartbeat for lease '{name}' failed: {e}")
+
+    @classmethod
+    def run_exclusive(cls, name: str, func, *args):
+        """Scheduler entry point: run func only if this node holds the lease."""
+        from app import app
+
+        with app.app_context():
+            try:
+                if not cls.acquire(name):
+                    return
+            except Exception as e:
+                logger.error(f"Could not acquire lease '{name}': {e}")
+                return
+        func(*args)
+
+    @classmethod
+    def release_all(cls):
+        from app import app
+
+        with app.app_context():
+            for name in list(cls._held):
+                try:
+                    cls.release(name)
+                except Exception as e:
+                    logger.error(f"Could not release lease '{name}': {e}")
+
+    @staticmethod
+    def holders() -> list:
+        from models import SchedulerLease
+
+        return [
+            {
+                'name': lease.name,
+                'holder': lease.holder,
+                'heartbeat_at': lease.heartbeat_at.isoformat() if lease.heartbeat_at else None,
+                'expires_at': lease.expires_at.isoformat(),
+                'local': lease.holder == NODE_ID
+            }
+            for lease in SchedulerLease.query.order_by(SchedulerLease.name).all()
+        ]
@@ -0,0 +1,190 @@
+"""
+Cache of LLM responses, keyed by provider, model and normalized prompt.
+
+The same prompts reach the providers again and again: subscribers' common
+questions, re-runs of a summary from the admin page, model probes, keyword
+extraction of re-scraped content. Responses are kept in an in-process LRU and,
+with LLM_CACHE_DB, in the llm_cache_entries table shared by every worker and
+kept across restarts. Each usage type has its own TTL (LLM_CACHE_TTL_<USAGE>
+seconds, 0 disables caching for that usage). Empty responses and failures are
+never cached. Hit and miss counters are shown on the admin statistics page.
+"""
+import os
+import re
+import hashlib
+import logging
+import threading
+import unicodedata
+from collections import OrderedDict
+from datetime import datetime, timedelta
+
+logger = logging.getLogger(__name__)
+
+# Usage type -> default TTL in seconds
+DEFAULT_TTLS = {
+    'summary': 3600,
+    'question': 900,
+    'extraction': 7 * 24 * 3600,
+}
+
+def normalize_prompt(prompt: str) -> str:
+    """Unicode NFC, whitespace runs collapsed, ends stripped."""
+    return re.sub(r'\s+', ' ', unicodedata.normalize('NFC', prompt or '')).strip()
+
+def cache_key(provider: str, model: str, prompt: str, variant: str = '') -> str:
+    text = '\x1f'.join((provider or '', model or '', variant or '', normalize_prompt(prompt)))
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+class LLMCache:
+    MAX_ENTRIES = int(os.environ.get('LLM_CACHE_SIZE', 1024))
+    DB_ENABLED = os.environ.get('LLM_CACHE_DB', 'false').lower() == 'true'
+
+    _entries = OrderedDict()  # key -> (expires_at, response)
+    _lock = threading.Lock()
+    _stats = {}
+
+    @staticmethod
+    def ttl(usage: str) -> int:
+        value = os.environ.get(f"LLM_CACHE_TTL_{usage.upper()}")
+        return int(value) if value else DEFAULT_TTLS.get(usage, 0)
+
+    @classmethod
+    def _count(cls, usage, outcome):
+        with cls._lock:
+            counters = cls._stats.setdefault(usage, {'memory_hits': 0, 'db_hits': 0, 'misses': 0})
+            counters[outcome] += 1
+
+    @classmethod
+    def _get_memory(cls, key, now):
+        with cls._lock:
+            entry = cls._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= now:
+                del cls._entries[key]
+                return None
+            cls._entries.move_to_end(key)
+            return entry[1]
+
+    @classmethod
+    def _put_memory(cls, key, response, expires_at):
+        with cls._lock:
+            cls._entries[key] = (expires_at, response)
+            cls._entries.move_to_end(key)
+            while len(cls._entries) > cls.MAX_ENTRIES:
+                cls._entries.popitem(last=False)
+
+    @classmethod
+    def _get_db(cls, key, now):
+        from app import app
+        from models import db, LLMCacheEntry
+
+        with app.app_context():
+            entry = LLMCacheEntry.query.filter(LLMCacheEntry.key == key, LLMCacheEntry.expires_at > now).first()
+            if entry is None:
+                return None
+            entry.hits = (entry.hits or 0) + 1
+            db.session.commit()
+            return entry.response, entry.expires_at
+
+    @classmethod
+    def _put_db(cls, key, provider, model, usage, response, expires_at):
+        from app import app
+        from models import db, LLMCacheEntry
+
+        with app.app_context():
+            entry = LLMCacheEntry.query.get(key) or LLMCacheEntry(key=key)
+            entry.provider = provider
+            entry.model = model
+            entry.usage_type = usage
+            entry.response = response
+            entry.created_at = datetime.utcnow()
+            entry.expires_at = expires_at
+            db.session.add(entry)
+            db.session.commit()
+
+    @classmethod
+    def cached(cls, provider: str, model: str, usage: str, prompt: str, call, variant: str = ''):
+        """
+        Response to a prompt from the cache, else from call() (stored when not empty).
+
+        Args:
+            provider, model: where the prompt goes
+            usage: 'summary', 'question' or 'extraction', selects the TTL
+            prompt: the full prompt sent
+            call: function() -> str, the provider request
+            variant: other request parameters that change the response (output cap, format)
+        """
+        ttl = cls.ttl(usage)
+        if ttl <= 0:
+            return call()
+
+        key = cache_key(provider, model, prompt, variant)
+        now = datetime.utcnow()
+        response = cls._get_memory(key, now)
+        if response is not None:
+            cls._count(usage, 'memory_hits')
+            return response
+
+        if cls.DB_ENABLED:
+            try:
+                stored = cls._get_db(key, now)
+            except Exception as e:
+                logger.warning(f"LLM cache read failed: {e}")
+                stored = None
+            if stored is not None:
+                response, expires_at = stored
+                cls._count(usage, 'db_hits')
+                cls._put_memory(key, response, expires_at)
+                return response
+
+        cls._count(usage, 'misses')
+        response = call()
+        if response and response.strip():
+            expires_at = now + timedelta(seconds=ttl)
+            cls._put_memory(key, response, expires_at)
+            if cls.DB_ENABLED:
+                try:
+                    cls._put_db(key, provider, model, usage, response, expires_at)
+                except Exception as e:
+                    logger.warning(f"LLM cache write failed: {e}")
+        return response
+
+    @classmethod
+    def purge_expired(cls) -> int:
+        """Delete expired rows of the DB tier. Returns the number deleted."""
+        from app import app
+        from models import db, LLMCacheEntry
+
+        if not cls.DB_ENABLED:
+            return 0
+        with app.app_context():
+            deleted = LLMCacheEntry.query.filter(LLMCacheEntry.expires_at <= datetime.utcnow()).delete()
+            db.session.commit()
+        return deleted
+
+    @classmethod
+    def stats(cls) -> dict:
+        """Hit and miss counters of this process per usage type, and the size of each tier."""
+        with cls._lock:
+            usages = {usage: dict(counters) for usage, counters in cls._stats.items()}
+            memory_entries = len(cls._entries)
+        for counters in usages.values():
+            lookups = counters['memory_hits'] + counters['db_hits'] + counters['misses']
+            counters['hit_rate'] = round((lookups - counters['misses']) / lookups, 3) if lookups else None
+
+        db_entries = None
+        if cls.DB_ENABLED:
+            try:
+                from models import LLMCacheEntry
+                db_entries = LLMCacheEntry.query.filter(LLMCacheEntry.expires_at > datetime.utcnow()).count()
+            except Exception as e:
+                logger.warning(f"LLM cache stats failed: {e}")
+        return {
+            'usages': usages,
+            'ttls': {usage: cls.ttl(usage) for usage in DEFAULT_TTLS},
+            'memory_entries': memory_entries,
+            'max_entries': cls.MAX_ENTRIES,
+            'db_enabled': cls.DB_ENABLED,
+            'db_entries': db_entries
+        }
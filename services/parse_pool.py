@@ -0,0 +1,61 @@
+"""
+Process pool for CPU-bound feed and HTML parsing.
+Fetch threads hand downloaded bytes to worker processes and get plain article
+dicts back, so feedparser/BeautifulSoup work runs on every core instead of
+serially under the GIL. With PARSE_POOL_SIZE=0 (default) parsing stays inline.
+"""
+import os
+import logging
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+logger = logging.getLogger(__name__)
+
+def _parse(source_type: str, content: bytes, url: str) -> list:
+    """Worker entry point; module-level so it can be pickled."""
+    from services.scraper_service import ScraperService
+    if source_type == 'rss':
+        return ScraperService.parse_rss(content, url)
+    return ScraperService.parse_website(content, url)
+
+class ParsePool:
+    SIZE = int(os.environ.get('PARSE_POOL_SIZE', 0))
+
+    _executor = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_executor(cls, size: int = None):
+        with cls._lock:
+            if cls._executor is None:
+                # Forking a process that runs scheduler and bot threads can deadlock on held locks
+                method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+                cls._executor = ProcessPoolExecutor(
+                    max_workers=size or cls.SIZE,
+                    mp_context=multiprocessing.get_context(method)
+                )
+                logger.info(f"Parse pool started with {size or cls.SIZE} processes ({method})")
+            return cls._executor
+
+    @classmethod
+    def parse(cls, source_type: str, content: bytes, url: str) -> list:
+        """Parse downloaded RSS ('rss') or HTML (any other type) content into article dicts."""
+        if cls.SIZE <= 0:
+            return _parse(source_type, content, url)
+
+        try:
+            return cls.get_executor().submit(_parse, source_type, content, url).result()
+        except BrokenProcessPool:
+            # A worker died (e.g. killed for memory); start a fresh pool next time
+            logger.error(f"Parse pool broken while parsing {url}, parsing inline")
+            cls.shutdown()
+            return _parse(source_type, content, url)
+
+    @classmethod
+    def shutdown(cls):
+        with cls._lock:
+            if cls._executor is not None:
+                cls._executor.shutdown(wait=False, cancel_futures=True)
+                cls._executor = None
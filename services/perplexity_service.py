@@ -1,6 +1,9 @@
 import os
 import logging
-import requests
+from services.http_client import HttpClient
+from services.llm_cache import LLMCache
+from services.provider_limits import ProviderLimits
+from utils import keyword_batch, summary_map_reduce
 
 logger = logging.getLogger(__name__)
 
@@ -16,8 +19,13 @@ class PerplexityService:
         return cls.get_api_key() is not None
     
     @classmethod
-    def _call_api(cls, prompt: str) -> str:
+    def _call_api(cls, prompt: str, max_tokens: int = 1000, usage: str = None) -> str:
         """Make a call to Perplexity API."""
+        if usage:
+            # Identical prompts are answered from the cache, see services.llm_cache
+            return LLMCache.cached("perplexity", "sonar", usage, prompt,
+                                   lambda: cls._call_api(prompt, max_tokens), variant=f"max_tokens={max_tokens}")
+        
         api_key = cls.get_api_key()
         if not api_key:
             return None
@@ -35,12 +43,14 @@ class PerplexityService:
                     "content": prompt
                 }
             ],
-            "max_tokens": 1000,
+            "max_tokens": max_tokens,
             "temperature": 0.7
         }
         
         try:
-            response = requests.post(cls.API_URL, headers=headers, json=data, timeout=60)
+            # Per request, so parallel map calls of a summary stay under the provider cap
+            with ProviderLimits.slot("perplexity"):
+                response = HttpClient.post(cls.API_URL, headers=headers, json=data, timeout=60)
             response.raise_for_status()
             result = response.json()
             return result.get("choices", [{}])[0].get("message", {}).get("content", "")
@@ -53,10 +63,13 @@ class PerplexityService:
         if not articles:
             return "Aucune nouvelle actualité à résumer aujourd'hui."
         
-        articles_text = "\n\n".join([
-            f"Source: {a.get('source', 'Unknown')}\nTitre: {a.get('title', 'Sans titre')}\nContenu: {a.get('content', '')[:1000]}"
-            for a in articles
-        ])
+        # Large article sets are condensed chunk by chunk first (map), this prompt is the reduce
+        articles_text = summary_map_reduce.condense(
+            articles,
+            lambda prompt, max_tokens: cls._call_api(prompt, max_tokens, usage="summary"),
+            language,
+            "perplexity"
+        )
         
         prompt = f"""Tu es un journaliste IA avec les caractéristiques suivantes:
 - Personnalité: {personality}
@@ -77,7 +90,7 @@ Articles à résumer:
 
 Résumé:"""
         
-        result = cls._call_api(prompt)
+        result = cls._call_api(prompt, usage="summary")
         if result:
             return result
         else:
@@ -86,7 +99,7 @@ Résumé:"""
             return "Résumé des actualités:\n\n" + "\n".join([f"• {t}" for t in titles])
     
     @classmethod
-    def answer_question(cls, question: str, articles: list, personality: str, writing_style: str, tone: str, language: str = "fr") -> str:
+    def answer_question(cls, question: str, articles: list, personality: str, writing_style: str, tone: str, language: str = "fr", fallback: bool = True) -> str:
         articles_context = "\n\n".join([
             f"[{a.get('source', 'Unknown')}] {a.get('title', '')}: {a.get('content', '')[:500]}"
             for a in articles[:10]
@@ -108,8 +121,9 @@ Question de l'utilisateur: {question}
 
 Réponse:"""
         
-        result = cls._call_api(prompt)
-        return result or "Je n'ai pas pu trouver d'information pertinente."
+        result = cls._call_api(prompt, usage="question")
+        # fallback=False returns None on failure, for callers that cache answers
+        return result or ("Je n'ai pas pu trouver d'information pertinente." if fallback else None)
     
     @classmethod
     def extract_keywords(cls, text: str) -> list:
@@ -120,7 +134,16 @@ Texte: {text[:2000]}
 
 Mots-clés:"""
         
-        result = cls._call_api(prompt)
+        result = cls._call_api(prompt, usage="extraction")
         if result:
             return [kw.strip() for kw in result.split(",") if kw.strip()]
         return []
+
+    @classmethod
+    def extract_keywords_batch(cls, items: list) -> dict:
+        """Extract keywords for several (id, text) pairs, packed into few requests."""
+        return keyword_batch.extract_batch(
+            items,
+            lambda prompt, max_tokens: cls._call_api(prompt, max_tokens, usage="extraction"),
+            cls.extract_keywords
+        )
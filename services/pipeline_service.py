@@ -0,0 +1,279 @@
+"""
+Per-journalist daily pipeline: fetch -> summary -> audio -> send.
+
+A PipelineRun row per journalist and local send date records each stage's
+state, timings and outputs. The journalist's cron triggers are only time gates
+(fetch not before fetch_time, summary not before summary_time, send not before
+send_time); a stage starts as soon as its gate is open and the stages it depends
+on finished, from whichever event came last. Nothing polls and the send stage
+uses the summary produced by its own run, whatever the UTC date.
+"""
+import logging
+from datetime import datetime
+from models.pipeline_run import PIPELINE_STAGES
+from utils.schedule import run_date, slot_on
+
+logger = logging.getLogger(__name__)
+
+# Stage -> stages that must be finished before it may start
+DEPENDENCIES = {
+    'fetch': (),
+    'summary': ('fetch',),
+    'audio': ('summary',),
+    'send': ('summary', 'audio'),
+}
+# Stages opened by a cron trigger; audio follows the summary directly
+GATED_STAGES = ('fetch', 'summary', 'send')
+FINISHED = ('done', 'failed', 'skipped')
+
+class PipelineService:
+
+    @staticmethod
+    def get_run(journalist, local_date):
+        """The journalist's PipelineRun for a local send date, created if needed."""
+        from sqlalchemy.exc import IntegrityError
+        from models import db, PipelineRun
+
+        run = PipelineRun.query.filter_by(journalist_id=journalist.id, run_date=local_date).first()
+        if run is not None:
+            return run
+
+        try:
+            run = PipelineRun(
+                journalist_id=journalist.id,
+                run_date=local_date,
+                deadline_at=slot_on(journalist, 'send', local_date)
+            )
+            db.session.add(run)
+            db.session.commit()
+            return run
+        except IntegrityError:
+            # Created concurrently by another worker
+            db.session.rollback()
+            return PipelineRun.query.filter_by(journalist_id=journalist.id, run_date=local_date).first()
+
+    @classmethod
+    def open_gate(cls, journalist_id, stage, slot):
+        """
+        Cron entry point: the time gate of a stage opened for the run the slot belongs to.
+        Opening a gate also opens earlier ones, so a run created late (new journalist,
+        changed times) still fetches before summarizing.
+        """
+        from app import app
+        from models import db, Journalist
+
+        with app.app_context():
+            journalist = Journalist.query.get(journalist_id)
+            if journalist is None:
+                return
+            run = cls.get_run(journalist, run_date(journalist, stage, slot))
+
+            now = datetime.utcnow()
+            cls._reset_stale(run, now)
+            for gated in GATED_STAGES[:GATED_STAGES.index(stage) + 1]:
+                if getattr(run, f"{gated}_gate_at") is None:
+                    setattr(run, f"{gated}_gate_at", now)
+            if run.status == 'pending':
+                run.status = 'running'
+            db.session.commit()
+            run_id = run.id
+
+        cls.advance(run_id)
+
+    @classmethod
+    def recover_stale(cls):
+        """
+        Catch-up entry point: restart the stale stages of runs still in progress. A stage
+        left running after its run's last gate opened (e.g. summary, send gate open)
+        would otherwise block the run for the day, no open_gate call being left to reset it.
+        """
+        from app import app
+        from models import db, PipelineRun
+
+        with app.app_context():
+            now = datetime.utcnow()
+            stale = [run.id for run in PipelineRun.query.filter_by(status='running').all()
+                     if cls._reset_stale(run, now)]
+            db.session.commit()
+
+        for run_id in stale:
+            cls.advance(run_id)
+
+    @staticmethod
+    def _reset_stale(run, now):
+        """
+        Put back stages left running by a worker that died, past the scheduler claim time.
+
+        Returns:
+            bool: True if a stage was reset
+        """
+        from datetime import timedelta
+        from services.scheduler_service import SchedulerService
+
+        limit = now - timedelta(minutes=SchedulerService.CLAIM_MINUTES)
+        reset = False
+        for stage in PIPELINE_STAGES:
+            started = getattr(run, f"{stage}_started_at")
+            if run.stage_status(stage) == 'running' and started and started < limit:
+                logger.warning(f"Pipeline {run.journalist_id}/{run.run_date}: restarting stale {stage}")
+                setattr(run, f"{stage}_status", 'pending')
+                reset = True
+        return reset
+
+    @staticmethod
+    def _ready(run, stage):
+        if run.stage_status(stage) != 'pending':
+            return False
+        if stage in GATED_STAGES and getattr(run, f"{stage}_gate_at") is None:
+            return False
+        return all(run.stage_status(dependency) in FINISHED for dependency in DEPENDENCIES[stage])
+
+    @staticmethod
+    def _claim(run_id, stage):
+        """Move a stage from pending to running; only one worker wins."""
+        from models import db, PipelineRun
+
+        claimed = PipelineRun.query.filter(
+            PipelineRun.id == run_id,
+            getattr(PipelineRun, f"{stage}_status") == 'pending'
+        ).update({
+            f"{stage}_status": 'running',
+            f"{stage}_started_at": datetime.utcnow()
+        }, synchronize_session=False)
+        db.session.commit()
+        return bool(claimed)
+
+    @classmethod
+    def advance(cls, run_id):
+        """Run every stage whose gate is open and dependencies are finished, in order."""
+        from app import app
+        from models import db, PipelineRun
+
+        while True:
+            with app.app_context():
+                run = PipelineRun.query.get(run_id)
+                stage = next((s for s in PIPELINE_STAGES if cls._ready(run, s)), None)
+                if stage is None or not cls._claim(run_id, stage):
+                    cls._finish_run(run_id)
+                    return
+
+                run = PipelineRun.query.get(run_id)
+                if run.predicted_delivery_at is None:
+                    cls._predict(run, stage)
+                try:
+                    status = getattr(cls, f"_run_{stage}")(run)
+                except Exception as e:
+                    db.session.rollback()
+                    run = PipelineRun.query.get(run_id)
+                    run.error = f"{stage}: {e}"
+                    status = 'failed'
+                    logger.error(f"Pipeline {run.journalist_id}/{run.run_date} {stage} failed: {e}")
+
+                setattr(run, f"{stage}_status", status)
+                setattr(run, f"{stage}_finished_at", datetime.utcnow())
+                cls._skip_blocked(run)
+                db.session.commit()
+
+    @staticmethod
+    def _predict(run, stage):
+        """Record the delivery time predicted from the learnt durations when the run starts."""
+        from models import db
+        from services.delivery_planner import DeliveryPlanner
+
+        try:
+            durations = DeliveryPlanner.durations(run.journalist_id)
+            run.predicted_delivery_at = DeliveryPlanner.predict_delivery(run, stage, durations)
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            logger.warning(f"Pipeline {run.journalist_id}/{run.run_date}: no delivery prediction: {e}")
+
+    @staticmethod
+    def _skip_blocked(run):
+        """Without a summary there is nothing to voice or send."""
+        if run.summary_status in ('failed', 'skipped'):
+            for stage in ('audio', 'send'):
+                if run.stage_status(stage) == 'pending':
+                    setattr(run, f"{stage}_status", 'skipped')
+
+    @staticmethod
+    def _finish_run(run_id):
+        from models import db, PipelineRun
+
+        run = PipelineRun.query.get(run_id)
+        if run.status in FINISHED or any(run.stage_status(stage) not in FINISHED for stage in PIPELINE_STAGES):
+            return
+        if run.send_status == 'done':
+            run.status = 'done'
+        elif run.summary_status == 'skipped':
+            run.status = 'skipped'
+        else:
+            run.status = 'failed'
+        db.session.commit()
+
+        latency = run.delivery_latency()
+        predicted = run.predicted_latency()
+        logger.info(f"Pipeline {run.journalist_id}/{run.run_date} finished: {run.status}"
+                    f"{f', delivered {latency:+.0f}s from deadline' if latency is not None else ''}"
+                    f"{f' (predicted {predicted:+.0f}s)' if predicted is not None else ''}")
+
+        # The run is new history: plan the next runs from the updated durations
+        from services.scheduler_service import SchedulerService
+        try:
+            SchedulerService.schedule_journalist(run.journalist)
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Could not replan journalist {run.journalist_id}: {e}")
+
+    # Stage implementations: return the final status, raise on failure
+
+    @staticmethod
+    def _run_fetch(run):
+        from services.ingestion_service import IngestionService
+
+        sources = [source for source in run.journalist.sources if source.is_active]
+        if not sources:
+            run.articles_count = 0
+            return 'skipped'
+        run.articles_count = IngestionService.ingest_sources(sources).get(run.journalist_id, 0)
+        return 'done'
+
+    @staticmethod
+    def _run_summary(run):
+        from services.scheduler_service import SchedulerService
+
+        daily_summary = SchedulerService.create_summary(run.journalist, with_audio=False)
+        if daily_summary is None:
+            return 'skipped'
+        run.daily_summary_id = daily_summary.id
+        return 'done'
+
+    @staticmethod
+    def _run_audio(run):
+        from services.scheduler_service import SchedulerService
+
+        audio_url = SchedulerService.generate_summary_audio(run.journalist, run.daily_summary.summary_text)
+        if audio_url is None:
+            return 'skipped'
+        run.daily_summary.audio_url = audio_url
+        return 'done'
+
+    @staticmethod
+    def _run_send(run):
+        from services.delivery_service import DeliveryService
+
+        daily_summary = run.daily_summary
+        if daily_summary.sent_at:
+            return 'done'
+        if not DeliveryService.send_summary_to_channels(run.journalist, daily_summary.summary_text, daily_summary.audio_url):
+            raise RuntimeError('No delivery channel accepted the summary')
+        daily_summary.sent_at = datetime.utcnow()
+        return 'done'
+
+    @staticmethod
+    def recent_runs(journalist_id, limit=7):
+        from models import PipelineRun
+
+        return PipelineRun.query.filter_by(journalist_id=journalist_id).order_by(
+            PipelineRun.run_date.desc()
+        ).limit(limit).all()
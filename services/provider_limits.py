@@ -0,0 +1,47 @@
+"""
+Per-provider concurrency caps shared by every thread of the process.
+Stage workers run many journalists at once; these semaphores keep each AI and
+TTS provider under its own limit (<PROVIDER>_MAX_CONCURRENCY), whatever the
+pool size.
+"""
+import os
+import threading
+from contextlib import contextmanager
+
+class ProviderLimits:
+    DEFAULTS = {
+        'gemini': 8,
+        'openai': 8,
+        'openrouter': 8,
+        'perplexity': 4,
+        'elevenlabs': 4,
+    }
+    DEFAULT_LIMIT = 4
+
+    _semaphores = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def limit(cls, provider: str) -> int:
+        provider = (provider or 'gemini').lower()
+        value = os.environ.get(f"{provider.upper()}_MAX_CONCURRENCY")
+        return int(value) if value else cls.DEFAULTS.get(provider, cls.DEFAULT_LIMIT)
+
+    @classmethod
+    def _semaphore(cls, provider: str) -> threading.BoundedSemaphore:
+        provider = (provider or 'gemini').lower()
+        with cls._lock:
+            if provider not in cls._semaphores:
+                cls._semaphores[provider] = threading.BoundedSemaphore(cls.limit(provider))
+            return cls._semaphores[provider]
+
+    @classmethod
+    @contextmanager
+    def slot(cls, provider: str):
+        """Hold one of the provider's slots for the duration of a call."""
+        semaphore = cls._semaphore(provider)
+        semaphore.acquire()
+        try:
+            yield
+        finally:
+            semaphore.release()
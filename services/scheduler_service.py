@@ -1,274 +1,621 @@
+import os
 import logging
 import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from zoneinfo import ZoneInfo
 from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.executors.pool import ThreadPoolExecutor as JobExecutor
+from apscheduler.triggers.cron import CronTrigger
+from utils.schedule import get_timezone, scheduled_time, last_slot, due_slot
 
 logger = logging.getLogger(__name__)
 
-scheduler = BackgroundScheduler()
+# Journalists run their stages in parallel up to this many at a time
+STAGE_WORKERS = int(os.environ.get('SCHEDULER_STAGE_WORKERS', 8))
+
+# Cron jobs of journalists sharing a slot run side by side; a few extra threads for singleton jobs
+scheduler = BackgroundScheduler(executors={'default': JobExecutor(STAGE_WORKERS + 4)})
 
 class SchedulerService:
+    # Stages with a time of day (also the job id prefixes)
+    STAGES = ('fetch', 'summary', 'send')
+    CATCH_UP_MINUTES = int(os.environ.get('SCHEDULER_CATCH_UP_MINUTES', 5))
+    # A slot younger than this is left to its own cron trigger
+    CATCH_UP_DELAY = 120
+    # A claim older than this is considered abandoned (crashed node)
+    CLAIM_MINUTES = int(os.environ.get('SCHEDULER_CLAIM_MINUTES', 30))
+    
+    # Wall clock of stage claims and catch-up (naive UTC); benchmarks/scheduler_simulation.py sets a simulated one
+    clock = datetime.utcnow
+    
+    _stage_pool = None
+    _stage_pool_lock = threading.Lock()
+    # journalist_id -> (timezone, fetch, summary, send times) of this worker's cron jobs
+    _scheduled = {}
     
     @staticmethod
     def get_journalist_local_time(journalist):
         """Get current time in journalist's timezone."""
-        try:
-            tz = ZoneInfo(journalist.timezone or 'Europe/Paris')
-            return datetime.now(tz)
-        except Exception:
-            return datetime.now(ZoneInfo('Europe/Paris'))
+        return datetime.now(get_timezone(journalist.timezone))
     
     @staticmethod
-    def should_fetch(journalist):
-        """Check if it's time to fetch articles based on journalist's timezone."""
-        local_time = SchedulerService.get_journalist_local_time(journalist)
-        fetch_hour = int(journalist.fetch_time.split(':')[0]) if journalist.fetch_time else 2
-        fetch_minute = int(journalist.fetch_time.split(':')[1]) if journalist.fetch_time and ':' in journalist.fetch_time else 0
+    def job_id(stage, journalist_id):
+        return f"{stage}_{journalist_id}"
+    
+    @classmethod
+    def schedule_journalist(cls, journalist, replan=True):
+        """
+        Create or update the fetch/summary/send cron jobs of a journalist.
+        Each job fires at its HH:MM in the journalist's own timezone, so nothing
+        runs in minutes where no journalist is due. Fetch and summary may fire
+        earlier than configured, planned back from send_time (DeliveryPlanner).
+        """
+        from services.delivery_planner import DeliveryPlanner
+        
+        if not journalist.is_active:
+            cls.unschedule_journalist(journalist.id)
+            return
+        
+        if replan:
+            try:
+                DeliveryPlanner.replan(journalist)
+            except Exception as e:
+                logger.error(f"Could not plan {journalist.name} from its history: {e}")
+        
+        signature = cls._signature(journalist)
+        if cls._scheduled.get(journalist.id) == signature and scheduler.get_job(cls.job_id('send', journalist.id)):
+            return
+        
+        timezone = get_timezone(journalist.timezone)
+        for stage in cls.STAGES:
+            hour, minute = scheduled_time(journalist, stage)
+            scheduler.add_job(
+                cls.run_stage,
+                CronTrigger(hour=hour, minute=minute, timezone=timezone),
+                args=[stage, journalist.id],
+                id=cls.job_id(stage, journalist.id),
+                name=f"{stage} {journalist.name}",
+                misfire_grace_time=300,
+                coalesce=True,
+                replace_existing=True
+            )
+        cls._scheduled[journalist.id] = signature
+        fetch, summary, send = signature[1:]
+        logger.info(f"Scheduled {journalist.name}: fetch {fetch[0]:02d}:{fetch[1]:02d}, summary {summary[0]:02d}:{summary[1]:02d}, "
+                    f"send {send[0]:02d}:{send[1]:02d} ({timezone.key})")
+    
+    @classmethod
+    def unschedule_journalist(cls, journalist_id):
+        """Remove a journalist's jobs, if any."""
+        for stage in cls.STAGES:
+            if scheduler.get_job(cls.job_id(stage, journalist_id)):
+                scheduler.remove_job(cls.job_id(stage, journalist_id))
+        cls._scheduled.pop(journalist_id, None)
+    
+    @classmethod
+    def _signature(cls, journalist):
+        return (journalist.timezone,) + tuple(scheduled_time(journalist, stage) for stage in cls.STAGES)
+    
+    @classmethod
+    def sync_schedules(cls):
+        """
+        Align this worker's cron jobs with the database: times planned or edited in
+        another worker, new, deactivated and deleted journalists.
+        """
+        from app import app
+        
+        with app.app_context():
+            journalists = cls._active_journalists()
+            for journalist in journalists:
+                try:
+                    cls.schedule_journalist(journalist, replan=False)
+                except Exception as e:
+                    logger.error(f"Could not schedule {journalist.name}: {e}")
+            active_ids = {journalist.id for journalist in journalists}
+            for journalist_id in list(cls._scheduled):
+                if journalist_id not in active_ids:
+                    cls.unschedule_journalist(journalist_id)
+    
+    @classmethod
+    def claim_stage(cls, stage, journalist_id, slot):
+        """
+        Claim a journalist stage for this node, for the given slot.
+        
+        The row is selected FOR UPDATE SKIP LOCKED (Postgres), so nodes racing for the
+        same row skip it instead of waiting; the conditional UPDATE then only succeeds
+        if the slot is not completed and no live claim exists, on every backend.
+        
+        Returns:
+            bool: True if this node must run the stage
+        """
+        from sqlalchemy import or_
+        from sqlalchemy.exc import IntegrityError
+        from models import db, StageRun
+        from services.lease_service import NODE_ID
+        
+        if not StageRun.query.filter_by(journalist_id=journalist_id, stage=stage).count():
+            try:
+                db.session.add(StageRun(journalist_id=journalist_id, stage=stage))
+                db.session.commit()
+            except IntegrityError:
+                db.session.rollback()
+        
+        row = db.session.query(StageRun.id).filter_by(
+            journalist_id=journalist_id, stage=stage
+        ).with_for_update(skip_locked=True).first()
+        if row is None:
+            db.session.rollback()
+            return False
+        
+        now = cls.clock()
+        claimed = StageRun.query.filter(
+            StageRun.id == row.id,
+            or_(StageRun.last_scheduled_for.is_(None), StageRun.last_scheduled_for < slot),
+            or_(StageRun.claimed_by.is_(None), StageRun.claimed_until < now)
+        ).update({
+            'claimed_by': NODE_ID,
+            'claimed_until': now + timedelta(minutes=cls.CLAIM_MINUTES),
+            'last_started_at': now
+        }, synchronize_session=False)
+        db.session.commit()
+        return bool(claimed)
+    
+    @classmethod
+    def run_stage(cls, stage, journalist_id, catch_up=False):
+        """
+        Run a stage for a journalist's latest slot, unless that slot already completed
+        or another worker claimed it. The completed slot and the lateness of the start
+        are stored in StageRun.
+        
+        Returns:
+            bool: True if the stage ran
+        """
+        from app import app
+        from models import db, Journalist, StageRun
+        
+        with app.app_context():
+            journalist = Journalist.query.get(journalist_id)
+            if journalist is None or not journalist.is_active:
+                return False
+            
+            started = cls.clock()
+            slot = last_slot(journalist, stage, started)
+            if not cls.claim_stage(stage, journalist_id, slot):
+                return False
+            name = journalist.name
+        
+        from services.pipeline_service import PipelineService
+        
+        completed = False
+        try:
+            # The slot opens the stage's gate in the journalist's pipeline run
+            PipelineService.open_gate(journalist_id, stage, slot)
+            completed = True
+        finally:
+            lateness = (started - slot).total_seconds()
+            with app.app_context():
+                run = StageRun.query.filter_by(journalist_id=journalist_id, stage=stage).first()
+                run.claimed_by = None
+                run.claimed_until = None
+                if completed:
+                    run.last_scheduled_for = slot
+                    run.last_completed_at = cls.clock()
+                    run.last_lateness = lateness
+                    run.max_lateness = max(run.max_lateness or 0, lateness)
+                    run.run_count = (run.run_count or 0) + 1
+                    if catch_up:
+                        run.catch_up_count = (run.catch_up_count or 0) + 1
+                db.session.commit()
         
-        # Execute at the configured hour:minute (within a 1-minute window)
-        return local_time.hour == fetch_hour and local_time.minute == fetch_minute
+        if catch_up:
+            logger.warning(f"Caught up {stage} for {name}: slot {slot:%Y-%m-%d %H:%M} UTC, {lateness:.0f}s late")
+        return True
+    
+    @classmethod
+    def catch_up(cls):
+        """
+        Run every stage whose latest slot passed since its last completed run,
+        e.g. after a restart or a missed trigger. A journalist/stage without history
+        only gets a baseline, so new journalists do not run stages on creation.
+        """
+        from sqlalchemy.exc import IntegrityError
+        from app import app
+        from models import db, StageRun
+        
+        due = []
+        with app.app_context():
+            now = cls.clock()
+            runs = {(run.journalist_id, run.stage): run for run in StageRun.query.all()}
+            
+            for journalist in cls._active_journalists():
+                for stage in cls.STAGES:
+                    run = runs.get((journalist.id, stage))
+                    if run is None:
+                        slot = last_slot(journalist, stage, now)
+                        db.session.add(StageRun(journalist_id=journalist.id, stage=stage, last_scheduled_for=slot))
+                    elif due_slot(journalist, stage, run.last_scheduled_for, now, cls.CATCH_UP_DELAY):
+                        due.append((stage, journalist.id))
+            try:
+                db.session.commit()
+            except IntegrityError:
+                # Another node created the baselines first
+                db.session.rollback()
+        
+        stages_by_journalist = {}
+        for stage, journalist_id in due:
+            stages_by_journalist.setdefault(journalist_id, []).append(stage)
+        
+        def catch_up_journalist(journalist_id):
+            # Stages keep their fetch -> summary -> send order within a journalist
+            for stage in stages_by_journalist[journalist_id]:
+                try:
+                    cls.run_stage(stage, journalist_id, catch_up=True)
+                except Exception as e:
+                    logger.error(f"Catch-up of {stage} for journalist {journalist_id} failed: {e}")
+        
+        if stages_by_journalist:
+            cls._dispatch(catch_up_journalist, list(stages_by_journalist))
+        
+        # Stages of runs in progress left running by a dead worker
+        from services.pipeline_service import PipelineService
+        try:
+            PipelineService.recover_stale()
+        except Exception as e:
+            logger.error(f"Recovery of stale pipeline stages failed: {e}")
     
     @staticmethod
-    def should_generate_summary(journalist):
-        """Check if it's time to generate summary based on journalist's timezone."""
-        local_time = SchedulerService.get_journalist_local_time(journalist)
-        summary_hour = int(journalist.summary_time.split(':')[0]) if journalist.summary_time else 8
-        summary_minute = int(journalist.summary_time.split(':')[1]) if journalist.summary_time and ':' in journalist.summary_time else 0
+    def stage_lateness():
+        """Per journalist and stage: last slot, completion and lateness in seconds."""
+        from models import StageRun
         
-        # Execute at the configured hour:minute (within a 1-minute window)
-        return local_time.hour == summary_hour and local_time.minute == summary_minute
+        return [
+            {
+                'journalist_id': run.journalist_id,
+                'stage': run.stage,
+                'last_scheduled_for': run.last_scheduled_for.isoformat() if run.last_scheduled_for else None,
+                'last_completed_at': run.last_completed_at.isoformat() if run.last_completed_at else None,
+                'last_lateness': run.last_lateness,
+                'max_lateness': run.max_lateness,
+                'run_count': run.run_count,
+                'catch_up_count': run.catch_up_count
+            }
+            for run in StageRun.query.order_by(StageRun.journalist_id, StageRun.stage).all()
+        ]
     
     @staticmethod
-    def should_send_summary(journalist):
-        """Check if it's time to send summary based on journalist's timezone."""
-        local_time = SchedulerService.get_journalist_local_time(journalist)
-        send_hour = int(journalist.send_time.split(':')[0]) if journalist.send_time else 8
-        send_minute = int(journalist.send_time.split(':')[1]) if journalist.send_time and ':' in journalist.send_time else 0
+    def _active_journalists(journalist_ids=None):
+        from models import Journalist
+        query = Journalist.query.filter_by(is_active=True)
+        if journalist_ids is not None:
+            query = query.filter(Journalist.id.in_(journalist_ids))
+        return query.all()
+    
+    @classmethod
+    def _get_stage_pool(cls):
+        with cls._stage_pool_lock:
+            if cls._stage_pool is None:
+                cls._stage_pool = ThreadPoolExecutor(max_workers=STAGE_WORKERS, thread_name_prefix='stage')
+            return cls._stage_pool
+    
+    @classmethod
+    def _dispatch(cls, func, journalist_ids=None):
+        """
+        Run func(journalist_id) for each given (or each active) journalist on the stage pool.
+        A single journalist runs inline, so a stage started from a pool thread never waits
+        on the pool itself.
+        """
+        from app import app
         
-        # Execute at the configured hour:minute (within a 1-minute window)
-        return local_time.hour == send_hour and local_time.minute == send_minute
+        if journalist_ids is None:
+            with app.app_context():
+                journalist_ids = [journalist.id for journalist in cls._active_journalists()]
+        
+        if len(journalist_ids) <= 1:
+            for journalist_id in journalist_ids:
+                func(journalist_id)
+            return
+        
+        pool = cls._get_stage_pool()
+        for future in [pool.submit(func, journalist_id) for journalist_id in journalist_ids]:
+            try:
+                future.result()
+            except Exception as e:
+                logger.error(f"Stage worker failed: {e}")
     
     @staticmethod
-    def fetch_all_sources():
+    def fetch_all_sources(journalist_ids=None):
+        """Fetch the active sources of the given journalists (all active journalists by default)."""
         from app import app
-        from models import db, Journalist, Source, Article
-        from services.scraper_service import ScraperService
-        from services.ai_service import AIService
+        from services.ingestion_service import IngestionService
         
         with app.app_context():
-            journalists = Journalist.query.filter_by(is_active=True).all()
-            
-            for journalist in journalists:
-                # Only fetch if it's the right time for this journalist's timezone
-                if not SchedulerService.should_fetch(journalist):
-                    continue
+            due_sources = []
+            for journalist in SchedulerService._active_journalists(journalist_ids):
                 logger.info(f"Fetching for: {journalist.name}")
-                
-                for source in journalist.sources:
-                    if not source.is_active:
-                        continue
-                    
-                    try:
-                        articles_data = ScraperService.fetch_source(source.source_type, source.url)
-                        
-                        for data in articles_data:
-                            existing = Article.query.filter_by(
-                                journalist_id=journalist.id,
-                                url=data['url']
-                            ).first() if data['url'] else None
-                            
-                            if not existing:
-                                keywords = AIService.extract_keywords(f"{data['title']} {data['content']}")
-                                
-                                article = Article(
-                                    journalist_id=journalist.id,
-                                    source_id=source.id,
-                                    title=data['title'],
-                                    content=data['content'],
-                                    url=data['url'],
-                                    author=data['author'],
-                                    published_at=data['published_at'],
-                                    keywords=','.join(keywords)
-                                )
-                                db.session.add(article)
-                        
-                        source.last_fetched_at = datetime.utcnow()
-                        source.fetch_count += 1
-                        db.session.commit()
-                        
-                    except Exception as e:
-                        source.error_count += 1
-                        source.last_error = str(e)
-                        db.session.commit()
-                        logger.error(f"Error fetching {source.url}: {e}")
+                due_sources.extend(source for source in journalist.sources if source.is_active)
+            
+            if not due_sources:
+                return
+            
+            # Each unique URL is downloaded once and shared by every journalist in the run
+            IngestionService.ingest_sources(due_sources)
     
     @staticmethod
-    def generate_summaries():
-        """Generate summaries respecting each journalist's local timezone."""
-        from app import app
-        from models import db, Journalist, Article, DailySummary
-        from services.ai_service import AIService
+    def generate_summaries(journalist_ids=None):
+        """Generate summaries for the given journalists (all active journalists by default)."""
+        SchedulerService._dispatch(SchedulerService._generate_summary, journalist_ids)
+    
+    @staticmethod
+    def generate_summary_audio(journalist, text):
+        """Generate, save and return the audio URL of a summary, or None without a voice."""
         from services.audio_service import AudioService
+        from services.provider_limits import ProviderLimits
+        
+        if not journalist.eleven_labs_voice_id or not AudioService.is_available():
+            return None
+        
+        # generate_audio returns a tuple (audio_bytes, error_message)
+        with ProviderLimits.slot('elevenlabs'):
+            audio_bytes, error = AudioService.generate_audio(text, journalist.eleven_labs_voice_id)
+        if not audio_bytes:
+            raise RuntimeError(f"Audio generation failed: {error}")
+        
+        filename = f"summary_{journalist.id}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.mp3"
+        audio_url = AudioService.save_audio(audio_bytes, filename)
+        if audio_url:
+            logger.info(f"Audio generated and saved for journalist {journalist.id}: {audio_url}")
+        return audio_url
+    
+    @staticmethod
+    def create_summary(journalist, with_audio=True):
+        """
+        Generate and store a DailySummary from the journalist's last 24h of articles.
+        Must run inside an app context.
+        
+        Returns:
+            DailySummary, or None when there are no recent articles
+        """
+        from models import db, Article, DailySummary
+        from services.ai_service import AIService, clean_html
+        from services.enrichment_service import EnrichmentService
+        
+        local_time = SchedulerService.get_journalist_local_time(journalist)
+        logger.info(f"Generating summary for {journalist.name} (local time: {local_time.strftime('%H:%M')} {journalist.timezone})")
+        
+        yesterday = datetime.utcnow() - timedelta(days=1)
+        articles = Article.query.filter(
+            Article.journalist_id == journalist.id,
+            Article.fetched_at >= yesterday,
+            Article.representatives()
+        ).all()
         
-        def generate_audio_async(text, voice_id, journalist_id):
-            """Generate audio in parallel."""
-            if voice_id and AudioService.is_available():
-                # generate_audio returns a tuple (audio_bytes, error_message)
-                audio_bytes, error = AudioService.generate_audio(text, voice_id)
-                if audio_bytes:
-                    filename = f"summary_{journalist_id}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.mp3"
-                    audio_url = AudioService.save_audio(audio_bytes, filename)
-                    if audio_url:
-                        logger.info(f"Audio generated and saved for journalist {journalist_id}: {audio_url}")
-                    return audio_url
-                else:
-                    logger.warning(f"Failed to generate audio for journalist {journalist_id}: {error}")
+        if not articles:
             return None
         
+        # Stored per-article digests keep the prompt small
+        articles_data = EnrichmentService.prompt_articles(articles)
+        
+        # Each provider request takes its own ProviderLimits slot, map calls included
+        ai_summary = AIService.generate_summary(
+            articles=articles_data,
+            personality=journalist.personality,
+            writing_style=journalist.writing_style,
+            tone=journalist.tone,
+            language=journalist.language,
+            provider=journalist.ai_provider,
+            model=journalist.ai_model
+        )
+        
+        # Format complete message with greeting, summary, and journalist name
+        send_date = SchedulerService.get_journalist_local_time(journalist).strftime('%d/%m/%Y')
+        greeting = f"Bonjour,\n\nRésumé du {send_date}\n\n"
+        summary_text = f"{greeting}{clean_html(ai_summary)}\n\n---\n{journalist.name}"
+        
+        audio_path = None
+        if with_audio:
+            try:
+                audio_path = SchedulerService.generate_summary_audio(journalist, ai_summary)
+            except Exception as e:
+                logger.warning(f"Failed to generate audio for journalist {journalist.id}: {e}")
+        
+        daily_summary = DailySummary(
+            journalist_id=journalist.id,
+            summary_text=summary_text,
+            audio_url=audio_path,
+            articles_count=len(articles)
+        )
+        db.session.add(daily_summary)
+        journalist.last_summary_at = datetime.utcnow()
+        db.session.commit()
+        
+        logger.info(f"Summary generated for {journalist.name} with audio: {bool(audio_path)}")
+        return daily_summary
+    
+    @staticmethod
+    def _generate_summary(journalist_id):
+        """Generate one journalist's summary in its own app context and DB session."""
+        from app import app
+        from models import Journalist
+        
         with app.app_context():
-            journalists = Journalist.query.filter_by(is_active=True).all()
-            
-            for journalist in journalists:
-                try:
-                    if not SchedulerService.should_generate_summary(journalist):
-                        continue
-                    
-                    local_time = SchedulerService.get_journalist_local_time(journalist)
-                    logger.info(f"Generating summary for {journalist.name} (local time: {local_time.strftime('%H:%M')} {journalist.timezone})")
-                    
-                    yesterday = datetime.utcnow() - timedelta(days=1)
-                    articles = Article.query.filter(
-                        Article.journalist_id == journalist.id,
-                        Article.fetched_at >= yesterday
-                    ).all()
-                    
-                    if not articles:
-                        continue
-                    
-                    articles_data = [
-                        {'title': a.title, 'content': a.content, 'source': a.source.name if a.source else 'Unknown'}
-                        for a in articles
-                    ]
-                    
-                    ai_summary = AIService.generate_summary(
-                        articles=articles_data,
-                        personality=journalist.personality,
-                        writing_style=journalist.writing_style,
-                        tone=journalist.tone,
-                        language=journalist.language,
-                        provider=journalist.ai_provider,
-                        model=journalist.ai_model
-                    )
-                    
-                    # Get current time for footer
-                    local_time = SchedulerService.get_journalist_local_time(journalist)
-                    send_date = local_time.strftime('%d/%m/%Y')
-                    
-                    # Format complete message with greeting, summary, and journalist name
-                    from services.ai_service import clean_html
-                    greeting = f"Bonjour,\n\nRésumé du {send_date}\n\n"
-                    cleaned_summary = clean_html(ai_summary)
-                    summary_text = f"{greeting}{cleaned_summary}\n\n---\n{journalist.name}"
-                    
-                    # Generate audio IN PARALLEL with summary
-                    audio_path = generate_audio_async(ai_summary, journalist.eleven_labs_voice_id, journalist.id)
-                    
-                    daily_summary = DailySummary(
-                        journalist_id=journalist.id,
-                        summary_text=summary_text,
-                        audio_url=audio_path,
-                        articles_count=len(articles)
-                    )
-                    db.session.add(daily_summary)
-                    journalist.last_summary_at = datetime.utcnow()
-                    db.session.commit()
-                    
-                    logger.info(f"Summary generated for {journalist.name} with audio: {bool(audio_path)}")
-                    
-                except Exception as e:
-                    logger.error(f"Error generating summary for {journalist.name}: {e}")
+            journalist = Journalist.query.get(journalist_id)
+            if journalist is None:
+                return
+            try:
+                SchedulerService.create_summary(journalist)
+            except Exception as e:
+                logger.error(f"Error generating summary for {journalist.name}: {e}")
     
     @staticmethod
-    def send_summaries():
-        """Send pending summaries respecting each journalist's send time."""
+    def send_summaries(journalist_ids=None):
+        """Send today's pending summary of the given journalists (all active journalists by default)."""
+        SchedulerService._dispatch(SchedulerService._send_summary, journalist_ids)
+    
+    @staticmethod
+    def _send_summary(journalist_id):
+        """Send one journalist's pending summary in its own app context and DB session."""
         from app import app
         from models import db, Journalist, DailySummary
         from services.delivery_service import DeliveryService
         
         with app.app_context():
-            journalists = Journalist.query.filter_by(is_active=True).all()
-            
-            for journalist in journalists:
-                try:
-                    if not SchedulerService.should_send_summary(journalist):
-                        continue
-                    
-                    local_time = SchedulerService.get_journalist_local_time(journalist)
-                    logger.info(f"Sending summary for {journalist.name} (local time: {local_time.strftime('%H:%M')} {journalist.timezone})")
-                    
-                    # Find today's unsent summary
-                    today = datetime.utcnow().date()
-                    daily_summary = DailySummary.query.filter(
-                        DailySummary.journalist_id == journalist.id,
-                        DailySummary.created_at >= datetime.combine(today, datetime.min.time()),
-                        DailySummary.created_at <= datetime.combine(today, datetime.max.time())
-                    ).first()
-                    
-                    if not daily_summary or daily_summary.sent_at:
-                        continue
-                    
-                    # Send via all configured channels
-                    success = DeliveryService.send_summary_to_channels(
-                        journalist, 
-                        daily_summary.summary_text, 
-                        daily_summary.audio_url
-                    )
-                    
-                    if success:
-                        daily_summary.sent_at = datetime.utcnow()
-                        db.session.commit()
-                        logger.info(f"Summary sent for {journalist.name} via delivery channels")
-                    
-                except Exception as e:
-                    logger.error(f"Error sending summary for {journalist.name}: {e}")
+            journalist = Journalist.query.get(journalist_id)
+            if journalist is None:
+                return
+            try:
+                local_time = SchedulerService.get_journalist_local_time(journalist)
+                logger.info(f"Sending summary for {journalist.name} (local time: {local_time.strftime('%H:%M')} {journalist.timezone})")
+                
+                # Latest summary of the last 24h, whatever the journalist's timezone
+                daily_summary = DailySummary.query.filter(
+                    DailySummary.journalist_id == journalist.id,
+                    DailySummary.created_at >= datetime.utcnow() - timedelta(days=1)
+                ).order_by(DailySummary.created_at.desc()).first()
+                
+                if not daily_summary or daily_summary.sent_at:
+                    return
+                
+                # Send via all configured channels
+                success = DeliveryService.send_summary_to_channels(
+                    journalist, 
+                    daily_summary.summary_text, 
+                    daily_summary.audio_url
+                )
+                
+                if success:
+                    daily_summary.sent_at = datetime.utcnow()
+                    db.session.commit()
+                    logger.info(f"Summary sent for {journalist.name} via delivery channels")
+                
+            except Exception as e:
+                logger.error(f"Error sending summary for {journalist.name}: {e}")
     
     @classmethod
     def init(cls, fetch_hour=2, summary_hour=8):
+        from app import app
+        from services.lease_service import LeaseService
+        
+        from init_db import missing_columns
+        
         if scheduler.running:
             logger.info("Scheduler already running, skipping init")
             return
         
-        # Run fetch every minute (checks journalist timezones internally)
+        # One cron trigger per journalist and stage, in the journalist's timezone
+        with app.app_context():
+            # Scheduling queries columns added by migrations; refuse to start half-configured
+            missing = missing_columns()
+            if missing:
+                raise RuntimeError(f"Database schema not migrated, missing columns: {', '.join(missing)}")
+            journalists = cls._active_journalists()
+            for journalist in journalists:
+                cls.schedule_journalist(journalist)
+        
+        # Every worker runs this scheduler: stage jobs are claimed per row in claim_stage,
+        # singleton jobs below only run on the worker holding their lease
+        
+        # Run stages whose slot was missed (downtime, overlap), now and periodically
+        scheduler.add_job(
+            LeaseService.run_exclusive,
+            'interval',
+            args=['catch_up', cls.catch_up],
+            minutes=cls.CATCH_UP_MINUTES,
+            next_run_time=datetime.now(),
+            id='catch_up',
+            max_instances=1,
+            coalesce=True,
+            replace_existing=True
+        )
+        
+        # Pick up times planned or edited in other workers
+        scheduler.add_job(
+            cls.sync_schedules,
+            'interval',
+            minutes=cls.CATCH_UP_MINUTES,
+            id='sync_schedules',
+            max_instances=1,
+            coalesce=True,
+            replace_existing=True
+        )
+        
+        # Enrich pending articles (keywords, per-article summary) off the fetch path;
+        # the task's idempotency key keeps a single batch live over all workers
+        from services.task_queue import TaskQueue
+        scheduler.add_job(
+            TaskQueue.enqueue_scheduled,
+            'interval',
+            args=['enrich_articles'],
+            seconds=30,
+            id='enrich_articles',
+            max_instances=1,
+            coalesce=True,
+            replace_existing=True
+        )
+        
+        # Embed new article representatives for semantic Q&A retrieval; the vectors
+        # are local files, so every node builds its own instead of a queued task
+        from services.embedding_index import EmbeddingIndex
         scheduler.add_job(
-            cls.fetch_all_sources,
-            'cron',
-            minute='*',
-            id='fetch_sources',
+            EmbeddingIndex.run_pending,
+            'interval',
+            seconds=60,
+            id='embed_articles',
+            max_instances=1,
+            coalesce=True,
             replace_existing=True
         )
         
-        # Run generate every minute (checks journalist timezones internally)
+        # Drop expired rows of the shared LLM response cache
+        from services.llm_cache import LLMCache
+        if LLMCache.DB_ENABLED:
+            scheduler.add_job(
+                LeaseService.run_exclusive,
+                'interval',
+                args=['llm_cache_purge', LLMCache.purge_expired],
+                hours=1,
+                id='llm_cache_purge',
+                max_instances=1,
+                coalesce=True,
+                replace_existing=True
+            )
+        
+        # Drop finished tasks past their retention
         scheduler.add_job(
-            cls.generate_summaries,
-            'cron',
-            minute='*',
-            id='generate_summaries',
+            LeaseService.run_exclusive,
+            'interval',
+            args=['task_purge', TaskQueue.purge_finished],
+            hours=1,
+            id='task_purge',
+            max_instances=1,
+            coalesce=True,
             replace_existing=True
         )
         
-        # Run send every minute (checks journalist timezones internally)
+        # Keep this node's leases alive between runs
         scheduler.add_job(
-            cls.send_summaries,
-            'cron',
-            minute='*',
-            id='send_summaries',
+            LeaseService.heartbeat,
+            'interval',
+            seconds=max(5, LeaseService.LEASE_TTL // 3),
+            id='lease_heartbeat',
+            max_instances=1,
+            coalesce=True,
             replace_existing=True
         )
         
         scheduler.start()
-        logger.info(f"Scheduler: running every minute, respects individual journalist fetch/summary/send times and timezones")
+        TaskQueue.start()
+        # Articles stored before the search index existed
+        TaskQueue.enqueue_scheduled('index_articles')
+        logger.info(f"Scheduler: {len(journalists)} journalists scheduled on their own fetch/summary/send times and timezones")
     
     @classmethod
     def shutdown(cls):
+        from services.parse_pool import ParsePool
+        from services.lease_service import LeaseService
+        from services.task_queue import TaskQueue
         scheduler.shutdown()
+        TaskQueue.shutdown()
+        ParsePool.shutdown()
+        # Let another node take over immediately instead of after the lease TTL
+        LeaseService.release_all()
@@ -10,7 +10,8 @@ def fetch_all_sources_improved(self):
     from app import app
     from models import db, Journalist, Source, Article
     from services.scraper_service_improved import ImprovedScraperService
-    from services.ai_service import AIService
+    from services.keyword_service import KeywordService
+    from utils.urls import url_hash
     from datetime import datetime
     
     with app.app_context():
@@ -37,28 +38,31 @@ def fetch_all_sources_improved(self):
                     
                     logger.info(f"Source: {source.url}, Articles found: {len(articles_data)}")
                     
-                    for data in articles_data:
-                        # Double-check for duplicates by URL
-                        existing = Article.query.filter_by(
-                            journalist_id=journalist.id,
-                            url=data['url']
-                        ).first() if data['url'] else None
+                    # Double-check for duplicates by canonical URL hash, one query per batch
+                    hashes = [url_hash(data['url']) for data in articles_data]
+                    seen = Article.existing_url_hashes(journalist.id, hashes)
+                    
+                    for data, data_hash in zip(articles_data, hashes):
+                        if data_hash in seen:
+                            continue
+                        if data_hash:
+                            seen.add(data_hash)
                         
-                        if not existing:
-                            keywords = AIService.extract_keywords(f"{data['title']} {data['content']}")
-                            
-                            article = Article(
-                                journalist_id=journalist.id,
-                                source_id=source.id,
-                                title=data['title'],
-                                content=data['content'],
-                                url=data['url'],
-                                author=data['author'],
-                                published_at=data['published_at'],
-                                keywords=','.join(keywords)
-                            )
-                            db.session.add(article)
-                            logger.info(f"Added new article: {data['title'][:50]}...")
+                        keywords = KeywordService.extract_keywords(f"{data['title']} {data['content']}", journalist.language)
+                        
+                        article = Article(
+                            journalist_id=journalist.id,
+                            source_id=source.id,
+                            title=data['title'],
+                            content=data['content'],
+                            url=data['url'],
+                            url_hash=data_hash,
+                            author=data['author'],
+                            published_at=data['published_at'],
+                            keywords=','.join(keywords)
+                        )
+                        db.session.add(article)
+                        logger.info(f"Added new article: {data['title'][:50]}...")
                     
                     # Update last fetch time
                     source.last_fetched_at = datetime.utcnow()
@@ -1,5 +1,6 @@
 import re
-import requests
+import hashlib
+from services.http_client import HttpClient
 from bs4 import BeautifulSoup
 import feedparser
 import logging
@@ -17,30 +18,110 @@ HEADERS = {
 class ScraperService:
     
     @staticmethod
-    def fetch_rss(url: str) -> list:
-        try:
-            feed = feedparser.parse(url)
-            articles = []
+    def download(url: str, etag: str = None, last_modified: str = None) -> dict:
+        """
+        Download a URL, sending HTTP validators when known.
+        Returns dict with 'not_modified', 'content', 'etag' and 'last_modified'.
+        """
+        headers = dict(HEADERS)
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        
+        response = HttpClient.get(url, headers=headers, timeout=30)
+        
+        if response.status_code == 304:
+            return {
+                'not_modified': True,
+                'content': None,
+                'etag': response.headers.get('ETag', etag),
+                'last_modified': response.headers.get('Last-Modified', last_modified)
+            }
+        
+        response.raise_for_status()
+        return {
+            'not_modified': False,
+            'content': response.content,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified')
+        }
+    
+    @staticmethod
+    def parse_rss(content: bytes, url: str) -> list:
+        """Parse a downloaded RSS/Atom feed into article dicts."""
+        feed = feedparser.parse(content, response_headers={'content-location': url})
+        articles = []
+        
+        for entry in feed.entries[:20]:
+            article = {
+                'title': entry.get('title', ''),
+                'content': entry.get('summary', entry.get('description', '')),
+                'url': entry.get('link', ''),
+                'author': entry.get('author', ''),
+                'published_at': None,
+                'source': feed.feed.get('title', urlparse(url).netloc)
+            }
             
-            for entry in feed.entries[:20]:
-                article = {
-                    'title': entry.get('title', ''),
-                    'content': entry.get('summary', entry.get('description', '')),
-                    'url': entry.get('link', ''),
-                    'author': entry.get('author', ''),
-                    'published_at': None,
-                    'source': feed.feed.get('title', urlparse(url).netloc)
-                }
-                
-                if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                    try:
-                        article['published_at'] = datetime(*entry.published_parsed[:6])
-                    except:
-                        pass
-                
-                articles.append(article)
+            if hasattr(entry, 'published_parsed') and entry.published_parsed:
+                try:
+                    article['published_at'] = datetime(*entry.published_parsed[:6])
+                except:
+                    pass
             
-            return articles
+            articles.append(article)
+        
+        return articles
+    
+    @staticmethod
+    def parse_website(content: bytes, url: str) -> list:
+        """Extract article dicts from a downloaded HTML page."""
+        soup = BeautifulSoup(content, 'html.parser')
+        articles = []
+        
+        article_tags = soup.find_all('article')
+        if not article_tags:
+            article_tags = soup.find_all(['div', 'section'], class_=lambda x: x and any(
+                term in str(x).lower() for term in ['article', 'post', 'news', 'entry']
+            ))
+        
+        for article_tag in article_tags[:10]:
+            title_tag = article_tag.find(['h1', 'h2', 'h3', 'a'])
+            title = title_tag.get_text(strip=True) if title_tag else ''
+            
+            link = ''
+            if title_tag and title_tag.name == 'a':
+                link = title_tag.get('href', '')
+            else:
+                link_tag = article_tag.find('a')
+                if link_tag:
+                    link = link_tag.get('href', '')
+            
+            if link and not link.startswith('http'):
+                parsed = urlparse(url)
+                link = f"{parsed.scheme}://{parsed.netloc}{link}"
+            
+            paragraphs = article_tag.find_all('p')
+            content_text = ' '.join([p.get_text(strip=True) for p in paragraphs[:3]])
+            
+            if title:
+                articles.append({
+                    'title': title,
+                    'content': content_text[:2000],
+                    'url': link,
+                    'author': '',
+                    'published_at': None,
+                    'source': urlparse(url).netloc
+                })
+        
+        return articles
+    
+    @staticmethod
+    def fetch_rss(url: str) -> list:
+        try:
+            from services.parse_pool import ParsePool
+            response = ScraperService.download(url)
+            return ParsePool.parse('rss', response['content'], url)
         except Exception as e:
             logger.error(f"Error fetching RSS {url}: {e}")
             return []
@@ -48,48 +129,9 @@ class ScraperService:
     @staticmethod
     def scrape_website(url: str) -> list:
         try:
-            response = requests.get(url, headers=HEADERS, timeout=30)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            articles = []
-            
-            article_tags = soup.find_all('article')
-            if not article_tags:
-                article_tags = soup.find_all(['div', 'section'], class_=lambda x: x and any(
-                    term in str(x).lower() for term in ['article', 'post', 'news', 'entry']
-                ))
-            
-            for article_tag in article_tags[:10]:
-                title_tag = article_tag.find(['h1', 'h2', 'h3', 'a'])
-                title = title_tag.get_text(strip=True) if title_tag else ''
-                
-                link = ''
-                if title_tag and title_tag.name == 'a':
-                    link = title_tag.get('href', '')
-                else:
-                    link_tag = article_tag.find('a')
-                    if link_tag:
-                        link = link_tag.get('href', '')
-                
-                if link and not link.startswith('http'):
-                    parsed = urlparse(url)
-                    link = f"{parsed.scheme}://{parsed.netloc}{link}"
-                
-                paragraphs = article_tag.find_all('p')
-                content = ' '.join([p.get_text(strip=True) for p in paragraphs[:3]])
-                
-                if title:
-                    articles.append({
-                        'title': title,
-                        'content': content[:2000],
-                        'url': link,
-                        'author': '',
-                        'published_at': None,
-                        'source': urlparse(url).netloc
-                    })
-            
-            return articles
+            from services.parse_pool import ParsePool
+            response = ScraperService.download(url)
+            return ParsePool.parse('website', response['content'], url)
         except Exception as e:
             logger.error(f"Error scraping {url}: {e}")
             return []
@@ -111,7 +153,7 @@ class ScraperService:
             
             for nitter_url in nitter_instances:
                 try:
-                    response = requests.get(nitter_url, headers=HEADERS, timeout=15)
+                    response = HttpClient.get(nitter_url, headers=HEADERS, timeout=15)
                     if response.status_code == 200:
                         soup = BeautifulSoup(response.content, 'html.parser')
                         
@@ -257,7 +299,7 @@ class ScraperService:
             else:
                 # Try to get channel ID from page
                 try:
-                    response = requests.get(url, headers=HEADERS, timeout=15)
+                    response = HttpClient.get(url, headers=HEADERS, timeout=15)
                     if response.status_code == 200:
                         # Look for channel ID in page
                         match = re.search(r'"channelId":"([a-zA-Z0-9_-]+)"', response.text)
@@ -272,7 +314,9 @@ class ScraperService:
                 return []
             
             # Fetch RSS feed
-            feed = feedparser.parse(rss_url)
+            response = HttpClient.get(rss_url, headers=HEADERS, timeout=15)
+            response.raise_for_status()
+            feed = feedparser.parse(response.content, response_headers={'content-location': rss_url})
             
             for entry in feed.entries[:5]:  # Limit to 5 most recent videos
                 video_id = None
@@ -333,7 +377,7 @@ class ScraperService:
             # Get video info from oEmbed
             oembed_url = f"https://www.youtube.com/oembed?url={url}&format=json"
             try:
-                response = requests.get(oembed_url, timeout=10)
+                response = HttpClient.get(oembed_url, timeout=10)
                 if response.status_code == 200:
                     data = response.json()
                     title = data.get('title', 'YouTube Video')
@@ -399,3 +443,49 @@ class ScraperService:
         else:
             logger.warning(f"Unknown source type: {source_type}")
             return []
+    
+    @staticmethod
+    def fetch_source_conditional(source_type: str, url: str, etag: str = None, last_modified: str = None, content_hash: str = None) -> dict:
+        """
+        Fetch a source, skipping parsing when it has not changed since the last fetch.
+        
+        RSS feeds and websites send If-None-Match/If-Modified-Since and compare the
+        body hash; other source types are always fetched in full.
+        
+        Returns:
+            dict: 'articles', 'not_modified' and the new 'etag', 'last_modified', 'content_hash'
+        """
+        if source_type not in ('rss', 'website'):
+            return {
+                'articles': ScraperService.fetch_source(source_type, url),
+                'not_modified': False,
+                'etag': None,
+                'last_modified': None,
+                'content_hash': None
+            }
+        
+        response = ScraperService.download(url, etag, last_modified)
+        
+        if response['not_modified']:
+            return {
+                'articles': [],
+                'not_modified': True,
+                'etag': response['etag'],
+                'last_modified': response['last_modified'],
+                'content_hash': content_hash
+            }
+        
+        new_hash = hashlib.sha256(response['content']).hexdigest()
+        result = {
+            'articles': [],
+            'not_modified': new_hash == content_hash,
+            'etag': response['etag'],
+            'last_modified': response['last_modified'],
+            'content_hash': new_hash
+        }
+        
+        if not result['not_modified']:
+            from services.parse_pool import ParsePool
+            result['articles'] = ParsePool.parse(source_type, response['content'], url)
+        
+        return result
@@ -3,7 +3,7 @@ Improved Scraper Service with incremental fetching for websites, Twitter, and Yo
 Only fetches new content since last fetch, preventing duplicates and unnecessary processing.
 """
 import re
-import requests
+from services.http_client import HttpClient
 from bs4 import BeautifulSoup
 import feedparser
 import logging
@@ -31,7 +31,9 @@ class ImprovedScraperService:
     def fetch_rss(url: str, last_fetched_at=None) -> list:
         """Fetch RSS with optional timestamp filtering."""
         try:
-            feed = feedparser.parse(url)
+            response = HttpClient.get(url, headers=HEADERS, timeout=30)
+            response.raise_for_status()
+            feed = feedparser.parse(response.content, response_headers={'content-location': url})
             articles = []
             
             for entry in feed.entries[:20]:
@@ -69,7 +71,7 @@ class ImprovedScraperService:
         Only returns articles newer than last fetch.
         """
         try:
-            response = requests.get(url, headers=HEADERS, timeout=30)
+            response = HttpClient.get(url, headers=HEADERS, timeout=30)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -172,7 +174,7 @@ class ImprovedScraperService:
             
             for nitter_url in nitter_instances:
                 try:
-                    response = requests.get(nitter_url, headers=HEADERS, timeout=15)
+                    response = HttpClient.get(nitter_url, headers=HEADERS, timeout=15)
                     if response.status_code == 200:
                         soup = BeautifulSoup(response.content, 'html.parser')
                         
@@ -284,7 +286,7 @@ class ImprovedScraperService:
             else:
                 # Try to get channel ID from page
                 try:
-                    response = requests.get(url, headers=HEADERS, timeout=15)
+                    response = HttpClient.get(url, headers=HEADERS, timeout=15)
                     if response.status_code == 200:
                         match = re.search(r'"channelId":"([a-zA-Z0-9_-]+)"', response.text)
                         if match:
@@ -298,7 +300,9 @@ class ImprovedScraperService:
                 return []
             
             # Fetch RSS feed
-            feed = feedparser.parse(rss_url)
+            response = HttpClient.get(rss_url, headers=HEADERS, timeout=15)
+            response.raise_for_status()
+            feed = feedparser.parse(response.content, response_headers={'content-location': rss_url})
             
             for entry in feed.entries[:20]:  # Get more for filtering
                 video_id = None
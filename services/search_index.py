@@ -0,0 +1,182 @@
+"""
+Per-journalist inverted index with BM25 ranking, for subscriber Q&A retrieval.
+
+Articles are tokenized (stopwords removed, accents folded, light stemming, see
+utils.text.search_terms) and their term frequencies stored as ArticleTerm
+postings in the ingestion transaction. A query reads only the postings of its
+terms for one journalist, so ranking the whole archive stays in milliseconds.
+Near-duplicates are not indexed: their cluster representative is.
+
+When the embedding index is enabled (services.embedding_index), top_articles
+fuses the BM25 ranking with the cosine ranking by reciprocal rank, so questions
+worded differently from the articles still find them.
+"""
+import math
+import heapq
+import logging
+from collections import Counter
+from utils.text import search_terms
+
+logger = logging.getLogger(__name__)
+
+def fuse_rankings(rankings, limit, k=60):
+    """Reciprocal rank fusion of (id, score) rankings: ids ordered by the sum of 1 / (k + rank)."""
+    fused = Counter()
+    for ranking in rankings:
+        for rank, (item_id, _) in enumerate(ranking, 1):
+            fused[item_id] += 1.0 / (k + rank)
+    return heapq.nlargest(limit, fused.items(), key=lambda item: item[1])
+
+class SearchIndex:
+    K1 = 1.2
+    B = 0.75
+    # Candidates taken from each ranking before fusion, per requested article
+    FUSION_DEPTH = 3
+    # Characters of content indexed per article
+    MAX_CONTENT_LENGTH = 20000
+    BACKFILL_BATCH = 200
+
+    @classmethod
+    def article_terms(cls, article, language=None) -> Counter:
+        """Term frequencies of an article; title terms count twice."""
+        title_terms = search_terms(article.title or '', language)
+        terms = Counter(title_terms + title_terms)
+        terms.update(search_terms((article.content or '')[:cls.MAX_CONTENT_LENGTH], language))
+        return terms
+
+    @classmethod
+    def add_articles(cls, articles: list, language: str = None):
+        """
+        Index stored articles (ids assigned) of one journalist. Adds the postings to the
+        session; the caller commits with the articles.
+        """
+        from models import db, ArticleTerm
+
+        rows = []
+        for article in articles:
+            terms = cls.article_terms(article, language)
+            length = sum(terms.values())
+            article.index_length = length
+            rows.extend(
+                {
+                    'article_id': article.id,
+                    'term': term,
+                    'journalist_id': article.journalist_id,
+                    'tf': tf,
+                    'doc_length': length
+                }
+                for term, tf in terms.items()
+            )
+        if rows:
+            db.session.bulk_insert_mappings(ArticleTerm, rows)
+
+    @classmethod
+    def backfill(cls) -> int:
+        """Index articles stored before the index existed, batch by batch. Returns the number indexed."""
+        from models import db, Article, Journalist
+
+        total = 0
+        while True:
+            articles = Article.query.filter(
+                Article.index_length.is_(None),
+                Article.representatives()
+            ).order_by(Article.id).limit(cls.BACKFILL_BATCH).all()
+            if not articles:
+                break
+
+            by_journalist = {}
+            for article in articles:
+                by_journalist.setdefault(article.journalist_id, []).append(article)
+            for journalist_id, group in by_journalist.items():
+                journalist = Journalist.query.get(journalist_id)
+                cls.add_articles(group, journalist.language if journalist else None)
+            db.session.commit()
+            total += len(articles)
+
+        if total:
+            logger.info(f"Search index: {total} existing articles indexed")
+        return total
+
+    @classmethod
+    def run_backfill(cls):
+        """Task entry point: backfill inside the app context."""
+        from app import app
+
+        with app.app_context():
+            try:
+                return cls.backfill()
+            except Exception as e:
+                logger.error(f"Error indexing articles: {e}")
+
+    @classmethod
+    def search(cls, journalist_id: int, query: str, language: str = None, limit: int = 10) -> list:
+        """
+        BM25 ranking of a journalist's indexed articles for a free-text query.
+
+        Returns:
+            list: (article_id, score) pairs, best first
+        """
+        from sqlalchemy import func
+        from models import db, Article, ArticleTerm
+
+        terms = set(search_terms(query or '', language))
+        if not terms:
+            return []
+
+        count, average_length = db.session.query(func.count(Article.id), func.avg(Article.index_length)).filter(
+            Article.journalist_id == journalist_id,
+            Article.index_length.isnot(None)
+        ).one()
+        if not count:
+            return []
+        average_length = float(average_length or 1) or 1.0
+
+        postings = db.session.query(
+            ArticleTerm.article_id, ArticleTerm.term, ArticleTerm.tf, ArticleTerm.doc_length
+        ).filter(
+            ArticleTerm.journalist_id == journalist_id,
+            ArticleTerm.term.in_(terms)
+        ).all()
+
+        document_frequency = Counter(term for _, term, _, _ in postings)
+        idf = {
+            term: math.log(1 + (count - df + 0.5) / (df + 0.5))
+            for term, df in document_frequency.items()
+        }
+
+        scores = Counter()
+        for article_id, term, tf, doc_length in postings:
+            norm = cls.K1 * (1 - cls.B + cls.B * doc_length / average_length)
+            scores[article_id] += idf[term] * tf * (cls.K1 + 1) / (tf + norm)
+
+        return heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+
+    @classmethod
+    def top_articles(cls, journalist, query: str, limit: int = 10, query_vector=None) -> list:
+        """
+        Articles most relevant to a subscriber's question, from the journalist's whole
+        archive: BM25, fused with the semantic ranking when embeddings are enabled
+        (query_vector: the question's EmbeddingIndex.embed_query vector, if computed).
+        Without any match, the latest articles (previous behaviour).
+        """
+        from models import Article
+        from services.embedding_index import EmbeddingIndex
+
+        if EmbeddingIndex.enabled():
+            depth = limit * cls.FUSION_DEPTH
+            ranked = fuse_rankings([
+                cls.search(journalist.id, query, journalist.language, depth),
+                EmbeddingIndex.search(journalist.id, query, depth, query_vector)
+            ], limit)
+        else:
+            ranked = cls.search(journalist.id, query, journalist.language, limit)
+
+        if ranked:
+            by_id = {article.id: article for article in Article.query.filter(
+                Article.id.in_([article_id for article_id, _ in ranked])
+            ).all()}
+            return [by_id[article_id] for article_id, _ in ranked if article_id in by_id]
+
+        return Article.query.filter_by(journalist_id=journalist.id).filter(
+            Article.representatives()
+        ).order_by(Article.fetched_at.desc()).limit(limit).all()
@@ -0,0 +1,346 @@
+"""
+Durable DB-backed queue for background work (manual triggers, enrichment).
+
+Tasks are rows of the tasks table, so they survive restarts and are shared by
+every worker and node. A task enqueued with an idempotency key is not queued
+twice while one with the same key is queued or running (the request returns the
+live task instead). Each worker process runs a loop that claims tasks by
+priority, within the per-type concurrency limits of TASK_LIMITS, and renews its
+claims while they run; a task whose claim expired (crashed worker) is requeued
+until it runs out of attempts. Finished tasks are kept TASK_RETENTION_DAYS for
+the tasks API, then purged.
+"""
+import os
+import json
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+logger = logging.getLogger(__name__)
+
+PRIORITY_SCHEDULED = 0
+PRIORITY_MANUAL = 10
+
+# Task type -> tasks of that type running at once, over all workers
+TASK_LIMITS = {
+    'fetch_sources': 1,
+    'generate_summaries': 1,
+    'send_summaries': 1,
+    'enrich_articles': 1,
+    'index_articles': 1,
+}
+
+class TaskQueue:
+    WORKERS = int(os.environ.get('TASK_WORKERS', 4))
+    POLL_SECONDS = float(os.environ.get('TASK_POLL_SECONDS', 2))
+    CLAIM_MINUTES = int(os.environ.get('TASK_CLAIM_MINUTES', 10))
+    RETENTION_DAYS = int(os.environ.get('TASK_RETENTION_DAYS', 7))
+    RETRY_DELAY = 60
+
+    _executor = None
+    _thread = None
+    _stop = threading.Event()
+    _wake = threading.Event()
+    _running = set()
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _handlers():
+        from services.scheduler_service import SchedulerService
+        from services.enrichment_service import EnrichmentService
+        from services.search_index import SearchIndex
+
+        return {
+            'fetch_sources': SchedulerService.fetch_all_sources,
+            'generate_summaries': SchedulerService.generate_summaries,
+            'send_summaries': SchedulerService.send_summaries,
+            'enrich_articles': EnrichmentService.run_pending,
+            'index_articles': SearchIndex.run_backfill,
+        }
+
+    @classmethod
+    def enqueue(cls, task_type: str, payload: dict = None, key: str = None,
+                priority: int = PRIORITY_SCHEDULED, max_attempts: int = 3):
+        """
+        Queue a task, or return the live task with the same idempotency key.
+        A manual request for a task already queued raises its priority.
+        Must run inside an app context.
+
+        Returns:
+            Task
+        """
+        from sqlalchemy.exc import IntegrityError
+        from models import db, Task
+
+        if task_type not in TASK_LIMITS:
+            raise ValueError(f"Unknown task type: {task_type}")
+
+        if key:
+            existing = Task.query.filter_by(active_key=key).first()
+            if existing is not None:
+                return cls._bump(existing, priority)
+
+        task = Task(
+            task_type=task_type,
+            payload=json.dumps(payload or {}),
+            priority=priority,
+            idempotency_key=key,
+            active_key=key,
+            max_attempts=max_attempts
+        )
+        try:
+            db.session.add(task)
+            db.session.commit()
+        except IntegrityError:
+            # Enqueued concurrently by another request or worker
+            db.session.rollback()
+            return cls._bump(Task.query.filter_by(active_key=key).first(), priority)
+
+        logger.info(f"Queued task {task.id} {task_type} (priority {priority})")
+        cls._wake.set()
+        return task
+
+    @classmethod
+    def enqueue_scheduled(cls, task_type: str, key: str = None):
+        """Scheduler entry point: queue a periodic task unless one is already live."""
+        from app import app
+
+        with app.app_context():
+            try:
+                cls.enqueue(task_type, key=key or task_type)
+            except Exception as e:
+                logger.error(f"Could not queue {task_type}: {e}")
+
+    @staticmethod
+    def _bump(task, priority):
+        from models import db
+
+        if task.status == 'queued' and priority > (task.priority or 0):
+            task.priority = priority
+            db.session.commit()
+        return task
+
+    @classmethod
+    def claim(cls):
+        """
+        Claim the highest-priority runnable task whose type is under its limit.
+        The candidate is selected FOR UPDATE SKIP LOCKED (Postgres) and moved to
+        running by a conditional UPDATE, so two workers never claim the same task.
+        The UPDATE also requires its type to be under the limit; on Postgres, claims
+        of a type are serialized by an advisory lock so that count includes
+        concurrent claims (SQLite serializes writes).
+
+        Returns:
+            Task id, or None
+        """
+        from sqlalchemy import func
+        from models import db, Task
+        from services.lease_service import NODE_ID
+
+        now = datetime.utcnow()
+        running = dict(db.session.query(Task.task_type, func.count(Task.id)).filter(
+            Task.status == 'running'
+        ).group_by(Task.task_type).all())
+        available = [task_type for task_type, limit in TASK_LIMITS.items() if running.get(task_type, 0) < limit]
+        if not available:
+            db.session.rollback()
+            return None
+
+        row = db.session.query(Task.id, Task.task_type).filter(
+            Task.status == 'queued',
+            Task.task_type.in_(available),
+            Task.run_after <= now
+        ).order_by(Task.priority.desc(), Task.id).with_for_update(skip_locked=True).first()
+        if row is None:
+            db.session.rollback()
+            return None
+
+        if db.engine.dialect.name == 'postgresql':
+            # Held until commit: the next claimer of this type sees this claim in its count
+            db.session.execute(db.text("SELECT pg_advisory_xact_lock(hashtext(:key))"),
+                               {'key': f"tasks:{row.task_type}"})
+        running_task = db.aliased(Task)
+        running_count = db.session.query(func.count(running_task.id)).filter(
+            running_task.task_type == row.task_type,
+            running_task.status == 'running'
+        ).scalar_subquery()
+
+        claimed = Task.query.filter(
+            Task.id == row.id,
+            Task.status == 'queued',
+            running_count < TASK_LIMITS[row.task_type]
+        ).update({
+            'status': 'running',
+            'claimed_by': NODE_ID,
+            'claimed_until': now + timedelta(minutes=cls.CLAIM_MINUTES),
+            'started_at': now,
+            'attempts': Task.attempts + 1
+        }, synchronize_session=False)
+        db.session.commit()
+        return row.id if claimed else None
+
+    @classmethod
+    def _execute(cls, task_id):
+        """Run a claimed task and store its outcome; always frees this worker's slot."""
+        try:
+            cls._run_task(task_id)
+        except Exception as e:
+            # The claim is no longer renewed: it expires and _renew_and_recover requeues the task
+            logger.error(f"Task {task_id} could not be run or stored: {e}")
+        finally:
+            with cls._lock:
+                cls._running.discard(task_id)
+            cls._wake.set()
+
+    @classmethod
+    def _run_task(cls, task_id):
+        from app import app
+        from models import db, Task
+
+        with app.app_context():
+            task = Task.query.get(task_id)
+            task_type, payload = task.task_type, json.loads(task.payload or '{}')
+
+        try:
+            result = cls._handlers()[task_type](**payload)
+            error = None
+        except Exception as e:
+            result = None
+            error = str(e)
+            logger.error(f"Task {task_id} {task_type} failed: {e}")
+
+        with app.app_context():
+            task = Task.query.get(task_id)
+            task.claimed_by = None
+            task.claimed_until = None
+            if error is None:
+                task.status = 'done'
+                task.result = json.dumps(result, default=str) if result is not None else None
+                task.active_key = None
+                task.finished_at = datetime.utcnow()
+            else:
+                cls._fail(task, error)
+            db.session.commit()
+
+    @classmethod
+    def _fail(cls, task, error):
+        """Requeue a task after a delay, or mark it failed once out of attempts."""
+        task.error = error
+        if (task.attempts or 0) < (task.max_attempts or 1):
+            task.status = 'queued'
+            task.run_after = datetime.utcnow() + timedelta(seconds=cls.RETRY_DELAY * task.attempts)
+        else:
+            task.status = 'failed'
+            task.active_key = None
+            task.finished_at = datetime.utcnow()
+
+    @classmethod
+    def _renew_and_recover(cls):
+        """Extend the claims of this worker's running tasks; requeue tasks of dead workers."""
+        from models import db, Task
+        from services.lease_service import NODE_ID
+
+        now = datetime.utcnow()
+        with cls._lock:
+            running = list(cls._running)
+        if running:
+            Task.query.filter(Task.id.in_(running), Task.claimed_by == NODE_ID).update({
+                'claimed_until': now + timedelta(minutes=cls.CLAIM_MINUTES)
+            }, synchronize_session=False)
+            db.session.commit()
+
+        for task in Task.query.filter(Task.status == 'running', Task.claimed_until < now).all():
+            logger.warning(f"Task {task.id} {task.task_type} abandoned by {task.claimed_by}")
+            task.claimed_by = None
+            task.claimed_until = None
+            cls._fail(task, f"Abandoned by worker (attempt {task.attempts})")
+        db.session.commit()
+
+    @classmethod
+    def _loop(cls):
+        from app import app
+
+        last_renewal = None
+        while not cls._stop.is_set():
+            try:
+                with app.app_context():
+                    now = datetime.utcnow()
+                    if last_renewal is None or (now - last_renewal).total_seconds() >= 30:
+                        cls._renew_and_recover()
+                        last_renewal = now
+
+                    while len(cls._running) < cls.WORKERS:
+                        task_id = cls.claim()
+                        if task_id is None:
+                            break
+                        with cls._lock:
+                            cls._running.add(task_id)
+                        cls._executor.submit(cls._execute, task_id)
+            except Exception as e:
+                logger.error(f"Task queue loop error: {e}")
+
+            cls._wake.wait(cls.POLL_SECONDS)
+            cls._wake.clear()
+
+    @classmethod
+    def start(cls):
+        """Start this process's worker loop."""
+        if cls._thread is not None and cls._thread.is_alive():
+            return
+        cls._stop.clear()
+        cls._executor = ThreadPoolExecutor(max_workers=cls.WORKERS, thread_name_prefix='task')
+        cls._thread = threading.Thread(target=cls._loop, name='task-queue', daemon=True)
+        cls._thread.start()
+        logger.info(f"Task queue started with {cls.WORKERS} workers")
+
+    @classmethod
+    def shutdown(cls):
+        cls._stop.set()
+        cls._wake.set()
+        if cls._executor is not None:
+            cls._executor.shutdown(wait=False)
+
+    @classmethod
+    def purge_finished(cls) -> int:
+        """Delete done and failed tasks finished more than RETENTION_DAYS ago. Returns the number deleted."""
+        from app import app
+        from models import db, Task
+
+        cutoff = datetime.utcnow() - timedelta(days=cls.RETENTION_DAYS)
+        with app.app_context():
+            deleted = Task.query.filter(
+                Task.status.in_(('done', 'failed')),
+                Task.finished_at < cutoff
+            ).delete(synchronize_session=False)
+            db.session.commit()
+        if deleted:
+            logger.info(f"Purged {deleted} finished tasks")
+        return deleted
+
+    @staticmethod
+    def describe(task) -> dict:
+        return {
+            'id': task.id,
+            'task_type': task.task_type,
+            'status': task.status,
+            'priority': task.priority,
+            'idempotency_key': task.idempotency_key,
+            'attempts': task.attempts,
+            'result': task.result,
+            'error': task.error,
+            'created_at': task.created_at.isoformat() if task.created_at else None,
+            'started_at': task.started_at.isoformat() if task.started_at else None,
+            'finished_at': task.finished_at.isoformat() if task.finished_at else None
+        }
+
+    @classmethod
+    def recent(cls, status: str = None, task_type: str = None, limit: int = 50) -> list:
+        from models import Task
+
+        query = Task.query
+        if status:
+            query = query.filter_by(status=status)
+        if task_type:
+            query = query.filter_by(task_type=task_type)
+        return [cls.describe(task) for task in query.order_by(Task.id.desc()).limit(limit).all()]
@@ -2,7 +2,6 @@ import os
 import logging
 import asyncio
 import threading
-import requests
 from datetime import datetime, timedelta
 from telegram import Update, Bot
 from telegram.ext import Application, CommandHandler, MessageHandler, filters, ContextTypes
@@ -211,8 +210,12 @@ Posez-moi n'importe quelle question sur l'actualite !"""
     @classmethod
     async def handle_message(cls, update: Update, context: ContextTypes.DEFAULT_TYPE):
         from app import app
-        from models import db, Journalist, Subscriber, Article
+        from models import db, Journalist, Subscriber
         from services.ai_service import AIService
+        from services.enrichment_service import EnrichmentService
+        from services.search_index import SearchIndex
+        from services.answer_cache import AnswerCache
+        from services.embedding_index import EmbeddingIndex
         
         journalist_id = context.bot_data.get('journalist_id')
         user_id = str(update.effective_user.id)
@@ -246,34 +249,31 @@ Posez-moi n'importe quelle question sur l'actualite !"""
             
             journalist = Journalist.query.get(journalist_id)
             
-            # Search articles by keywords
-            keywords = message.lower().split()
-            articles = Article.query.filter_by(journalist_id=journalist_id).order_by(Article.fetched_at.desc()).limit(100).all()
-            
-            # Filter articles that match keywords
-            relevant_articles = []
-            for article in articles:
-                article_text = f"{article.title} {article.content}".lower()
-                if any(kw in article_text for kw in keywords) or len(relevant_articles) < 10:
-                    relevant_articles.append(article)
-                if len(relevant_articles) >= 20:
-                    break
-            
-            articles_data = [
-                {'title': a.title, 'content': a.content, 'source': a.source.name if a.source else 'Unknown', 'url': a.url}
-                for a in relevant_articles
-            ]
-            
-            response = AIService.answer_question(
-                question=message,
-                articles=articles_data,
-                personality=journalist.personality,
-                writing_style=journalist.writing_style,
-                tone=journalist.tone,
-                language=journalist.language,
-                provider=journalist.ai_provider,
-                model=journalist.ai_model
-            )
+            # Embedded once, for both the semantic ranking and the answer cache lookup
+            query_vector = EmbeddingIndex.embed_query(message)
+            
+            # BM25 and semantic ranking over the journalist's whole archive; latest articles when nothing matches
+            relevant_articles = SearchIndex.top_articles(journalist, message, query_vector=query_vector)
+            
+            def generate():
+                # Stored per-article digests instead of raw content
+                articles_data = EnrichmentService.prompt_articles(relevant_articles, with_url=True)
+                return AIService.answer_question(
+                    question=message,
+                    articles=articles_data,
+                    personality=journalist.personality,
+                    writing_style=journalist.writing_style,
+                    tone=journalist.tone,
+                    language=journalist.language,
+                    provider=journalist.ai_provider,
+                    model=journalist.ai_model,
+                    fallback=False
+                )
+            
+            # Reuses the answer to a near-identical recent question unless new relevant articles came in;
+            # failures are not cached and get the fallback text
+            response = (AnswerCache.answer(journalist, message, relevant_articles, generate, query_vector)
+                        or AIService.fallback_answer(journalist.ai_provider))
             
             await update.message.reply_text(response)
     
@@ -44,8 +44,12 @@ L'admin doit valider votre abonnement avant de pouvoir utiliser les services."""
         """
         try:
             from app import app
-            from models import db, Article
+            from models import db
             from services.ai_service import AIService
+            from services.enrichment_service import EnrichmentService
+            from services.search_index import SearchIndex
+            from services.answer_cache import AnswerCache
+            from services.embedding_index import EmbeddingIndex
             
             with app.app_context():
                 # Update message count and timestamp
@@ -53,34 +57,31 @@ L'admin doit valider votre abonnement avant de pouvoir utiliser les services."""
                 subscriber.last_message_at = datetime.utcnow()
                 db.session.commit()
                 
-                # Search articles by keywords
-                keywords = message.lower().split()
-                articles = Article.query.filter_by(journalist_id=journalist.id).order_by(Article.fetched_at.desc()).limit(100).all()
+                # Embedded once, for both the semantic ranking and the answer cache lookup
+                query_vector = EmbeddingIndex.embed_query(message)
                 
-                # Filter articles matching keywords
-                relevant_articles = []
-                for article in articles:
-                    article_text = f"{article.title} {article.content}".lower()
-                    if any(kw in article_text for kw in keywords) or len(relevant_articles) < 10:
-                        relevant_articles.append(article)
-                    if len(relevant_articles) >= 20:
-                        break
+                # BM25 and semantic ranking over the journalist's whole archive; latest articles when nothing matches
+                relevant_articles = SearchIndex.top_articles(journalist, message, query_vector=query_vector)
                 
-                articles_data = [
-                    {'title': a.title, 'content': a.content, 'source': a.source.name if a.source else 'Unknown', 'url': a.url}
-                    for a in relevant_articles
-                ]
+                def generate():
+                    # Stored per-article digests instead of raw content
+                    articles_data = EnrichmentService.prompt_articles(relevant_articles, with_url=True)
+                    return AIService.answer_question(
+                        question=message,
+                        articles=articles_data,
+                        personality=journalist.personality,
+                        writing_style=journalist.writing_style,
+                        tone=journalist.tone,
+                        language=journalist.language,
+                        provider=journalist.ai_provider,
+                        model=journalist.ai_model,
+                        fallback=False
+                    )
                 
-                response = AIService.answer_question(
-                    question=message,
-                    articles=articles_data,
-                    personality=journalist.personality,
-                    writing_style=journalist.writing_style,
-                    tone=journalist.tone,
-                    language=journalist.language,
-                    provider=journalist.ai_provider,
-                    model=journalist.ai_model
-                )
+                # Reuses the answer to a near-identical recent question unless new relevant articles came in;
+                # failures are not cached and get the fallback text
+                response = (AnswerCache.answer(journalist, message, relevant_articles, generate, query_vector)
+                            or AIService.fallback_answer(journalist.ai_provider))
                 
                 logger.info(f"✓ WhatsApp response sent to subscriber {subscriber.id}")
                 return response
@@ -90,19 +91,21 @@ L'admin doit valider votre abonnement avant de pouvoir utiliser les services."""
             return "❌ Erreur lors du traitement. Veuillez réessayer."
     
     @staticmethod
-    def search_articles_by_date(journalist_id: int, target_date: str):
-        """Search articles by date (format: DD/MM/YYYY or YYYY-MM-DD)
+    def search_articles_by_date(journalist_id: int, target_date: str, query: str = None):
+        """Search articles by date (format: DD/MM/YYYY or YYYY-MM-DD), optionally by keywords
         
         Args:
             journalist_id: Journalist ID
             target_date: Date string
+            query: Optional keywords, best matches first
             
         Returns:
             str: Formatted article list or error message
         """
         try:
             from app import app
-            from models import Article
+            from models import Journalist
+            from services.article_search import ArticleSearch
             from datetime import datetime, timedelta
             
             # Parse date
@@ -115,27 +118,26 @@ L'admin doit valider votre abonnement avant de pouvoir utiliser les services."""
                 return f"❌ Format de date invalide. Utilisez DD/MM/YYYY ou YYYY-MM-DD"
             
             with app.app_context():
-                # Get articles for that day
-                start = date_obj.replace(hour=0, minute=0, second=0)
-                end = date_obj.replace(hour=23, minute=59, second=59)
+                journalist = Journalist.query.get(journalist_id)
+                if not journalist:
+                    return "❌ Journaliste introuvable."
                 
-                articles = Article.query.filter(
-                    Article.journalist_id == journalist_id,
-                    Article.fetched_at >= start,
-                    Article.fetched_at <= end
-                ).order_by(Article.fetched_at.desc()).all()
+                # Ranked and date-filtered in SQL, see services.article_search
+                start = date_obj.replace(hour=0, minute=0, second=0)
+                end = start + timedelta(days=1)
+                total = ArticleSearch.count(journalist, query, start, end)
                 
-                if not articles:
+                if not total:
                     return f"📭 Aucun article trouvé pour le {target_date}"
                 
-                response = f"📰 Articles du {target_date} ({len(articles)} trouvés):\n\n"
-                for i, article in enumerate(articles[:10], 1):
+                response = f"📰 Articles du {target_date} ({total} trouvés):\n\n"
+                for i, (article, _) in enumerate(ArticleSearch.search(journalist, query, start, end, limit=10), 1):
                     response += f"{i}. {article.title}\n"
                     response += f"   Source: {article.source.name if article.source else 'Unknown'}\n"
                     response += f"   Heure: {article.fetched_at.strftime('%H:%M')}\n\n"
                 
-                if len(articles) > 10:
-                    response += f"... et {len(articles) - 10} autres articles"
+                if total > 10:
+                    response += f"... et {total - 10} autres articles"
                 
                 return response
                 
@@ -0,0 +1,67 @@
+"""
+Exactly-once check of the per-journalist scheduler on DST transition days.
+
+Runs benchmarks/scheduler_simulation.py on a few journalists whose times fall in
+the skipped (spring forward) and repeated (fall back) local hours, and fails if
+any stage of any journalist-day ran zero or several times.
+"""
+import os
+import sys
+from datetime import datetime
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks'))
+
+# Imported first: points DATABASE_URL at a throwaway SQLite file before app is imported
+import scheduler_simulation as simulation  # noqa: E402
+from models import db, Journalist  # noqa: E402
+from services.pipeline_service import PipelineService  # noqa: E402
+from services.scheduler_service import SchedulerService, scheduler  # noqa: E402
+
+TIMEZONES = ('Europe/Paris', 'America/New_York', 'Asia/Tokyo')
+# (fetch, summary, send): nonexistent and repeated local times, summary and send in the same minute
+TIMES = (
+    ('02:30', '01:30', '02:00'),
+    ('01:30', '07:45', '07:45'),
+    ('23:50', '00:10', '08:00'),
+)
+
+@pytest.fixture(scope='module')
+def journalists():
+    with simulation.app.app_context():
+        created = [
+            Journalist(name=f"Simulated {tz_name} {fetch_time}", timezone=tz_name, fetch_time=fetch_time,
+                       summary_time=summary_time, send_time=send_time, is_active=True)
+            for tz_name in TIMEZONES
+            for fetch_time, summary_time, send_time in TIMES
+        ]
+        db.session.add_all(created)
+        db.session.commit()
+        for journalist in created:
+            SchedulerService.schedule_journalist(journalist, replan=False)
+        db.session.expunge_all()
+
+    yield created
+
+    scheduler.remove_all_jobs()
+    with simulation.app.app_context():
+        Journalist.query.filter(Journalist.id.in_([journalist.id for journalist in created])).delete()
+        db.session.commit()
+
+@pytest.mark.parametrize('date, downtime', [
+    ('2026-03-08', None),           # America spring forward
+    ('2026-03-29', None),           # Europe spring forward
+    ('2026-10-25', '00:30-01:30'),  # Europe fall back, scheduler down over the change
+    ('2026-11-01', None),           # America fall back
+])
+def test_each_stage_runs_exactly_once(journalists, monkeypatch, date, downtime):
+    # simulate() swaps in its clock and gate recorder; restored after the test
+    monkeypatch.setattr(SchedulerService, 'clock', SchedulerService.clock)
+    monkeypatch.setattr(PipelineService, 'open_gate', PipelineService.open_gate)
+
+    start = datetime.strptime(date, '%Y-%m-%d')
+    executions, stats, _cpu, _catch_up_cpu = simulation.simulate(start, 1, simulation.parse_downtime(downtime, start))
+
+    assert simulation.check(journalists, executions, start, 1) == []
+    assert stats['claimed'] > 0
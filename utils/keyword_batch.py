@@ -0,0 +1,119 @@
+"""
+Batched keyword extraction helpers shared by the LLM providers.
+Several articles are packed into one prompt whose JSON answer is keyed by
+article id; items missing from the answer are retried one by one.
+"""
+import re
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Rough size of a token for French and English text
+CHARS_PER_TOKEN = 4
+MAX_INPUT_TOKENS = 6000
+MAX_ITEMS_PER_BATCH = 20
+ITEM_TEXT_LENGTH = 1200
+# Expected answer size per article, used to size max_tokens
+OUTPUT_TOKENS_PER_ITEM = 40
+
+PROMPT_HEADER = """Extrais les mots-clés principaux de chacun des articles suivants.
+Réponds uniquement avec un objet JSON dont les clés sont les identifiants des articles
+et les valeurs des listes de 5 à 10 mots-clés, par exemple {"12": ["mot-clé", "autre"]}.
+
+"""
+
+JSON_OBJECT_RE = re.compile(r'\{.*\}', re.DOTALL)
+
+def estimate_tokens(text):
+    """Approximate token count without a tokenizer."""
+    return len(text) // CHARS_PER_TOKEN + 1
+
+def format_item(item_id, text):
+    return f"### Article {item_id}\n{' '.join(text.split())[:ITEM_TEXT_LENGTH]}\n\n"
+
+def pack_batches(items, max_input_tokens=MAX_INPUT_TOKENS, max_items=MAX_ITEMS_PER_BATCH):
+    """
+    Split (id, text) pairs into batches that fit the input token budget.
+    An item larger than the budget still gets a batch of its own.
+    """
+    budget = max_input_tokens - estimate_tokens(PROMPT_HEADER)
+    batches = []
+    current, used = [], 0
+    for item_id, text in items:
+        cost = estimate_tokens(format_item(item_id, text))
+        if current and (used + cost > budget or len(current) >= max_items):
+            batches.append(current)
+            current, used = [], 0
+        current.append((item_id, text))
+        used += cost
+    if current:
+        batches.append(current)
+    return batches
+
+def build_prompt(batch):
+    return PROMPT_HEADER + ''.join(format_item(item_id, text) for item_id, text in batch) + "JSON:"
+
+def max_output_tokens(batch):
+    return max(200, OUTPUT_TOKENS_PER_ITEM * len(batch))
+
+def parse_response(response, ids):
+    """
+    Read the JSON answer of a batch prompt.
+
+    Returns:
+        dict: id -> keyword list, only for ids with a usable answer
+    """
+    if not response:
+        return {}
+    # Models sometimes wrap JSON in prose or a code fence
+    match = JSON_OBJECT_RE.search(response)
+    if not match:
+        return {}
+    try:
+        data = json.loads(match.group(0))
+    except ValueError:
+        return {}
+    if not isinstance(data, dict):
+        return {}
+
+    parsed = {}
+    for item_id in ids:
+        value = data.get(str(item_id))
+        if isinstance(value, str):
+            value = value.split(',')
+        if not isinstance(value, list):
+            continue
+        keywords = [str(kw).strip() for kw in value if str(kw).strip()]
+        if keywords:
+            parsed[item_id] = keywords
+    return parsed
+
+def extract_batch(items, call, extract_single):
+    """
+    Run batched keyword extraction.
+
+    Args:
+        items: list of (id, text) pairs
+        call: function(prompt, max_tokens) -> str, one request to the provider
+        extract_single: function(text) -> list, used for items missing from a batch answer
+
+    Returns:
+        dict: id -> keyword list (empty list when even the single call fails)
+    """
+    results = {}
+    for batch in pack_batches(items):
+        ids = [item_id for item_id, _ in batch]
+        try:
+            parsed = parse_response(call(build_prompt(batch), max_output_tokens(batch)), ids)
+        except Exception as e:
+            logger.error(f"Batch keyword extraction failed: {e}")
+            parsed = {}
+        results.update(parsed)
+
+        missing = [(item_id, text) for item_id, text in batch if item_id not in parsed]
+        if missing:
+            logger.info(f"Keyword batch: {len(parsed)}/{len(batch)} parsed, {len(missing)} retried individually")
+        for item_id, text in missing:
+            results[item_id] = extract_single(text)
+    return results
@@ -0,0 +1,34 @@
+"""
+MinHash signatures to estimate the Jaccard similarity of short texts (questions).
+Features are the search terms of the text (utils.text.search_terms) and their
+bigrams, so word order and inflections matter little.
+"""
+import random
+import hashlib
+from utils.text import search_terms
+
+NUM_PERM = 64
+PRIME = (1 << 61) - 1
+# Fixed seed: signatures are comparable across processes
+_rng = random.Random(20240601)
+PERMUTATIONS = [(_rng.randrange(1, PRIME), _rng.randrange(0, PRIME)) for _ in range(NUM_PERM)]
+
+def _feature_hash(feature):
+    return int.from_bytes(hashlib.blake2b(feature.encode('utf-8'), digest_size=8).digest(), 'big')
+
+def features(text, language=None):
+    terms = search_terms(text or '', language)
+    return set(terms) | {f"{a} {b}" for a, b in zip(terms, terms[1:])}
+
+def signature(text, language=None):
+    """MinHash signature of a text, or None when it has no content words."""
+    hashes = [_feature_hash(feature) for feature in features(text, language)]
+    if not hashes:
+        return None
+    return tuple(min((a * value + b) % PRIME for value in hashes) for a, b in PERMUTATIONS)
+
+def similarity(a, b):
+    """Estimated Jaccard similarity of the feature sets behind two signatures."""
+    if a is None or b is None:
+        return 0.0
+    return sum(1 for x, y in zip(a, b) if x == y) / NUM_PERM
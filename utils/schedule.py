@@ -0,0 +1,101 @@
+"""
+Time helpers for journalist schedules ("HH:MM" strings in a named timezone).
+"""
+from functools import lru_cache
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+DEFAULT_TIMEZONE = 'Europe/Paris'
+
+# Stage -> (journalist attribute, default hour)
+STAGE_TIMES = {
+    'fetch': ('fetch_time', 2),
+    'summary': ('summary_time', 8),
+    'send': ('send_time', 8),
+}
+
+@lru_cache(maxsize=None)
+def get_timezone(name):
+    """ZoneInfo for a timezone name, falling back to Europe/Paris for unknown names."""
+    try:
+        return ZoneInfo(name or DEFAULT_TIMEZONE)
+    except Exception:
+        return ZoneInfo(DEFAULT_TIMEZONE)
+
+def parse_time(value, default_hour=0):
+    """(hour, minute) from an "HH:MM" string; a bare "HH" means minute 0."""
+    if not value:
+        return default_hour, 0
+    try:
+        parts = value.split(':')
+        hour = int(parts[0])
+        minute = int(parts[1]) if len(parts) > 1 else 0
+    except ValueError:
+        return default_hour, 0
+    if not (0 <= hour < 24 and 0 <= minute < 60):
+        return default_hour, 0
+    return hour, minute
+
+def stage_time(journalist, stage):
+    """(hour, minute) at which a journalist's stage runs, in the journalist's timezone."""
+    attribute, default_hour = STAGE_TIMES[stage]
+    return parse_time(getattr(journalist, attribute), default_hour)
+
+def scheduled_time(journalist, stage):
+    """
+    (hour, minute) at which a stage's trigger fires: the configured time, or the
+    earlier time planned back from send_time when the configured one leaves too
+    little room to deliver on time (see DeliveryPlanner).
+    """
+    planned = getattr(journalist, f"planned_{stage}_time", None)
+    if planned:
+        return parse_time(planned, STAGE_TIMES[stage][1])
+    return stage_time(journalist, stage)
+
+def last_slot(journalist, stage, now=None):
+    """
+    Most recent scheduled time of a stage at or before now, as naive UTC.
+    The slot is computed on the local calendar, so it follows DST changes; a time
+    repeated when clocks go back is its first occurrence, a time skipped when they
+    go forward is taken with the offset before the change.
+    """
+    tz = get_timezone(journalist.timezone)
+    now = now or datetime.utcnow()
+    local_date = now.replace(tzinfo=timezone.utc).astimezone(tz).date()
+
+    slot = slot_on(journalist, stage, local_date)
+    if slot > now:
+        slot = slot_on(journalist, stage, local_date - timedelta(days=1))
+    return slot
+
+def due_slot(journalist, stage, last_scheduled_for, now=None, min_age=0):
+    """
+    Latest slot of a stage (naive UTC) that has not completed yet, or None.
+    Slots younger than min_age seconds are left to their own cron trigger.
+    """
+    now = now or datetime.utcnow()
+    slot = last_slot(journalist, stage, now)
+    if last_scheduled_for is not None and last_scheduled_for >= slot:
+        return None
+    if (now - slot).total_seconds() < min_age:
+        return None
+    return slot
+
+def slot_on(journalist, stage, local_date):
+    """UTC time (naive) of a stage on a given local calendar date."""
+    tz = get_timezone(journalist.timezone)
+    hour, minute = scheduled_time(journalist, stage)
+    slot = datetime(local_date.year, local_date.month, local_date.day, hour, minute, tzinfo=tz)
+    return slot.astimezone(timezone.utc).replace(tzinfo=None)
+
+def run_date(journalist, stage, slot):
+    """
+    Local date of the daily pipeline a stage slot (naive UTC) belongs to.
+    A pipeline is named after the day it is sent; a stage scheduled later in the
+    day than send_time (e.g. a 23:00 fetch for an 08:00 send) feeds the next day.
+    """
+    tz = get_timezone(journalist.timezone)
+    local = slot.replace(tzinfo=timezone.utc).astimezone(tz)
+    if scheduled_time(journalist, stage) > scheduled_time(journalist, 'send'):
+        return (local + timedelta(days=1)).date()
+    return local.date()
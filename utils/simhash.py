@@ -0,0 +1,87 @@
+"""
+SimHash fingerprints for near-duplicate article detection.
+Two texts whose 64-bit fingerprints differ in only a few bits share most of
+their word shingles, e.g. the same wire story republished by several sources.
+"""
+import hashlib
+from utils.text import tokenize, STOPWORDS
+
+BITS = 64
+# 4 bands of 16 bits: two fingerprints within 3 bits of each other share at least one band
+BANDS = 4
+BAND_BITS = BITS // BANDS
+BAND_MASK = (1 << BAND_BITS) - 1
+SHINGLE_SIZE = 2
+
+def _feature_hash(feature):
+    return int.from_bytes(hashlib.blake2b(feature.encode('utf-8'), digest_size=8).digest(), 'big')
+
+def simhash(text):
+    """64-bit SimHash of the word bigrams of a text, or None when it has no content words."""
+    tokens = tokenize(text, STOPWORDS)
+    if not tokens:
+        return None
+    if len(tokens) < SHINGLE_SIZE:
+        features = tokens
+    else:
+        features = [' '.join(tokens[i:i + SHINGLE_SIZE]) for i in range(len(tokens) - SHINGLE_SIZE + 1)]
+
+    weights = [0] * BITS
+    for feature in features:
+        value = _feature_hash(feature)
+        for bit in range(BITS):
+            weights[bit] += 1 if value >> bit & 1 else -1
+
+    fingerprint = 0
+    for bit in range(BITS):
+        if weights[bit] > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+def hamming(a, b):
+    return bin(a ^ b).count('1')
+
+def to_hex(fingerprint):
+    return None if fingerprint is None else f"{fingerprint:016x}"
+
+def from_hex(value):
+    return None if not value else int(value, 16)
+
+def bands(fingerprint):
+    """(band index, band value) keys used to bucket a fingerprint."""
+    return [(i, fingerprint >> (i * BAND_BITS) & BAND_MASK) for i in range(BANDS)]
+
+class SimHashIndex:
+    """In-memory LSH index: candidates share a band, then are checked by Hamming distance."""
+
+    def __init__(self, max_distance=3):
+        self.max_distance = max_distance
+        self.buckets = {}
+        self.fingerprints = {}
+
+    def add(self, key, fingerprint):
+        self.fingerprints[key] = fingerprint
+        for band in bands(fingerprint):
+            self.buckets.setdefault(band, set()).add(key)
+
+    def remove(self, key):
+        fingerprint = self.fingerprints.pop(key, None)
+        if fingerprint is None:
+            return
+        for band in bands(fingerprint):
+            self.buckets.get(band, set()).discard(key)
+
+    def find(self, fingerprint):
+        """Key of the closest indexed fingerprint within max_distance, or None."""
+        best, best_distance = None, self.max_distance + 1
+        candidates = set()
+        for band in bands(fingerprint):
+            candidates |= self.buckets.get(band, set())
+        for key in candidates:
+            distance = hamming(fingerprint, self.fingerprints[key])
+            if distance < best_distance:
+                best, best_distance = key, distance
+        return best
+
+    def __len__(self):
+        return len(self.fingerprints)
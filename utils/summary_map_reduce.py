@@ -0,0 +1,123 @@
+"""
+Map-reduce condensation of large article sets, shared by the LLM providers.
+
+A summary prompt used to hold every article of the last 24h; with hundreds of
+articles it became slow, expensive or rejected. When the articles exceed the
+chunk token budget, they are packed into chunks under that budget, each chunk is
+condensed into sourced key points in parallel (map), and the provider's summary
+prompt runs on the key points (reduce). Key points that still exceed the budget
+are condensed again. Small sets keep the direct single-prompt path.
+"""
+import os
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from utils.keyword_batch import estimate_tokens, CHARS_PER_TOKEN
+
+logger = logging.getLogger(__name__)
+
+ARTICLE_TEXT_LENGTH = 1000
+# Input tokens per map prompt, and per reduce input; capped by half the model context
+CHUNK_TOKENS = int(os.environ.get('SUMMARY_CHUNK_TOKENS', 8000))
+MAP_WORKERS = int(os.environ.get('SUMMARY_MAP_WORKERS', 4))
+MAP_OUTPUT_TOKENS = 800
+MAX_POINTS_PER_CHUNK = 12
+# Condensation rounds before giving up and truncating
+MAX_ROUNDS = 3
+
+# Input context of the models each provider uses, in tokens
+CONTEXT_TOKENS = {
+    'gemini': 1000000,
+    'openai': 128000,
+    'openrouter': 32000,
+    'perplexity': 127000,
+}
+
+# Journalist language codes (journalist form), named in the French map prompt
+LANGUAGE_NAMES = {
+    'fr': 'français',
+    'en': 'anglais',
+    'es': 'espagnol',
+    'de': 'allemand',
+}
+
+MAP_PROMPT = """Tu prépares la synthèse d'une revue de presse en {language}.
+Extrais des textes suivants les faits essentiels sous forme de points concis,
+un point par ligne, {max_points} points au plus. Regroupe les faits qui traitent du même sujet.
+Chaque point se termine par sa ou ses sources entre crochets [Nom Source].
+Pas d'introduction ni de conclusion.
+
+{blocks}
+
+Points clés:"""
+
+def format_article(article):
+    return (f"Source: {article.get('source', 'Unknown')}\nTitre: {article.get('title', 'Sans titre')}\n"
+            f"Contenu: {(article.get('content') or '')[:ARTICLE_TEXT_LENGTH]}")
+
+def chunk_budget(provider):
+    return min(CHUNK_TOKENS, CONTEXT_TOKENS.get(provider, CONTEXT_TOKENS['openrouter']) // 2)
+
+def pack_chunks(blocks, budget):
+    """Split text blocks into chunks under the token budget; an oversized block gets its own chunk."""
+    budget -= estimate_tokens(MAP_PROMPT)
+    chunks = []
+    current, used = [], 0
+    for block in blocks:
+        cost = estimate_tokens(block) + 1
+        if current and used + cost > budget:
+            chunks.append(current)
+            current, used = [], 0
+        current.append(block)
+        used += cost
+    if current:
+        chunks.append(current)
+    return chunks
+
+def language_name(language):
+    """French name of a language code; unknown values are passed through."""
+    return LANGUAGE_NAMES.get((language or 'fr').lower(), language)
+
+def _condense_chunk(chunk, call, language):
+    prompt = MAP_PROMPT.format(language=language_name(language), max_points=MAX_POINTS_PER_CHUNK, blocks='\n\n'.join(chunk))
+    try:
+        notes = call(prompt, MAP_OUTPUT_TOKENS)
+    except Exception as e:
+        logger.error(f"Summary chunk failed: {e}")
+        notes = None
+    if notes and notes.strip():
+        return notes.strip()
+    # Keep the chunk's headlines (or the start of its key points) rather than dropping it
+    titles = [f"• {line[len('Titre: '):]}" for block in chunk
+              for line in block.split('\n') if line.startswith('Titre: ')]
+    return '\n'.join(titles) or '\n'.join(block[:300] for block in chunk)
+
+def condense(articles, call, language="fr", provider="gemini"):
+    """
+    Text of the articles to put in a summary prompt.
+
+    Args:
+        articles: list of {'title', 'content', 'source'} dicts
+        call: function(prompt, max_tokens) -> str, one request to the provider
+        language: language of the key points
+        provider: provider name, for its context size
+
+    Returns:
+        str: the articles themselves when they fit the budget, else their key points
+    """
+    budget = chunk_budget(provider)
+    blocks = [format_article(article) for article in articles]
+    text = '\n\n'.join(blocks)
+    if estimate_tokens(text) <= budget:
+        return text
+
+    for round_number in range(1, MAX_ROUNDS + 1):
+        chunks = pack_chunks(blocks, budget)
+        with ThreadPoolExecutor(max_workers=max(1, min(MAP_WORKERS, len(chunks)))) as executor:
+            blocks = list(executor.map(lambda chunk: _condense_chunk(chunk, call, language), chunks))
+        text = '\n\n'.join(blocks)
+        logger.info(f"Summary map round {round_number}: {len(articles)} articles, {len(chunks)} chunks, "
+                    f"~{estimate_tokens(text)} tokens of key points")
+        if estimate_tokens(text) <= budget or len(chunks) == 1:
+            break
+
+    return text[:budget * CHARS_PER_TOKEN]
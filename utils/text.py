@@ -0,0 +1,102 @@
+import re
+import html
+import unicodedata
+
+STOPWORDS_FR = set("""
+a à afin ai aie aient aies ait alors après as assez au aucun aucune aujourd aujourd'hui auprès aura aurai
+auraient aurais aurait auras aurez auriez aurions aurons auront aussi autre autres aux avaient avais avait
+avant avec avez aviez avions avoir avons ayant ayez ayons bon c ça car ce ceci cela celle celles celui cependant
+certain certaines certains ces cet cette ceux chaque chez ci comme comment contre d dans de depuis des deux
+devant doit donc dont du elle elles en encore entre es est et étaient étais était étant été être eu eue eues
+eurent eus eut eux faire fait fois font furent fut grand hors ici il ils j je jusqu jusque l la là le les leur
+leurs lors lorsque lui m ma mais me même mêmes mes moi moins mon n ne ni nos notre nous on ont or ou où par
+parce pas peu peut peuvent plus pour pourquoi puis qu quand que quel quelle quelles quels qui quoi s sa sans
+se selon ses seulement si sien son sont sous souvent soyez sur t ta tandis te tes toi ton tous tout toute
+toutes très tu un une uns vers via voici voilà vos votre vous y été selon aussi ainsi déjà afin entre après
+dit dire également hier demain lundi mardi mercredi jeudi vendredi samedi dimanche cet cette plus moins
+""".split())
+
+STOPWORDS_EN = set("""
+a about above after again against all am an and any are aren't as at be because been before being below
+between both but by can can't cannot could couldn't did didn't do does doesn't doing don't down during each
+few for from further had hadn't has hasn't have haven't having he he'd he'll he's her here here's hers herself
+him himself his how how's i i'd i'll i'm i've if in into is isn't it it's its itself let's me more most
+mustn't my myself no nor not of off on once only or other ought our ours ourselves out over own same shan't
+she she'd she'll she's should shouldn't so some such than that that's the their theirs them themselves then
+there there's these they they'd they'll they're they've this those through to too under until up very was
+wasn't we we'd we'll we're we've were weren't what what's when when's where where's which while who who's
+whom why why's will with won't would wouldn't you you'd you'll you're you've your yours yourself yourselves
+also just said says new one two may like get got would could us via mr mrs ms today yesterday tomorrow
+monday tuesday wednesday thursday friday saturday sunday
+""".split())
+
+STOPWORDS = STOPWORDS_FR | STOPWORDS_EN
+
+TAG_RE = re.compile(r'<[^>]+>')
+SENTENCE_RE = re.compile(r'(?<=[.!?…])\s+(?=[A-ZÀ-ÖØ-Þ0-9«"“])')
+WORD_RE = re.compile(r"[^\W\d_](?:[^\W_]|['’-][^\W\d_])*", re.UNICODE)
+# Elided articles and pronouns: l'état -> état, qu'il -> il
+ELISION_RE = re.compile(r"^(?:[cdjlmnst]|qu|jusqu|lorsqu|puisqu)['’]", re.IGNORECASE)
+
+def get_stopwords(language=None):
+    """Stopwords for a journalist language; unknown languages get both lists."""
+    if language == 'fr':
+        return STOPWORDS_FR
+    if language == 'en':
+        return STOPWORDS_EN
+    return STOPWORDS
+
+def strip_html(text):
+    """Remove tags and decode entities from scraped content."""
+    if not text:
+        return ''
+    return html.unescape(TAG_RE.sub(' ', text))
+
+def split_sentences(text):
+    """Split plain text into sentences on terminal punctuation."""
+    text = ' '.join(strip_html(text).split())
+    return [sentence for sentence in SENTENCE_RE.split(text) if sentence]
+
+def tokenize(text, stopwords=None, min_length=2):
+    """Lowercase word tokens with elisions removed and stopwords filtered."""
+    tokens = []
+    for match in WORD_RE.finditer(strip_html(text).lower()):
+        word = ELISION_RE.sub('', match.group(0))
+        if len(word) < min_length:
+            continue
+        if stopwords and word in stopwords:
+            continue
+        tokens.append(word)
+    return tokens
+
+def fold_accents(word):
+    """état -> etat, so queries typed without accents still match."""
+    return ''.join(c for c in unicodedata.normalize('NFKD', word) if not unicodedata.combining(c))
+
+def light_stem(word, language=None):
+    """
+    Conservative suffix stripping (plurals, feminine, common verb endings) for
+    search terms; unknown languages get both the French and English rules.
+    Expects a lowercase, accent-folded word.
+    """
+    if language != 'fr':
+        if len(word) > 4 and word.endswith('ies'):
+            word = word[:-3] + 'y'
+        elif word.endswith('sses'):
+            word = word[:-2]
+        elif len(word) > 5 and word.endswith('ing'):
+            word = word[:-3]
+        elif len(word) > 4 and word.endswith('ed'):
+            word = word[:-2]
+    if language != 'en' and len(word) > 5 and word.endswith('aux'):
+        word = word[:-3] + 'al'
+    if len(word) > 3 and word[-1] in 'sx' and not word.endswith(('ss', 'us', 'is')):
+        word = word[:-1]
+    if language != 'en' and len(word) > 4 and word.endswith('e'):
+        word = word[:-1]
+    return word
+
+def search_terms(text, language=None):
+    """Tokens of a text for the search index: stopwords removed, accents folded, stemmed."""
+    return [light_stem(fold_accents(token), language)[:64] for token in tokenize(text, get_stopwords(language))]
+
@@ -0,0 +1,57 @@
+import hashlib
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+# Query parameters that only track the visitor and never change the page
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'yclid', 'igshid', 'mc_cid', 'mc_eid',
+    '_ga', '_gl', 'ref_src', 'cmpid', 'xtor', 'at_medium', 'at_campaign',
+}
+TRACKING_PREFIXES = ('utm_',)
+
+def normalize_url(url):
+    """Normalize a URL so equivalent spellings compare equal.
+
+    Lowercases the scheme and host, drops default ports, fragments and
+    trailing slashes. Values without a scheme (e.g. Twitter handles) are
+    only stripped and lowercased.
+    """
+    if not url:
+        return ''
+    url = url.strip()
+
+    parts = urlsplit(url)
+    if not parts.scheme or not parts.netloc:
+        return url.lower()
+
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+
+    path = parts.path.rstrip('/') or '/'
+    return urlunsplit((scheme, host, path, parts.query, ''))
+
+def canonicalize_url(url):
+    """Canonical form of an article URL, used for deduplication.
+
+    Applies normalize_url, then removes tracking parameters and sorts the
+    remaining query parameters.
+    """
+    url = normalize_url(url)
+    parts = urlsplit(url)
+    if not parts.scheme:
+        return url
+
+    params = [
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    ]
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(sorted(params)), ''))
+
+def url_hash(url):
+    """SHA-256 hex digest of the canonical URL, or None for an empty URL."""
+    if not url:
+        return None
+    return hashlib.sha256(canonicalize_url(url).encode('utf-8')).hexdigest()